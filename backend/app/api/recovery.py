@@ -1,10 +1,14 @@
-from datetime import date
+import json
+from datetime import date, datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.database import get_db_session
-from app.services.recovery_engine_v0 import compute_recovery_v0
+from app.metrics import StageTimings, timed_stage
+from app.services.data_version import read_data_version
+from app.services.fatigue_state import compute_recovery_from_state
+from app.services.recovery_engine_v0 import DEFAULT_WINDOW_DAYS, compute_recovery_series, compute_recovery_v0
 
 router = APIRouter(prefix="/recovery")
 
@@ -13,16 +17,114 @@ def _get_db(request: Request):
     yield from get_db_session(request.app.state.session_factory)
 
 
+def _record_timings(request: Request, response: Response, endpoint: str, timings) -> None:
+    if timings is None:
+        return
+    request.app.state.metrics.observe_timings(endpoint, timings)
+    response.headers["Server-Timing"] = timings.server_timing()
+
+
 @router.get("")
 def get_recovery(
+    request: Request,
+    response: Response,
+    days: int = Query(default=None, ge=1, le=30),
+    from_date: date = Query(default=None, alias="from"),
+    to_date: date = Query(default=None, alias="to"),
+    source: str = Query(default="window", pattern="^(window|state)$"),
+    db: Session = Depends(_get_db),
+) -> dict:
+    if source == "state" and (days is not None or from_date is not None):
+        # The state covers all history; it cannot answer a bounded window.
+        raise HTTPException(status_code=400, detail="state_source_has_no_window")
+    days = days or DEFAULT_WINDOW_DAYS
+    timings = StageTimings() if request.app.state.metrics is not None else None
+    cache = request.app.state.recovery_cache
+    cache_key = None
+    if cache is not None:
+        with timed_stage(timings, "cache_lookup"):
+            # Windows ending "now" drift with the clock; the TTL bounds how stale they can get.
+            cache_key = (
+                source,
+                days,
+                from_date.isoformat() if from_date else None,
+                to_date.isoformat() if to_date else None,
+                read_data_version(db),
+            )
+            cached = cache.get(cache_key)
+        if cached is not None:
+            _record_timings(request, response, "recovery", timings)
+            return cached
+
+    if source == "state":
+        with timed_stage(timings, "state_read"):
+            try:
+                result = compute_recovery_from_state(db, to_dt=to_date)
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc))
+    else:
+        result = compute_recovery_v0(
+            db,
+            from_dt=from_date,
+            to_dt=to_date,
+            days=days,
+            use_numpy=request.app.state.recovery_use_numpy,
+            use_rollup=request.app.state.recovery_use_rollup,
+            timings=timings,
+        )
+
+    if cache is not None:
+        cache.put(cache_key, result, len(json.dumps(result, ensure_ascii=False).encode("utf-8")))
+    _record_timings(request, response, "recovery", timings)
+    return result
+
+
+@router.get("/series")
+def get_recovery_series(
+    request: Request,
+    response: Response,
     days: int = Query(default=7, ge=1, le=30),
+    step_days: int = Query(default=1, ge=1, le=30),
     from_date: date = Query(default=None, alias="from"),
     to_date: date = Query(default=None, alias="to"),
     db: Session = Depends(_get_db),
 ) -> dict:
-    return compute_recovery_v0(
-        db,
-        from_dt=from_date,
-        to_dt=to_date,
-        days=days,
-    )
+    # The engine works in UTC; a local date.today() shifts the window by a day near midnight.
+    to_date = to_date or datetime.now(timezone.utc).date()
+    from_date = from_date or (to_date - timedelta(days=29))
+    timings = StageTimings() if request.app.state.metrics is not None else None
+    cache = request.app.state.recovery_cache
+    cache_key = None
+    if cache is not None:
+        with timed_stage(timings, "cache_lookup"):
+            cache_key = ("series", days, step_days, from_date.isoformat(), to_date.isoformat(), read_data_version(db))
+            cached = cache.get(cache_key)
+        if cached is not None:
+            _record_timings(request, response, "recovery_series", timings)
+            return cached
+
+    try:
+        result = compute_recovery_series(
+            db,
+            from_date=from_date,
+            to_date=to_date,
+            step_days=step_days,
+            days=days,
+            use_rollup=request.app.state.recovery_use_rollup,
+            timings=timings,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    if cache is not None:
+        cache.put(cache_key, result, len(json.dumps(result, ensure_ascii=False).encode("utf-8")))
+    _record_timings(request, response, "recovery_series", timings)
+    return result
+
+
+@router.get("/cache/stats")
+def get_recovery_cache_stats(request: Request) -> dict:
+    cache = request.app.state.recovery_cache
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
@@ -1,6 +1,7 @@
 import uuid
+from collections import defaultdict
 from datetime import date
-from typing import List
+from typing import Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy import desc, select
@@ -43,21 +44,31 @@ def get_session_detail(session_id: uuid.UUID, db: Session = Depends(_get_db)) ->
     exercise_rows = (
         db.execute(select(Exercise).where(Exercise.session_id == session_row.id).order_by(Exercise.order_index)).scalars().all()
     )
-    exercises: List[SessionExerciseOut] = []
-    for exercise in exercise_rows:
+    # Load every set of the session in one query and group in memory instead of querying per exercise.
+    set_rows_by_exercise_id: Dict[uuid.UUID, List[ExerciseSet]] = defaultdict(list)
+    if exercise_rows:
         set_rows = (
-            db.execute(select(ExerciseSet).where(ExerciseSet.exercise_id == exercise.id).order_by(ExerciseSet.set_index))
+            db.execute(
+                select(ExerciseSet)
+                .join(Exercise, Exercise.id == ExerciseSet.exercise_id)
+                .where(Exercise.session_id == session_row.id)
+                .order_by(ExerciseSet.exercise_id, ExerciseSet.set_index)
+            )
             .scalars()
             .all()
         )
-        exercises.append(
-            SessionExerciseOut(
-                id=exercise.id,
-                raw_name=exercise.raw_name,
-                order_index=exercise.order_index,
-                sets=[SessionSetOut.model_validate(set_row) for set_row in set_rows],
-            )
+        for set_row in set_rows:
+            set_rows_by_exercise_id[set_row.exercise_id].append(set_row)
+
+    exercises = [
+        SessionExerciseOut(
+            id=exercise.id,
+            raw_name=exercise.raw_name,
+            order_index=exercise.order_index,
+            sets=[SessionSetOut.model_validate(set_row) for set_row in set_rows_by_exercise_id.get(exercise.id, [])],
         )
+        for exercise in exercise_rows
+    ]
 
     return SessionDetailOut(
         id=session_row.id,
@@ -0,0 +1,27 @@
+import argparse
+from typing import List, Optional
+
+from app.database import build_engine, build_session_factory, resolve_database_url
+from app.services.daily_volume import rebuild_daily_volume
+from app.services.data_version import bump_data_version
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Maintain the daily_muscle_volume rollup.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("rebuild", help="recompute the rollup from every stored session")
+    parser.parse_args(argv)
+
+    engine = build_engine(resolve_database_url())
+    session = build_session_factory(engine)()
+    try:
+        row_count = rebuild_daily_volume(session)
+        bump_data_version(session)
+        session.commit()
+        print(f"daily_volume_rebuild_ok rows={row_count}")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
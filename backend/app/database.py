@@ -1,11 +1,18 @@
 import os
-from typing import Generator
+import threading
+from typing import Dict, Generator, Optional
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 Base = declarative_base()
 
+# Long-lived processes (RQ worker) reuse one engine/pool per database URL instead of building one per job.
+_registry_lock = threading.Lock()
+_engines: Dict[str, Engine] = {}
+_session_factories: Dict[str, sessionmaker] = {}
+
 
 def resolve_database_url(override: str = "") -> str:
     if override:
@@ -13,21 +20,86 @@ def resolve_database_url(override: str = "") -> str:
     return os.getenv("DATABASE_URL", "sqlite:///./health_v2.db")
 
 
-def build_engine(database_url: str):
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name, "").strip()
+    return int(value) if value else None
+
+
+def build_engine(
+    database_url: str,
+    *,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+    pool_recycle: Optional[int] = None,
+):
     connect_args = {}
+    engine_options = {}
     if database_url.startswith("sqlite"):
         connect_args["check_same_thread"] = False
-    return create_engine(database_url, future=True, connect_args=connect_args)
+    else:
+        # SQLite's pools do not take sizing options; only server databases get them.
+        if pool_size is not None:
+            engine_options["pool_size"] = pool_size
+        if max_overflow is not None:
+            engine_options["max_overflow"] = max_overflow
+    if pool_recycle is not None:
+        engine_options["pool_recycle"] = pool_recycle
+    return create_engine(database_url, future=True, connect_args=connect_args, **engine_options)
 
 
 def build_session_factory(engine):
     return sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
 
 
+def get_engine(database_url: str) -> Engine:
+    """Return the process-wide engine for database_url, sized by DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_RECYCLE_SECONDS."""
+    engine = _engines.get(database_url)
+    if engine is not None:
+        return engine
+    with _registry_lock:
+        engine = _engines.get(database_url)
+        if engine is None:
+            engine = build_engine(
+                database_url,
+                pool_size=_env_int("DB_POOL_SIZE"),
+                max_overflow=_env_int("DB_MAX_OVERFLOW"),
+                pool_recycle=_env_int("DB_POOL_RECYCLE_SECONDS"),
+            )
+            _engines[database_url] = engine
+            _session_factories[database_url] = build_session_factory(engine)
+        return engine
+
+
+def get_session_factory(database_url: str) -> sessionmaker:
+    get_engine(database_url)
+    return _session_factories[database_url]
+
+
+def dispose_engines() -> None:
+    """Close pooled connections of every registered engine (worker shutdown)."""
+    with _registry_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _session_factories.clear()
+
+
+def _dispose_engines_after_fork() -> None:
+    # Pooled connections inherited from the parent share its sockets; drop them without
+    # closing so the child opens its own on next checkout and the parent's stay valid.
+    global _registry_lock
+    _registry_lock = threading.Lock()
+    for engine in _engines.values():
+        engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_engines_after_fork)
+
+
 def get_db_session(session_factory) -> Generator[Session, None, None]:
     session = session_factory()
     try:
         yield session
     finally:
         session.close()
-
@@ -0,0 +1,40 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from app.database import build_engine, build_session_factory, resolve_database_url
+from app.services.data_version import bump_data_version
+from app.services.fatigue_state import check_fatigue_state, rebuild_fatigue_state
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Maintain the materialized muscle_fatigue_state table.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("rebuild", help="recompute the state from every stored session")
+    check_parser = subparsers.add_parser("check", help="compare the state against a full recompute")
+    check_parser.add_argument("--tolerance", type=float, default=0.01)
+    args = parser.parse_args(argv)
+
+    engine = build_engine(resolve_database_url())
+    session = build_session_factory(engine)()
+    try:
+        if args.command == "rebuild":
+            muscle_count = rebuild_fatigue_state(session)
+            bump_data_version(session)
+            session.commit()
+            print(f"fatigue_state_rebuild_ok muscles={muscle_count}")
+            return
+
+        mismatches = check_fatigue_state(session, tolerance=args.tolerance)
+        for item in mismatches:
+            print(f"mismatch muscle={item['muscle_code']} stored={item['stored']:.4f} expected={item['expected']:.4f}")
+        if mismatches:
+            print("fatigue_state_check_failed")
+            sys.exit(1)
+        print("fatigue_state_check_ok")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
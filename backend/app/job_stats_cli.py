@@ -0,0 +1,40 @@
+import argparse
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from app.database import build_engine, build_session_factory, resolve_database_url
+from app.services.job_stats import summarize_upload_job_stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Summarize per-stage upload job timings recorded by the workers.")
+    parser.add_argument("command", nargs="?", choices=("summary",), default="summary")
+    parser.add_argument("--since-hours", type=float, help="only jobs started within the last N hours")
+    args = parser.parse_args(argv)
+
+    since = None
+    if args.since_hours is not None:
+        since = datetime.now(timezone.utc) - timedelta(hours=args.since_hours)
+
+    engine = build_engine(resolve_database_url())
+    session = build_session_factory(engine)()
+    try:
+        summaries = summarize_upload_job_stats(session, since=since)
+    finally:
+        session.close()
+
+    for summary in summaries:
+        confidence = summary["confidence_p50"]
+        print(
+            f"parser_version={summary['parser_version']} jobs={summary['jobs']} parsed={summary['parsed']} "
+            f"failed={summary['failed']} jobs_per_sec={summary['jobs_per_sec']:.2f} "
+            f"confidence_p50={'-' if confidence is None else f'{confidence:.2f}'}"
+        )
+        for stage, values in summary["stages"].items():
+            print(f"  stage={stage} count={values['count']} p50_ms={values['p50_ms']:.2f} p95_ms={values['p95_ms']:.2f}")
+    if not summaries:
+        print("upload_job_stats_empty")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,273 @@
+import base64
+import json
 import os
 import uuid
-from typing import Callable, Dict, List
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
 
-from fastapi import Depends, FastAPI, File, HTTPException, Request, UploadFile, status
+import anyio
+from fastapi import Depends, FastAPI, File, HTTPException, Query, Request, Response, UploadFile, status
 from fastapi.middleware.cors import CORSMiddleware
-from redis import Redis
-from rq import Queue
-from sqlalchemy import select
+from fastapi.responses import JSONResponse, PlainTextResponse
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.api.recovery import router as recovery_router
 from app.api.sessions import router as sessions_router
+from app.cache import TTLLRUCache
 from app.database import build_engine, build_session_factory, get_db_session, resolve_database_url
 from app.jobs import build_upload_job_payload
+from app.metrics import MetricsRegistry, render_stats
 from app.migrate import run_migrations
 from app.models import UPLOAD_STATUSES, Upload
-from app.schemas import UploadOut
-from app.storage import LocalStorageBackend, StorageBackend
+from app.queue_client import UploadQueueClient
+from app.schemas import UploadBatchItemOut, UploadListItemOut, UploadOut
+from app.services.fatigue_kernel import HAS_NUMPY
+from app.storage import LocalStorageBackend, StagedFile, StorageBackend, UploadTooLargeError
 
+UPLOAD_ROUTE_PATH = "/api/uploads"
+UPLOAD_BATCH_ROUTE_PATH = "/api/uploads/batch"
 
-def enqueue_upload_job(payload: Dict, redis_url: str) -> str:
-    redis_conn = Redis.from_url(redis_url)
-    queue = Queue(name="uploads", connection=redis_conn)
-    job = queue.enqueue("app.workers.process_upload.process_upload_job", payload)
-    return str(job.id)
+# Placeholder job id held from the commit that creates or re-claims an upload until its enqueue
+# stores the real job id. A claim older than the timeout (the request died in between) expires.
+REQUEUE_CLAIM_JOB_ID = "requeue-claimed"
+REQUEUE_CLAIM_TIMEOUT = timedelta(minutes=5)
+
+# Allowance for multipart boundaries and part headers when pre-checking Content-Length.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class RejectOversizedUploads:
+    """
+    Pure ASGI middleware refusing declared oversized bodies on the upload routes before the
+    multipart parser spools them. Every other request is passed through untouched.
+    """
+
+    def __init__(self, app: Callable) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["method"] == "POST" and scope["path"] in (UPLOAD_ROUTE_PATH, UPLOAD_BATCH_ROUTE_PATH):
+            state = scope["app"].state
+            max_files = state.max_batch_files if scope["path"] == UPLOAD_BATCH_ROUTE_PATH else 1
+            max_body = max_files * (state.max_upload_bytes + MULTIPART_OVERHEAD_BYTES)
+            content_length = dict(scope["headers"]).get(b"content-length", b"")
+            if content_length.isdigit() and int(content_length) > max_body:
+                response = JSONResponse(status_code=status.HTTP_413_CONTENT_TOO_LARGE, content={"detail": "upload_too_large"})
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+# Keys selectable via GET /api/uploads?fields=; mirrors UploadOut.
+UPLOAD_LIST_FIELDS = tuple(UploadOut.model_fields)
+
+
+def _encode_upload_cursor(created_at: datetime, upload_id: uuid.UUID) -> str:
+    raw = json.dumps({"created_at": created_at.isoformat(), "id": str(upload_id)})
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_upload_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(raw["created_at"]), uuid.UUID(raw["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="invalid_cursor")
+
+
+def _find_upload_by_content(db: Session, content_sha256: str) -> Optional[Upload]:
+    return db.execute(select(Upload).where(Upload.content_sha256 == content_sha256)).scalar_one_or_none()
+
+
+def _claim_for_requeue(db: Session, upload_ids: List[uuid.UUID]) -> List[uuid.UUID]:
+    """
+    Mark duplicates that never got a job (enqueue failed, or a claim expired) or that failed as
+    pending again, and return the ids this request claimed. The conditional UPDATE keeps two
+    concurrent re-uploads of the same bytes from both enqueueing it.
+    """
+    if not upload_ids:
+        return []
+    claim_expired_before = datetime.now(timezone.utc) - REQUEUE_CLAIM_TIMEOUT
+    requeueable = or_(
+        Upload.status == "failed",
+        and_(
+            Upload.status != "parsed",
+            or_(
+                Upload.queue_job_id.is_(None),
+                and_(Upload.queue_job_id == REQUEUE_CLAIM_JOB_ID, Upload.updated_at < claim_expired_before),
+            ),
+        ),
+    )
+    claimed = []
+    for upload_id in upload_ids:
+        result = db.execute(
+            update(Upload)
+            .where(Upload.id == upload_id, requeueable)
+            .values(status="pending", error_message=None, queue_job_id=REQUEUE_CLAIM_JOB_ID, updated_at=datetime.now(timezone.utc))
+            # SQLite hands back naive updated_at values, which the in-Python evaluator cannot compare.
+            .execution_options(synchronize_session="fetch")
+        )
+        if result.rowcount == 1:
+            claimed.append(upload_id)
+    db.commit()
+    return claimed
+
+
+def _enqueue_uploads(db: Session, uploads: List[Upload], enqueue_many: Callable[[List[Dict]], List[str]]) -> None:
+    """Enqueue committed rows and store their job ids; if enqueueing raises, the rows stay requeueable."""
+    upload_ids = [upload.id for upload in uploads]
+    payloads = [
+        build_upload_job_payload(
+            upload_id=upload.id,
+            storage_path=upload.storage_path,
+            parser_version=upload.parser_version,
+        )
+        for upload in uploads
+    ]
+    try:
+        job_ids = enqueue_many(payloads)
+    except Exception:
+        db.rollback()
+        db.execute(update(Upload).where(Upload.id.in_(upload_ids)).values(queue_job_id=None))
+        db.commit()
+        raise
+    for upload, job_id in zip(uploads, job_ids):
+        upload.queue_job_id = job_id
+    db.commit()
+
+
+def _new_upload_row(app: FastAPI, upload_id: uuid.UUID, file: UploadFile, staged: StagedFile) -> Upload:
+    return Upload(
+        id=upload_id,
+        filename=file.filename,
+        original_filename=file.filename,
+        content_type=file.content_type,
+        size_bytes=staged.size_bytes,
+        status="pending",
+        content_sha256=staged.sha256,
+        parser_version=app.state.parser_version,
+        # Claimed from the start, so a concurrent duplicate cannot enqueue it before this request does.
+        queue_job_id=REQUEUE_CLAIM_JOB_ID,
+        updated_at=datetime.now(timezone.utc),
+    )
+
+
+def _store_and_enqueue_upload(app: FastAPI, db: Session, file: UploadFile) -> Tuple[UploadOut, bool]:
+    """
+    Store and enqueue a new upload; returns (upload, created). Duplicate content returns the
+    existing row, re-enqueued when it never got a job or has failed.
+    """
+    storage_backend = app.state.storage_backend
+    upload_id = uuid.uuid4()
+    try:
+        staged = storage_backend.stage_stream(str(upload_id), file.file, max_bytes=app.state.max_upload_bytes)
+    except UploadTooLargeError:
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail="upload_too_large")
+
+    try:
+        existing = _find_upload_by_content(db, staged.sha256)
+        if existing is not None:
+            if _claim_for_requeue(db, [existing.id]):
+                _enqueue_uploads(db, [existing], lambda payloads: [app.state.enqueue_func(payloads[0])])
+            return UploadOut.model_validate(existing), False
+
+        upload = _new_upload_row(app, upload_id, file, staged)
+        db.add(upload)
+        try:
+            db.flush()
+        except IntegrityError:
+            # A concurrent request stored the same content first.
+            db.rollback()
+            return UploadOut.model_validate(_find_upload_by_content(db, staged.sha256)), False
+
+        storage_path = storage_backend.promote(staged, str(upload_id), file.filename)
+    finally:
+        storage_backend.discard(staged)
+    if not storage_path:
+        raise HTTPException(status_code=400, detail="storage_path_required")
+
+    upload.storage_path = storage_path
+    db.commit()
+
+    _enqueue_uploads(db, [upload], lambda payloads: [app.state.enqueue_func(payloads[0])])
+    db.refresh(upload)
+    return UploadOut.model_validate(upload), True
+
+
+def _store_and_enqueue_upload_batch(app: FastAPI, db: Session, files: List[UploadFile]) -> List[UploadBatchItemOut]:
+    """
+    Store many files with one transaction and one enqueue_many call; returns one result per file, in order.
+
+    Files whose content already exists (in the table or earlier in the same batch) are reported as
+    duplicates of that upload, and existing rows without a job or in `failed` are re-enqueued with
+    the new ones; oversized or unnamed files are rejected without failing the batch.
+    """
+    storage_backend = app.state.storage_backend
+    results: List[Optional[UploadBatchItemOut]] = [None] * len(files)
+    staged_by_index: Dict[int, Tuple[uuid.UUID, StagedFile]] = {}
+    try:
+        for index, file in enumerate(files):
+            if not file.filename:
+                results[index] = UploadBatchItemOut(filename="", status="rejected", detail="filename_required")
+                continue
+            upload_id = uuid.uuid4()
+            try:
+                staged = storage_backend.stage_stream(str(upload_id), file.file, max_bytes=app.state.max_upload_bytes)
+            except UploadTooLargeError:
+                results[index] = UploadBatchItemOut(filename=file.filename, status="rejected", detail="upload_too_large")
+                continue
+            staged_by_index[index] = (upload_id, staged)
+
+        hashes = {staged.sha256 for _, staged in staged_by_index.values()}
+        rows_by_hash: Dict[str, Upload] = {}
+        if hashes:
+            rows_by_hash = {
+                row.content_sha256: row
+                for row in db.execute(select(Upload).where(Upload.content_sha256.in_(hashes))).scalars()
+            }
+        created_hashes: List[str] = []
+        for index, (upload_id, staged) in staged_by_index.items():
+            if staged.sha256 in rows_by_hash:
+                continue
+            upload = _new_upload_row(app, upload_id, files[index], staged)
+            db.add(upload)
+            rows_by_hash[staged.sha256] = upload
+            created_hashes.append(staged.sha256)
+        try:
+            db.flush()
+        except IntegrityError:
+            # A concurrent request stored some of this content first; retrying resolves them as duplicates.
+            db.rollback()
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="concurrent_duplicate_upload")
+
+        for index, (upload_id, staged) in staged_by_index.items():
+            upload = rows_by_hash[staged.sha256]
+            if upload.id == upload_id:
+                upload.storage_path = storage_backend.promote(staged, str(upload_id), files[index].filename)
+        db.commit()
+    finally:
+        for _, staged in staged_by_index.values():
+            storage_backend.discard(staged)
+
+    created = [rows_by_hash[content_hash] for content_hash in created_hashes]
+    created_hash_set = set(created_hashes)
+    existing_ids = [row.id for content_hash, row in rows_by_hash.items() if content_hash not in created_hash_set]
+    claimed = set(_claim_for_requeue(db, existing_ids))
+    to_enqueue = created + [row for row in rows_by_hash.values() if row.id in claimed]
+    if to_enqueue:
+        _enqueue_uploads(db, to_enqueue, app.state.enqueue_many_func)
+
+    for index, (upload_id, staged) in staged_by_index.items():
+        upload = rows_by_hash[staged.sha256]
+        results[index] = UploadBatchItemOut(
+            filename=files[index].filename,
+            status="created" if upload.id == upload_id else "duplicate",
+            upload=UploadOut.model_validate(upload),
+        )
+    return results
 
 
 def create_app(
@@ -31,14 +275,25 @@ def create_app(
     redis_url: str = "",
     parser_version: str = "",
     enqueue_func: Callable[[Dict], str] = None,
+    enqueue_many_func: Callable[[List[Dict]], List[str]] = None,
     storage_backend: StorageBackend = None,
     upload_dir: str = "",
     auto_migrate: bool = True,
+    max_upload_bytes: int = 0,
 ) -> FastAPI:
     resolved_database_url = resolve_database_url(database_url)
     resolved_redis_url = redis_url or os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")
     resolved_parser_version = parser_version or os.getenv("PARSER_VERSION", "tc03-parser-v1")
     resolved_upload_dir = upload_dir or os.getenv("UPLOAD_DIR", "./data/uploads")
+    resolved_max_upload_bytes = max_upload_bytes or int(os.getenv("MAX_UPLOAD_BYTES", str(20 * 1024 * 1024)))
+    upload_io_threads = int(os.getenv("UPLOAD_IO_THREADS", "8"))
+    max_batch_files = int(os.getenv("MAX_BATCH_FILES", "100"))
+    recovery_cache_ttl_seconds = float(os.getenv("RECOVERY_CACHE_TTL_SECONDS", "30"))
+    recovery_use_rollup = os.getenv("RECOVERY_USE_ROLLUP", "").strip().lower() in ("1", "true", "yes")
+    recovery_use_numpy = os.getenv("RECOVERY_USE_NUMPY", "").strip().lower() in ("1", "true", "yes")
+    if recovery_use_numpy and not HAS_NUMPY:
+        raise RuntimeError("RECOVERY_USE_NUMPY requires numpy (pip install '.[speedups]')")
+    metrics_enabled = os.getenv("METRICS_ENABLED", "").strip().lower() in ("1", "true", "yes")
 
     engine = build_engine(resolved_database_url)
     session_factory = build_session_factory(engine)
@@ -46,74 +301,169 @@ def create_app(
     if auto_migrate:
         run_migrations(engine)
 
-    app = FastAPI(title="health-v2 backend")
+    queue_client = None
+    if enqueue_func is None:
+        queue_client = UploadQueueClient(
+            resolved_redis_url,
+            max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "32")),
+            health_check_interval=int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30")),
+        )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        if queue_client is not None:
+            queue_client.close()
+
+    app = FastAPI(title="health-v2 backend", lifespan=lifespan)
+    # Not BaseHTTPMiddleware: non-upload routes (health, recovery) skip it with one path check.
+    app.add_middleware(RejectOversizedUploads)
+    # Added after the size check so CORS stays outermost and decorates its 413s too.
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
         allow_credentials=False,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
     app.state.session_factory = session_factory
     app.state.parser_version = resolved_parser_version
     app.state.allowed_statuses = UPLOAD_STATUSES
+    app.state.max_upload_bytes = resolved_max_upload_bytes
+    app.state.max_batch_files = max_batch_files
+    # Bounds concurrent blocking upload work; keep it at or below the DB pool size (5 + 10 overflow).
+    app.state.upload_io_limiter = anyio.CapacityLimiter(upload_io_threads)
     app.state.storage_backend = storage_backend or LocalStorageBackend(resolved_upload_dir)
-    if enqueue_func is None:
-        app.state.enqueue_func = lambda payload: enqueue_upload_job(payload, resolved_redis_url)
+    # Read recovery volumes from daily_muscle_volume; backfill it first with `daily_volume_cli rebuild`.
+    app.state.recovery_use_rollup = recovery_use_rollup
+    # Vectorized decay kernel from the `speedups` extra; off unless explicitly enabled.
+    app.state.recovery_use_numpy = recovery_use_numpy
+    # Stage timers (Server-Timing + /api/metrics histograms); when None the hot path skips timing entirely.
+    app.state.metrics = MetricsRegistry() if metrics_enabled else None
+    app.state.recovery_cache = None
+    if recovery_cache_ttl_seconds > 0:
+        app.state.recovery_cache = TTLLRUCache(
+            max_entries=int(os.getenv("RECOVERY_CACHE_MAX_ENTRIES", "256")),
+            max_bytes=int(os.getenv("RECOVERY_CACHE_MAX_BYTES", str(8 * 1024 * 1024))),
+            ttl_seconds=recovery_cache_ttl_seconds,
+        )
+    app.state.queue_client = queue_client
+    if queue_client is not None:
+        app.state.enqueue_func = queue_client.enqueue
     else:
         app.state.enqueue_func = enqueue_func
+    if enqueue_many_func is not None:
+        app.state.enqueue_many_func = enqueue_many_func
+    elif queue_client is not None:
+        app.state.enqueue_many_func = queue_client.enqueue_many
+    else:
+        # A custom single-job enqueue (tests, alternative queues) is applied per payload.
+        app.state.enqueue_many_func = lambda payloads: [enqueue_func(payload) for payload in payloads]
 
     def get_db(request: Request):
         yield from get_db_session(request.app.state.session_factory)
 
     @app.get("/api/health")
-    def health() -> dict:
+    async def health() -> dict:
         return {"status": "ok"}
 
-    @app.post("/api/uploads", response_model=UploadOut, status_code=status.HTTP_201_CREATED)
+    @app.get("/api/queue/stats")
+    def queue_stats(request: Request) -> dict:
+        queue_client = request.app.state.queue_client
+        if queue_client is None:
+            return {"enabled": False}
+        return {"enabled": True, **queue_client.stats()}
+
+    @app.get("/api/metrics", response_class=PlainTextResponse)
+    def metrics(request: Request) -> PlainTextResponse:
+        lines = []
+        if request.app.state.metrics is not None:
+            lines.extend(request.app.state.metrics.render())
+        if request.app.state.recovery_cache is not None:
+            cache = request.app.state.recovery_cache
+            lines.extend(render_stats("recovery_cache", "Recovery response cache stat.", cache.stats(), cache.COUNTER_STATS))
+        if request.app.state.queue_client is not None:
+            queue_client = request.app.state.queue_client
+            lines.extend(render_stats("upload_queue", "Upload enqueue stat.", queue_client.stats(), queue_client.COUNTER_STATS))
+        return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
+    @app.post(UPLOAD_ROUTE_PATH, response_model=UploadOut, status_code=status.HTTP_201_CREATED)
     async def create_upload(
         request: Request,
+        response: Response,
         file: UploadFile = File(...),
         db: Session = Depends(get_db),
     ) -> UploadOut:
         if not file.filename:
             raise HTTPException(status_code=400, detail="filename_required")
 
-        upload_id = uuid.uuid4()
-        file_bytes = await file.read()
-        storage_path = request.app.state.storage_backend.save(str(upload_id), file.filename, file_bytes)
-        if not storage_path:
-            raise HTTPException(status_code=400, detail="storage_path_required")
-
-        upload = Upload(
-            id=upload_id,
-            filename=file.filename,
-            original_filename=file.filename,
-            content_type=file.content_type,
-            size_bytes=len(file_bytes),
-            status="pending",
-            storage_path=storage_path,
-            parser_version=request.app.state.parser_version,
+        # Disk writes, DB commits and the enqueue call all block, so they run off the event loop.
+        upload, created = await anyio.to_thread.run_sync(
+            _store_and_enqueue_upload,
+            request.app,
+            db,
+            file,
+            limiter=request.app.state.upload_io_limiter,
         )
-        db.add(upload)
-        db.commit()
-        db.refresh(upload)
+        if not created:
+            # Same bytes were uploaded before: no new file, row or queue job.
+            response.status_code = status.HTTP_200_OK
+        return upload
 
-        payload = build_upload_job_payload(
-            upload_id=upload.id,
-            storage_path=upload.storage_path,
-            parser_version=upload.parser_version,
+    @app.post(UPLOAD_BATCH_ROUTE_PATH, response_model=List[UploadBatchItemOut])
+    async def create_upload_batch(
+        request: Request,
+        files: List[UploadFile] = File(...),
+        db: Session = Depends(get_db),
+    ) -> List[UploadBatchItemOut]:
+        if len(files) > request.app.state.max_batch_files:
+            raise HTTPException(status_code=400, detail="too_many_files")
+
+        return await anyio.to_thread.run_sync(
+            _store_and_enqueue_upload_batch,
+            request.app,
+            db,
+            files,
+            limiter=request.app.state.upload_io_limiter,
         )
-        job_id = request.app.state.enqueue_func(payload)
-        upload.queue_job_id = job_id
-        db.commit()
-        db.refresh(upload)
-        return UploadOut.model_validate(upload)
 
-    @app.get("/api/uploads", response_model=List[UploadOut])
-    def list_uploads(db: Session = Depends(get_db)) -> List[UploadOut]:
-        rows = db.execute(select(Upload).order_by(Upload.created_at.desc())).scalars().all()
-        return [UploadOut.model_validate(row) for row in rows]
+    @app.get("/api/uploads", response_model=List[UploadListItemOut], response_model_exclude_unset=True)
+    def list_uploads(
+        response: Response,
+        limit: int = Query(default=50, ge=1, le=200),
+        cursor: str = Query(default=None),
+        status_filter: str = Query(default=None, alias="status", pattern=f"^({'|'.join(UPLOAD_STATUSES)})$"),
+        fields: str = Query(default=None),
+        db: Session = Depends(get_db),
+    ) -> List[UploadListItemOut]:
+        if fields:
+            requested = [name.strip() for name in fields.split(",") if name.strip()]
+            if not requested or any(name not in UPLOAD_LIST_FIELDS for name in requested):
+                raise HTTPException(status_code=400, detail="invalid_fields")
+        else:
+            requested = list(UPLOAD_LIST_FIELDS)
+
+        # Select only the needed columns; ocr_text_raw is never part of a list row.
+        columns = [getattr(Upload, name) for name in dict.fromkeys([*requested, "created_at", "id"])]
+        stmt = select(*columns)
+        if status_filter is not None:
+            stmt = stmt.where(Upload.status == status_filter)
+        if cursor:
+            cursor_created_at, cursor_id = _decode_upload_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    Upload.created_at < cursor_created_at,
+                    and_(Upload.created_at == cursor_created_at, Upload.id < cursor_id),
+                )
+            )
+        stmt = stmt.order_by(Upload.created_at.desc(), Upload.id.desc()).limit(limit + 1)
+        rows = db.execute(stmt).all()
+
+        if len(rows) > limit:
+            rows = rows[:limit]
+            response.headers["X-Next-Cursor"] = _encode_upload_cursor(rows[-1].created_at, rows[-1].id)
+        return [UploadListItemOut(**{name: row._mapping[name] for name in requested}) for row in rows]
 
     @app.get("/api/uploads/{upload_id}", response_model=UploadOut)
     def get_upload(upload_id: uuid.UUID, db: Session = Depends(get_db)) -> UploadOut:
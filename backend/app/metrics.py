@@ -0,0 +1,156 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Collection, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Seconds; covers sub-millisecond cached reads up to multi-second cold windows.
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+ROW_BUCKETS = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+_NO_STAGE = nullcontext()
+
+
+class StageTimings:
+    """Stage durations and row counts for one request, in first-seen order."""
+
+    __slots__ = ("stages", "counts", "_clock")
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.stages: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self._clock = clock
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + (self._clock() - started)
+
+    def count(self, name: str, value: int) -> None:
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def server_timing(self) -> str:
+        """Server-Timing header value: one metric per stage (ms), row counts as descriptions."""
+        entries = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in self.stages.items()]
+        entries.extend(f'{name};desc="{value}"' for name, value in self.counts.items())
+        return ", ".join(entries)
+
+
+def timed_stage(timings: Optional[StageTimings], name: str):
+    """timings.stage(name), or a shared no-op context when timing is off."""
+    if timings is None:
+        return _NO_STAGE
+    return timings.stage(name)
+
+
+def count_rows(timings: Optional[StageTimings], name: str, value: int) -> None:
+    if timings is not None:
+        timings.count(name, value)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus exposition layout."""
+
+    __slots__ = ("buckets", "bucket_counts", "total", "count")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsRegistry:
+    """Thread-safe in-process histograms rendered as Prometheus text."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # name -> (help text, buckets, labels -> histogram)
+        self._families: Dict[str, Tuple[str, Sequence[float], Dict[Labels, Histogram]]] = {}
+
+    def observe(self, name: str, value: float, *, help_text: str, buckets: Sequence[float], **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = (help_text, buckets, {})
+            histogram = family[2].get(key)
+            if histogram is None:
+                histogram = family[2][key] = Histogram(family[1])
+            histogram.observe(value)
+
+    def observe_timings(self, endpoint: str, timings: StageTimings) -> None:
+        for stage, seconds in timings.stages.items():
+            self.observe(
+                "recovery_stage_seconds",
+                seconds,
+                help_text="Time spent per recovery computation stage.",
+                buckets=STAGE_BUCKETS,
+                endpoint=endpoint,
+                stage=stage,
+            )
+        for kind, rows in timings.counts.items():
+            self.observe(
+                "recovery_rows",
+                rows,
+                help_text="Rows loaded per recovery computation.",
+                buckets=ROW_BUCKETS,
+                endpoint=endpoint,
+                kind=kind,
+            )
+
+    def render(self) -> List[str]:
+        lines: List[str] = []
+        with self._lock:
+            for name, (help_text, buckets, histograms) in sorted(self._families.items()):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in sorted(histograms.items()):
+                    cumulative = 0
+                    for upper, bucket_count in zip([*buckets, "+Inf"], histogram.bucket_counts):
+                        cumulative += bucket_count
+                        le = upper if upper == "+Inf" else _format_value(upper)
+                        lines.append(f"{name}_bucket{_format_labels((*labels, ('le', le)))} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.total)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return lines
+
+
+def render_stats(prefix: str, help_text: str, values: Dict[str, float], counters: Collection[str] = ()) -> List[str]:
+    """
+    Prometheus lines for a flat stats dict (cache/queue stats); non-numeric values are skipped.
+
+    Keys in counters are monotonic and exported as counters with the conventional _total
+    suffix; everything else is a gauge.
+    """
+    lines: List[str] = []
+    for key, value in values.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        metric_type = "counter" if key in counters else "gauge"
+        name = f"{prefix}_{key}_total" if metric_type == "counter" else f"{prefix}_{key}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.append(f"{name} {_format_value(value)}")
+    return lines
@@ -1,5 +1,6 @@
 import uuid
 from datetime import date as date_type
+from datetime import datetime, timezone
 
 from sqlalchemy import Date, DateTime, Float, ForeignKey, Integer, String, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column
@@ -9,6 +10,10 @@ from app.database import Base
 UPLOAD_STATUSES = ("pending", "processing", "parsed", "failed")
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class Upload(Base):
     __tablename__ = "uploads"
 
@@ -23,7 +28,9 @@ class Upload(Base):
     queue_job_id: Mapped[str] = mapped_column(String(128), nullable=True)
     error_message: Mapped[str] = mapped_column(String(512), nullable=True)
     ocr_text_raw: Mapped[str] = mapped_column(Text, nullable=True)
-    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    content_sha256: Mapped[str] = mapped_column(String(64), nullable=True, unique=True)
+    # Set client-side with microseconds so the (created_at, id) keyset cursor orders consistently on SQLite.
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utcnow, server_default=func.now())
     updated_at: Mapped[DateTime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -79,3 +86,72 @@ class ExerciseMuscle(Base):
     muscle_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), ForeignKey("muscle_groups.id"), primary_key=True)
     weight: Mapped[float] = mapped_column(Float, nullable=False)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class MuscleFatigueState(Base):
+    __tablename__ = "muscle_fatigue_state"
+
+    # Raw (unscaled) fatigue per muscle, valid at anchor_at; decays forward with the muscle's half-life.
+    muscle_code: Mapped[str] = mapped_column(String(64), primary_key=True)
+    fatigue_raw: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    anchor_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+class DataVersion(Base):
+    __tablename__ = "data_versions"
+
+    # Monotonic counters bumped whenever derived read models (e.g. recovery) may change.
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+class DailyMuscleVolume(Base):
+    __tablename__ = "daily_muscle_volume"
+
+    # Mapped volume (sum of reps * weight_kg * mapping weight) per day, muscle and contributing exercise name.
+    date: Mapped[date_type] = mapped_column(Date, primary_key=True)
+    muscle_code: Mapped[str] = mapped_column(String(64), primary_key=True)
+    raw_name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    volume: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+
+class DailyUnmappedExercise(Base):
+    __tablename__ = "daily_unmapped_exercises"
+
+    date: Mapped[date_type] = mapped_column(Date, primary_key=True)
+    raw_name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    exercise_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class UploadJobStat(Base):
+    __tablename__ = "upload_job_stats"
+
+    # One row per processed upload job; stage columns are milliseconds, NULL when the stage did not run.
+    id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    upload_id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), nullable=False)
+    parser_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    batch_size: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    started_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
+    total_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    load_upload_ms: Mapped[float] = mapped_column(Float, nullable=True)
+    file_check_ms: Mapped[float] = mapped_column(Float, nullable=True)
+    parse_ms: Mapped[float] = mapped_column(Float, nullable=True)
+    persist_ms: Mapped[float] = mapped_column(Float, nullable=True)
+    commit_ms: Mapped[float] = mapped_column(Float, nullable=True)
+    line_count: Mapped[int] = mapped_column(Integer, nullable=True)
+    exercise_count: Mapped[int] = mapped_column(Integer, nullable=True)
+    set_count: Mapped[int] = mapped_column(Integer, nullable=True)
+    confidence: Mapped[float] = mapped_column(Float, nullable=True)
@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Callable, Dict, List
+
+from redis import ConnectionPool, Redis
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError, TimeoutError
+from redis.retry import Retry
+from rq import Queue
+
+UPLOAD_QUEUE_NAME = "uploads"
+UPLOAD_JOB_FUNC = "app.workers.process_upload.process_upload_job"
+
+
+class UploadQueueClient:
+    """
+    App-lifetime Redis connection pool and upload Queue handle.
+
+    Connections are opened lazily, health-checked when idle longer than
+    health_check_interval, and retried with exponential backoff on connection errors.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        *,
+        max_connections: int = 32,
+        health_check_interval: int = 30,
+        retries: int = 3,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._pool = ConnectionPool.from_url(
+            redis_url,
+            max_connections=max_connections,
+            health_check_interval=health_check_interval,
+            retry=Retry(ExponentialBackoff(cap=1.0, base=0.05), retries),
+            retry_on_error=[ConnectionError, TimeoutError],
+        )
+        self.redis = Redis(connection_pool=self._pool)
+        self.queue = Queue(name=UPLOAD_QUEUE_NAME, connection=self.redis)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._jobs = 0
+        self._errors = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    def _record(self, started: float, jobs: int, failed: bool) -> None:
+        elapsed_ms = (self._clock() - started) * 1000.0
+        with self._lock:
+            self._calls += 1
+            self._total_ms += elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+            if failed:
+                self._errors += 1
+            else:
+                self._jobs += jobs
+
+    def enqueue(self, payload: Dict) -> str:
+        started = self._clock()
+        try:
+            job = self.queue.enqueue(UPLOAD_JOB_FUNC, payload)
+        except Exception:
+            self._record(started, 1, failed=True)
+            raise
+        self._record(started, 1, failed=False)
+        return str(job.id)
+
+    def enqueue_many(self, payloads: List[Dict]) -> List[str]:
+        """Enqueue all payloads in one pipeline round trip."""
+        started = self._clock()
+        try:
+            jobs = self.queue.enqueue_many([Queue.prepare_data(UPLOAD_JOB_FUNC, args=(payload,)) for payload in payloads])
+        except Exception:
+            self._record(started, len(payloads), failed=True)
+            raise
+        self._record(started, len(payloads), failed=False)
+        return [str(job.id) for job in jobs]
+
+    # stats() keys that only ever grow (exported as Prometheus counters).
+    COUNTER_STATS = ("enqueue_calls", "enqueued_jobs", "enqueue_errors", "connections_created")
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            calls = self._calls
+            latency = {
+                "enqueue_calls": calls,
+                "enqueued_jobs": self._jobs,
+                "enqueue_errors": self._errors,
+                "enqueue_avg_ms": round(self._total_ms / calls, 3) if calls else 0.0,
+                "enqueue_max_ms": round(self._max_ms, 3),
+            }
+        return {**latency, **self._pool_stats()}
+
+    def _pool_stats(self) -> Dict[str, float]:
+        # redis-py exposes no public pool counters; read the private ones defensively so an
+        # upgrade that renames them drops the gauges instead of breaking /api/queue/stats.
+        stats: Dict[str, float] = {"max_connections": self._pool.max_connections}
+        created = getattr(self._pool, "_created_connections", None)
+        if isinstance(created, int):
+            stats["connections_created"] = created
+        for key, attribute in (("connections_in_use", "_in_use_connections"), ("connections_idle", "_available_connections")):
+            connections = getattr(self._pool, attribute, None)
+            if connections is not None:
+                try:
+                    stats[key] = len(connections)
+                except TypeError:
+                    pass
+        return stats
+
+    def close(self) -> None:
+        self._pool.disconnect()
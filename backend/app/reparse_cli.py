@@ -0,0 +1,96 @@
+import argparse
+import json
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+from app.database import build_engine, build_session_factory, resolve_database_url
+from app.models import UPLOAD_STATUSES
+from app.services.reparse import ReparseReport, reparse_uploads
+
+
+def _describe(state) -> str:
+    if isinstance(state, str):
+        return f"failed({state})"
+    parts = []
+    for session_date, _, _, _, exercises in state:
+        sets = [item for _, exercise_sets in exercises for item in exercise_sets]
+        volume = sum((weight or 0.0) * reps for weight, reps in sets)
+        parts.append(
+            f"{session_date} exercises={len(exercises)} sets={len(sets)} "
+            f"reps={sum(reps for _, reps in sets)} volume={volume:.0f}"
+        )
+    return "[" + ", ".join(parts) + "]"
+
+
+def _read_checkpoint(path: Path, parser_version: str) -> Optional[uuid.UUID]:
+    if not path.exists():
+        return None
+    checkpoint = json.loads(path.read_text())
+    if checkpoint.get("parser_version") != parser_version:
+        raise SystemExit("checkpoint_parser_version_mismatch")
+    return uuid.UUID(checkpoint["last_upload_id"])
+
+
+def _write_checkpoint(path: Path, parser_version: str, report: ReparseReport) -> None:
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(
+        json.dumps({"parser_version": parser_version, "last_upload_id": report.last_upload_id, "scanned": report.scanned})
+    )
+    os.replace(temp_path, path)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Re-parse stored OCR text and replace each upload's sessions.")
+    parser.add_argument("--parser-version", default=os.getenv("PARSER_VERSION", "tc03-parser-v1"))
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="parser processes; 1 parses inline")
+    parser.add_argument("--status", action="append", choices=UPLOAD_STATUSES, help="only uploads in this status (repeatable); default parsed and failed")
+    parser.add_argument("--checkpoint", type=Path, help="file recording the last committed upload id")
+    parser.add_argument("--resume", action="store_true", help="continue after the upload id in --checkpoint")
+    parser.add_argument("--dry-run", action="store_true", help="print uploads whose sessions would change; write nothing")
+    args = parser.parse_args(argv)
+    if args.resume and args.checkpoint is None:
+        parser.error("--resume requires --checkpoint")
+
+    start_after = _read_checkpoint(args.checkpoint, args.parser_version) if args.resume else None
+    on_chunk_committed = None
+    if args.checkpoint is not None and not args.dry_run:
+
+        def on_chunk_committed(report: ReparseReport) -> None:
+            _write_checkpoint(args.checkpoint, args.parser_version, report)
+
+    engine = build_engine(resolve_database_url())
+    session = build_session_factory(engine)()
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    try:
+        report = reparse_uploads(
+            session,
+            parser_version=args.parser_version,
+            chunk_size=args.chunk_size,
+            executor=executor,
+            start_after=start_after,
+            statuses=args.status,
+            dry_run=args.dry_run,
+            on_chunk_committed=on_chunk_committed,
+        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        session.close()
+
+    for upload_id, old_state, new_state in report.diffs:
+        print(f"diff upload={upload_id} old={_describe(old_state)} new={_describe(new_state)}")
+    if args.checkpoint is not None and not args.dry_run:
+        args.checkpoint.unlink(missing_ok=True)
+    print(
+        f"{'reparse_dry_run' if args.dry_run else 'reparse_ok'} scanned={report.scanned} changed={report.changed} "
+        f"unchanged={report.unchanged} failed={report.failed} elapsed_s={report.elapsed_s:.2f} "
+        f"parse_s={report.parse_s:.2f} persist_s={report.persist_s:.2f} uploads_per_sec={report.uploads_per_sec:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
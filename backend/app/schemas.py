@@ -16,6 +16,7 @@ class UploadOut(BaseModel):
     parser_version: str
     queue_job_id: Optional[str] = None
     error_message: Optional[str] = None
+    content_sha256: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
@@ -24,6 +25,32 @@ class UploadOut(BaseModel):
     }
 
 
+class UploadBatchItemOut(BaseModel):
+    filename: str
+    # created | duplicate | rejected
+    status: str
+    detail: Optional[str] = None
+    upload: Optional[UploadOut] = None
+
+
+class UploadListItemOut(BaseModel):
+    """List row for GET /api/uploads; with ?fields= only the requested keys are set and serialized."""
+
+    id: Optional[UUID] = None
+    filename: Optional[str] = None
+    original_filename: Optional[str] = None
+    content_type: Optional[str] = None
+    size_bytes: Optional[int] = None
+    status: Optional[str] = None
+    storage_path: Optional[str] = None
+    parser_version: Optional[str] = None
+    queue_job_id: Optional[str] = None
+    error_message: Optional[str] = None
+    content_sha256: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
 class SessionListItemOut(BaseModel):
     id: UUID
     date: date
@@ -0,0 +1,118 @@
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Tuple
+
+from sqlalchemy import delete, insert, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import DailyMuscleVolume, DailyUnmappedExercise, MuscleGroup, WorkoutSession
+from app.services.recovery_engine_v0 import SEED_SESSION_DATE, load_mapped_exercise_volumes
+
+# daily_muscle_volume holds everything the recovery math needs per (day, muscle, exercise name),
+# so windowed reads touch tens of rollup rows instead of every set in the window.
+# Name-keyed fallback mappings are resolved at write time; rebuild after changing exercise_muscles.
+
+# Retracted rows at or below this volume are leftovers of float subtraction and are dropped.
+RETRACTED_VOLUME_EPSILON = 1e-6
+
+
+def _rollup_rows(
+    db_session: Session, session_filters: list
+) -> Tuple[Dict[Tuple[date, str, str], float], Dict[Tuple[date, str], int]]:
+    muscle_code_by_id = {str(muscle_id): code for muscle_id, code in db_session.execute(select(MuscleGroup.id, MuscleGroup.code))}
+    mapped_rows, unmapped = load_mapped_exercise_volumes(db_session, session_filters, aggregate_in_sql=True)
+
+    volumes: Dict[Tuple[date, str, str], float] = defaultdict(float)
+    for raw_name, session_date, exercise_volume, mappings in mapped_rows:
+        for muscle_id, mapping_weight in mappings:
+            muscle_code = muscle_code_by_id.get(muscle_id)
+            if muscle_code is not None:
+                volumes[(session_date, muscle_code, raw_name)] += exercise_volume * mapping_weight
+    return volumes, unmapped
+
+
+def _upsert_increment(db_session: Session, model, rows: List[Dict], key_columns: List[str], value_column: str) -> None:
+    dialect_insert = postgresql_insert if db_session.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = dialect_insert(model)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=key_columns,
+        set_={value_column: getattr(model, value_column) + stmt.excluded[value_column]},
+    )
+    db_session.execute(stmt, rows)
+
+
+def _increment_session_rows(db_session: Session, session_id, sign: int) -> Tuple[list, list]:
+    volumes, unmapped = _rollup_rows(db_session, [WorkoutSession.id == session_id, WorkoutSession.date != SEED_SESSION_DATE])
+    if volumes:
+        _upsert_increment(
+            db_session,
+            DailyMuscleVolume,
+            [
+                {"date": session_date, "muscle_code": muscle_code, "raw_name": raw_name, "volume": sign * volume}
+                for (session_date, muscle_code, raw_name), volume in volumes.items()
+            ],
+            ["date", "muscle_code", "raw_name"],
+            "volume",
+        )
+    if unmapped:
+        _upsert_increment(
+            db_session,
+            DailyUnmappedExercise,
+            [
+                {"date": session_date, "raw_name": raw_name, "exercise_count": sign * count}
+                for (session_date, raw_name), count in unmapped.items()
+            ],
+            ["date", "raw_name"],
+            "exercise_count",
+        )
+    return list(volumes), list(unmapped)
+
+
+def apply_session_to_daily_volume(db_session: Session, session_id) -> None:
+    """Add one flushed session's volumes to the rollup; the caller owns the transaction."""
+    _increment_session_rows(db_session, session_id, 1)
+
+
+def retract_session_from_daily_volume(db_session: Session, session_id) -> None:
+    """Subtract one stored session's volumes (before it is deleted); the caller owns the transaction."""
+    volume_keys, unmapped_keys = _increment_session_rows(db_session, session_id, -1)
+    if volume_keys:
+        db_session.execute(
+            delete(DailyMuscleVolume).where(
+                tuple_(DailyMuscleVolume.date, DailyMuscleVolume.muscle_code, DailyMuscleVolume.raw_name).in_(volume_keys),
+                DailyMuscleVolume.volume <= RETRACTED_VOLUME_EPSILON,
+            )
+        )
+    if unmapped_keys:
+        db_session.execute(
+            delete(DailyUnmappedExercise).where(
+                tuple_(DailyUnmappedExercise.date, DailyUnmappedExercise.raw_name).in_(unmapped_keys),
+                DailyUnmappedExercise.exercise_count <= 0,
+            )
+        )
+
+
+def rebuild_daily_volume(db_session: Session) -> int:
+    """Recompute the rollup from every stored session (backfills, re-parses, mapping changes)."""
+    db_session.execute(delete(DailyMuscleVolume))
+    db_session.execute(delete(DailyUnmappedExercise))
+    volumes, unmapped = _rollup_rows(db_session, [WorkoutSession.date != SEED_SESSION_DATE])
+    if volumes:
+        db_session.execute(
+            insert(DailyMuscleVolume),
+            [
+                {"date": session_date, "muscle_code": muscle_code, "raw_name": raw_name, "volume": volume}
+                for (session_date, muscle_code, raw_name), volume in volumes.items()
+            ],
+        )
+    if unmapped:
+        db_session.execute(
+            insert(DailyUnmappedExercise),
+            [
+                {"date": session_date, "raw_name": raw_name, "exercise_count": count}
+                for (session_date, raw_name), count in unmapped.items()
+            ],
+        )
+    return len(volumes)
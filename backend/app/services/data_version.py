@@ -0,0 +1,22 @@
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models import DataVersion
+
+SESSIONS_DATA_VERSION = "sessions"
+# Moves only when exercise_muscles rows are written or deleted.
+MAPPINGS_DATA_VERSION = "mappings"
+
+
+def read_data_version(db_session: Session, name: str = SESSIONS_DATA_VERSION) -> int:
+    version = db_session.execute(select(DataVersion.version).where(DataVersion.name == name)).scalar()
+    return int(version or 0)
+
+
+def bump_data_version(db_session: Session, name: str = SESSIONS_DATA_VERSION) -> None:
+    """Increment in the caller's transaction so readers never see new data with an old version."""
+    result = db_session.execute(
+        update(DataVersion).where(DataVersion.name == name).values(version=DataVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        db_session.add(DataVersion(name=name, version=1))
@@ -0,0 +1,88 @@
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional speedup; the pure-Python loop is always available.
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+@dataclass
+class FatigueColumns:
+    """
+    Columnar (exercise, muscle) pairs for one recovery computation.
+
+    Row i contributes volumes[i] * weights[i] * exp(-delta_hours[i] / half_lives[muscle_idx[i]])
+    to muscle muscle_idx[i], credited to contributor contributor_idx[i].
+    """
+
+    half_lives: List[float]
+    contributor_names: List[str] = field(default_factory=list)
+    volumes: List[float] = field(default_factory=list)
+    weights: List[float] = field(default_factory=list)
+    delta_hours: List[float] = field(default_factory=list)
+    muscle_idx: List[int] = field(default_factory=list)
+    contributor_idx: List[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.volumes)
+
+
+@dataclass
+class FatigueTotals:
+    fatigue_raw: List[float]
+    # Per muscle index: contributor name -> decayed volume, in first-contribution order.
+    contributors: List[Dict[str, float]]
+
+
+def _accumulate_python(columns: FatigueColumns) -> FatigueTotals:
+    fatigue_raw = [0.0] * len(columns.half_lives)
+    contributors: List[Dict[str, float]] = [{} for _ in columns.half_lives]
+    for row in range(len(columns)):
+        m_idx = columns.muscle_idx[row]
+        decayed = (columns.volumes[row] * columns.weights[row]) * math.exp(
+            -columns.delta_hours[row] / columns.half_lives[m_idx]
+        )
+        fatigue_raw[m_idx] += decayed
+        name = columns.contributor_names[columns.contributor_idx[row]]
+        contributors[m_idx][name] = contributors[m_idx].get(name, 0.0) + decayed
+    return FatigueTotals(fatigue_raw=fatigue_raw, contributors=contributors)
+
+
+def _accumulate_numpy(columns: FatigueColumns) -> FatigueTotals:
+    muscle_count = len(columns.half_lives)
+    contributor_count = len(columns.contributor_names)
+    muscle_idx = np.asarray(columns.muscle_idx, dtype=np.intp)
+    contributor_idx = np.asarray(columns.contributor_idx, dtype=np.intp)
+    half_lives = np.asarray(columns.half_lives, dtype=np.float64)
+
+    decayed = (np.asarray(columns.volumes, dtype=np.float64) * np.asarray(columns.weights, dtype=np.float64)) * np.exp(
+        -np.asarray(columns.delta_hours, dtype=np.float64) / half_lives[muscle_idx]
+    )
+
+    # np.add.at is unbuffered, so repeated indices accumulate in row order like the Python loop.
+    fatigue_raw = np.zeros(muscle_count, dtype=np.float64)
+    np.add.at(fatigue_raw, muscle_idx, decayed)
+    contribution = np.zeros((muscle_count, contributor_count), dtype=np.float64)
+    np.add.at(contribution, (muscle_idx, contributor_idx), decayed)
+    first_row = np.full((muscle_count, contributor_count), len(columns), dtype=np.intp)
+    np.minimum.at(first_row, (muscle_idx, contributor_idx), np.arange(len(columns), dtype=np.intp))
+
+    contributors: List[Dict[str, float]] = []
+    for m_idx in range(muscle_count):
+        touched = np.flatnonzero(first_row[m_idx] < len(columns))
+        ordered = touched[np.argsort(first_row[m_idx][touched], kind="stable")]
+        contributors.append({columns.contributor_names[c_idx]: float(contribution[m_idx, c_idx]) for c_idx in ordered})
+    return FatigueTotals(fatigue_raw=[float(value) for value in fatigue_raw], contributors=contributors)
+
+
+def accumulate_decayed_fatigue(columns: FatigueColumns, use_numpy: bool = False) -> FatigueTotals:
+    """Sum decayed contributions per muscle and per contributor; NumPy only when asked for explicitly."""
+    if use_numpy and not HAS_NUMPY:
+        raise RuntimeError("numpy_not_installed")
+    if use_numpy and len(columns):
+        return _accumulate_numpy(columns)
+    return _accumulate_python(columns)
@@ -0,0 +1,176 @@
+import math
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import MuscleFatigueState, MuscleGroup, WorkoutSession
+from app.services.recovery_engine_v0 import (
+    SEED_SESSION_DATE,
+    coerce_datetime,
+    half_life_hours_for,
+    load_mapped_exercise_volumes,
+    muscle_payload,
+    session_reference_dt,
+)
+
+# fatigue(t) = fatigue_raw * exp(-(t - anchor_at) / half_life), so a new session only needs the
+# stored value decayed to its reference time plus its own muscle volume: O(muscles), not O(sets).
+
+
+def _decay(value: float, muscle_code: str, hours: float) -> float:
+    return value * math.exp(-max(0.0, hours) / half_life_hours_for(muscle_code))
+
+
+def _hours_between(later: datetime, earlier: datetime) -> float:
+    return (later - earlier).total_seconds() / 3600.0
+
+
+def _muscle_volumes_by_date(db_session: Session, session_filters: list) -> Dict[date, Dict[str, float]]:
+    muscle_code_by_id = {str(muscle_id): code for muscle_id, code in db_session.execute(select(MuscleGroup.id, MuscleGroup.code))}
+    mapped_rows, _ = load_mapped_exercise_volumes(db_session, session_filters, aggregate_in_sql=True)
+
+    volumes_by_date: Dict[date, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for _, session_date, exercise_volume, mappings in mapped_rows:
+        for muscle_id, mapping_weight in mappings:
+            muscle_code = muscle_code_by_id.get(muscle_id)
+            if muscle_code is None:
+                continue
+            volumes_by_date[session_date][muscle_code] += exercise_volume * mapping_weight
+    return volumes_by_date
+
+
+def _expected_fatigue_raw(volumes_by_date: Dict[date, Dict[str, float]], at: datetime) -> Dict[str, float]:
+    expected: Dict[str, float] = defaultdict(float)
+    for session_date in sorted(volumes_by_date):
+        hours = _hours_between(at, session_reference_dt(session_date))
+        for muscle_code, volume in volumes_by_date[session_date].items():
+            expected[muscle_code] += _decay(volume, muscle_code, hours)
+    return expected
+
+
+def _ensure_state_rows(db_session: Session, reference_at: datetime, muscle_codes: List[str]) -> None:
+    # Zero rows at the session's reference time fold to exactly its volume; ON CONFLICT DO NOTHING
+    # lets concurrent workers create the same muscle's first row without a primary-key error.
+    dialect_insert = postgresql_insert if db_session.get_bind().dialect.name == "postgresql" else sqlite_insert
+    db_session.execute(
+        dialect_insert(MuscleFatigueState).on_conflict_do_nothing(index_elements=["muscle_code"]),
+        [{"muscle_code": muscle_code, "fatigue_raw": 0.0, "anchor_at": reference_at} for muscle_code in muscle_codes],
+    )
+
+
+def _fold_volumes(db_session: Session, reference_at: datetime, volume_by_code: Dict[str, float]) -> None:
+    _ensure_state_rows(db_session, reference_at, list(volume_by_code))
+    states = {
+        row.muscle_code: row
+        for row in db_session.execute(
+            select(MuscleFatigueState).where(MuscleFatigueState.muscle_code.in_(list(volume_by_code))).with_for_update()
+        ).scalars()
+    }
+    for muscle_code, volume in volume_by_code.items():
+        state = states[muscle_code]
+        anchor_at = coerce_datetime(state.anchor_at, end_of_day=False)
+        hours = _hours_between(reference_at, anchor_at)
+        if hours >= 0:
+            state.fatigue_raw = _decay(state.fatigue_raw, muscle_code, hours) + volume
+            state.anchor_at = reference_at
+        else:
+            # Backdated session: decay it forward to the existing anchor instead.
+            state.fatigue_raw = state.fatigue_raw + _decay(volume, muscle_code, -hours)
+
+
+def apply_session_to_fatigue_state(db_session: Session, session_id) -> None:
+    """Fold one flushed session into muscle_fatigue_state; the caller owns the transaction."""
+    volumes_by_date = _muscle_volumes_by_date(
+        db_session,
+        [WorkoutSession.id == session_id, WorkoutSession.date != SEED_SESSION_DATE],
+    )
+    for session_date, volume_by_code in volumes_by_date.items():
+        if volume_by_code:
+            _fold_volumes(db_session, session_reference_dt(session_date), volume_by_code)
+
+
+def retract_session_from_fatigue_state(db_session: Session, session_id) -> None:
+    """Fold one stored session out again (before it is deleted); the caller owns the transaction."""
+    volumes_by_date = _muscle_volumes_by_date(
+        db_session,
+        [WorkoutSession.id == session_id, WorkoutSession.date != SEED_SESSION_DATE],
+    )
+    for session_date, volume_by_code in volumes_by_date.items():
+        if volume_by_code:
+            # The state is linear in each session's volume, so folding in the negated volume removes it.
+            _fold_volumes(db_session, session_reference_dt(session_date), {code: -volume for code, volume in volume_by_code.items()})
+
+
+def rebuild_fatigue_state(db_session: Session) -> int:
+    """Recompute muscle_fatigue_state from every stored session (backfills, mapping changes)."""
+    db_session.execute(delete(MuscleFatigueState))
+    volumes_by_date = _muscle_volumes_by_date(db_session, [WorkoutSession.date != SEED_SESSION_DATE])
+    if not volumes_by_date:
+        return 0
+
+    anchor_at = session_reference_dt(max(volumes_by_date))
+    expected = _expected_fatigue_raw(volumes_by_date, anchor_at)
+    for muscle_code, fatigue_raw in expected.items():
+        db_session.add(MuscleFatigueState(muscle_code=muscle_code, fatigue_raw=fatigue_raw, anchor_at=anchor_at))
+    return len(expected)
+
+
+def fatigue_raw_at(db_session: Session, at: datetime) -> Dict[str, float]:
+    """
+    Decay stored state to `at`. The state already includes every session up to its anchor,
+    so times before any muscle's anchor cannot be answered and raise ValueError.
+    """
+    fatigue: Dict[str, float] = {}
+    for state in db_session.execute(select(MuscleFatigueState)).scalars():
+        anchor_at = coerce_datetime(state.anchor_at, end_of_day=False)
+        hours = _hours_between(at, anchor_at)
+        if hours < 0:
+            raise ValueError("state_anchor_after_requested_time")
+        fatigue[state.muscle_code] = _decay(state.fatigue_raw, state.muscle_code, hours)
+    return fatigue
+
+
+def compute_recovery_from_state(db_session: Session, *, to_dt: Optional[datetime] = None) -> dict:
+    """
+    Recovery over all history read from muscle_fatigue_state in O(muscles).
+
+    Contributors and unmapped exercises are not materialized, so both lists are empty.
+    Raises ValueError when `to` is before the state's anchor (use the windowed engine for past dates).
+    """
+    resolved_to = coerce_datetime(to_dt, end_of_day=True) or datetime.now(timezone.utc)
+    fatigue = fatigue_raw_at(db_session, resolved_to)
+    muscle_rows = db_session.execute(select(MuscleGroup)).scalars().all()
+    return {
+        "window": {
+            "days": None,
+            "from": None,
+            "to": resolved_to.date().isoformat(),
+        },
+        "muscles": {muscle.code: muscle_payload(muscle, fatigue.get(muscle.code, 0.0), {}) for muscle in muscle_rows},
+        "unmapped_exercises": [],
+    }
+
+
+def check_fatigue_state(db_session: Session, *, at: Optional[datetime] = None, tolerance: float = 0.01) -> List[Dict]:
+    """Compare stored state with a full recompute; returns the muscles that differ by more than tolerance."""
+    anchors = [coerce_datetime(value, end_of_day=False) for value in db_session.execute(select(MuscleFatigueState.anchor_at)).scalars()]
+    resolved_at = coerce_datetime(at, end_of_day=True) or max([datetime.now(timezone.utc), *anchors])
+
+    stored = fatigue_raw_at(db_session, resolved_at)
+    expected = _expected_fatigue_raw(
+        _muscle_volumes_by_date(db_session, [WorkoutSession.date != SEED_SESSION_DATE]),
+        resolved_at,
+    )
+
+    mismatches = []
+    for muscle_code in sorted(set(stored) | set(expected)):
+        stored_value = stored.get(muscle_code, 0.0)
+        expected_value = expected.get(muscle_code, 0.0)
+        if not math.isclose(stored_value, expected_value, rel_tol=1e-9, abs_tol=tolerance):
+            mismatches.append({"muscle_code": muscle_code, "stored": stored_value, "expected": expected_value})
+    return mismatches
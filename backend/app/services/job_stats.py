@@ -0,0 +1,136 @@
+import logging
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.metrics import StageTimings
+from app.models import UploadJobStat
+from app.services.parser import ParsedSession
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_JOB_STAGES = ("load_upload", "file_check", "parse", "persist", "commit")
+
+
+class UploadJobTimings(StageTimings):
+    """Stage timings plus parser output counts for one upload job."""
+
+    __slots__ = ("started_at", "_started", "line_count", "exercise_count", "set_count", "confidence")
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        super().__init__(clock)
+        self.started_at = datetime.now(timezone.utc)
+        self._started = clock()
+        self.line_count: Optional[int] = None
+        self.exercise_count: Optional[int] = None
+        self.set_count: Optional[int] = None
+        self.confidence: Optional[float] = None
+
+    def observe_parsed(self, parsed: ParsedSession) -> None:
+        self.line_count = parsed.line_count
+        self.exercise_count = len(parsed.exercises)
+        self.set_count = parsed.set_count
+        self.confidence = parsed.confidence
+
+    def to_row(
+        self,
+        upload_id: uuid.UUID,
+        parser_version: str,
+        status: str,
+        *,
+        batch_size: int = 1,
+        shared: Optional[StageTimings] = None,
+    ) -> Dict:
+        """
+        Row for upload_job_stats. Batch stages that cover every upload in the batch (shared)
+        are split evenly across the batch.
+        """
+        stage_ms: Dict[str, float] = {name: seconds * 1000.0 for name, seconds in self.stages.items()}
+        total_ms = (self._clock() - self._started) * 1000.0
+        if shared is not None:
+            for name, seconds in shared.stages.items():
+                share_ms = seconds * 1000.0 / batch_size
+                stage_ms[name] = stage_ms.get(name, 0.0) + share_ms
+                total_ms += share_ms
+        return {
+            "id": uuid.uuid4(),
+            "upload_id": upload_id,
+            "parser_version": parser_version,
+            "status": status,
+            "batch_size": batch_size,
+            "started_at": self.started_at,
+            "total_ms": total_ms,
+            **{f"{name}_ms": stage_ms.get(name) for name in UPLOAD_JOB_STAGES},
+            "line_count": self.line_count,
+            "exercise_count": self.exercise_count,
+            "set_count": self.set_count,
+            "confidence": self.confidence,
+        }
+
+
+def record_upload_job_stats(session: Session, rows: List[Dict]) -> None:
+    """Insert and commit stats rows; best effort, a failure is logged and never fails the job."""
+    if not rows:
+        return
+    try:
+        session.execute(insert(UploadJobStat), rows)
+        session.commit()
+    except Exception:
+        session.rollback()
+        logger.warning("upload_job_stats_write_failed rows=%d", len(rows), exc_info=True)
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def summarize_upload_job_stats(db_session: Session, *, since: Optional[datetime] = None) -> List[Dict]:
+    """
+    Per parser_version: job counts, jobs/sec and p50/p95 per stage. jobs_per_sec is per busy
+    second (the sum of total_ms), so idle gaps between arrivals do not lower it.
+    """
+    stmt = select(UploadJobStat)
+    if since is not None:
+        stmt = stmt.where(UploadJobStat.started_at >= since)
+    rows_by_version: Dict[str, List[UploadJobStat]] = defaultdict(list)
+    for row in db_session.execute(stmt.order_by(UploadJobStat.started_at)).scalars():
+        rows_by_version[row.parser_version].append(row)
+
+    summaries = []
+    for parser_version, rows in sorted(rows_by_version.items()):
+        busy_s = sum(row.total_ms for row in rows) / 1000.0
+        stages = {}
+        for name in ("total", *UPLOAD_JOB_STAGES):
+            samples = [value for value in (getattr(row, f"{name}_ms") for row in rows) if value is not None]
+            if samples:
+                stages[name] = {"p50_ms": _percentile(samples, 50), "p95_ms": _percentile(samples, 95), "count": len(samples)}
+        confidences = [row.confidence for row in rows if row.confidence is not None]
+        summaries.append(
+            {
+                "parser_version": parser_version,
+                "jobs": len(rows),
+                "parsed": sum(1 for row in rows if row.status == "parsed"),
+                "failed": sum(1 for row in rows if row.status == "failed"),
+                "jobs_per_sec": len(rows) / busy_s if busy_s > 0 else 0.0,
+                "confidence_p50": _percentile(confidences, 50) if confidences else None,
+                "stages": stages,
+            }
+        )
+    return summaries
+
+
+def describe_upload_job_stat(row: UploadJobStat) -> str:
+    stages = " ".join(
+        f"{name}_ms={getattr(row, f'{name}_ms'):.2f}" for name in UPLOAD_JOB_STAGES if getattr(row, f"{name}_ms") is not None
+    )
+    return (
+        f"upload_job_stats upload_id={row.upload_id} parser_version={row.parser_version} status={row.status} "
+        f"total_ms={row.total_ms:.2f} {stages} lines={row.line_count} exercises={row.exercise_count} "
+        f"sets={row.set_count} confidence={row.confidence}"
+    )
@@ -1,5 +1,7 @@
+import math
 import re
-from typing import Dict, List, Optional
+from array import array
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 
 SUMMARY_LABEL_PATTERNS = (
@@ -12,105 +14,218 @@ SUMMARY_LABEL_PATTERNS = (
     r"\bkg/min\b",
 )
 
+# Compiled once at import; each OCR line is classified a single time by _classify_line.
+_TOP_RANK_RE = re.compile(r"^Top\s*\d+%$", flags=re.IGNORECASE)
+_DATE_RE = re.compile(r"(20\d{2})[.\-/](\d{2})[.\-/](\d{2})")
+_MAX_WEIGHT_RE = re.compile(r"^MAX Weight:", flags=re.IGNORECASE)
+_TOTAL_REPS_RE = re.compile(r"^Total Reps:", flags=re.IGNORECASE)
+_NOT_HEADER_RE = re.compile(
+    "|".join(
+        (
+            r"^[\d.\s]+$",
+            r"\b\d+\s*[xX]\b",
+            *SUMMARY_LABEL_PATTERNS,
+            r"^\d{4}[.\-/]\d{2}[.\-/]\d{2}$",
+        )
+    ),
+    flags=re.IGNORECASE,
+)
+_NAME_CHAR_RE = re.compile(r"[A-Za-z가-힣]")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+_REPS_RE = re.compile(r"(\d+)\s*[xX]")
+_KEYWORD_INT_RES: Dict[str, "re.Pattern[str]"] = {}
+
+LINE_HEADER = "header"
+LINE_MAX_WEIGHT = "max_weight"
+LINE_TOTAL_REPS = "total_reps"
+LINE_REPS = "reps"
+LINE_WEIGHTS = "weights"
+LINE_NOISE = "noise"
+
+# Largest value the "i" set array (and a 32-bit reps column) holds; larger OCR reads are dropped with a warning.
+MAX_REPS = 2 ** (8 * array("i").itemsize - 1) - 1
+
+
+class ParsedExercise:
+    """One exercise's sets as parallel arrays; a missing weight (reps-only sets) is NaN."""
+
+    __slots__ = ("raw_name", "weights", "reps")
+
+    def __init__(self, raw_name: str, weights: "array[float]", reps: "array[int]") -> None:
+        self.raw_name = raw_name
+        self.weights = weights
+        self.reps = reps
+
+    def __len__(self) -> int:
+        return len(self.reps)
+
+    def iter_sets(self) -> Iterator[Tuple[Optional[float], int]]:
+        for weight, reps in zip(self.weights, self.reps):
+            yield (None if math.isnan(weight) else weight), reps
+
+    def to_dict(self) -> Dict:
+        return {"raw_name": self.raw_name, "sets": [{"weight_kg": weight, "reps": reps} for weight, reps in self.iter_sets()]}
+
+
+class ParsedSession:
+    """Parser output consumed by the worker and re-parse paths; to_dict() is the API/test shape."""
+
+    __slots__ = ("summary", "exercises", "confidence", "line_count", "needs_review", "warnings")
+
+    def __init__(
+        self,
+        summary: Dict[str, Optional[object]],
+        exercises: List[ParsedExercise],
+        *,
+        confidence: float,
+        line_count: int,
+        needs_review: bool,
+        warnings: List[str],
+    ) -> None:
+        self.summary = summary
+        self.exercises = exercises
+        self.confidence = confidence
+        self.line_count = line_count
+        self.needs_review = needs_review
+        self.warnings = warnings
+
+    @property
+    def set_count(self) -> int:
+        return sum(len(exercise) for exercise in self.exercises)
+
+    def to_dict(self) -> Dict:
+        return {
+            "summary": dict(self.summary),
+            "exercises": [exercise.to_dict() for exercise in self.exercises],
+            "meta": {
+                "confidence": self.confidence,
+                "line_count": self.line_count,
+                "needs_review": self.needs_review,
+                "warnings": list(self.warnings),
+            },
+        }
+
+
+class _Line(NamedTuple):
+    kind: str
+    text: str
+    numbers: List[float]
+    reps: List[int]
+
 
 def _clean_lines(raw_text: str) -> List[str]:
     lines = []
     for raw in (raw_text or "").splitlines():
-        line = re.sub(r"\s+", " ", raw).strip()
+        # str.split() and re's \s share the same Unicode whitespace definition.
+        line = " ".join(raw.split())
         if not line:
             continue
-        if re.search(r"^Top\s*\d+%$", line, flags=re.IGNORECASE):
+        if _TOP_RANK_RE.search(line):
             continue
         lines.append(line)
     return lines
 
 
 def _parse_date(text: str) -> Optional[str]:
-    m = re.search(r"(20\d{2})[.\-/](\d{2})[.\-/](\d{2})", text)
+    m = _DATE_RE.search(text)
     if not m:
         return None
     return f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
 
 
 def _parse_int_with_keyword(text: str, keyword: str) -> Optional[int]:
-    m = re.search(rf"(\d+)\s*{re.escape(keyword)}", text, flags=re.IGNORECASE)
+    pattern = _KEYWORD_INT_RES.get(keyword)
+    if pattern is None:
+        pattern = re.compile(rf"(\d+)\s*{re.escape(keyword)}", flags=re.IGNORECASE)
+        _KEYWORD_INT_RES[keyword] = pattern
+    m = pattern.search(text)
     if not m:
         return None
     return int(m.group(1))
 
 
+def _is_header_candidate(line: str) -> bool:
+    # Callers have already ruled out "MAX Weight:" / "Total Reps:" lines.
+    return not _NOT_HEADER_RE.search(line) and bool(_NAME_CHAR_RE.search(line))
+
+
 def _looks_like_exercise_header(line: str) -> bool:
-    if re.search(r"^MAX Weight:", line, flags=re.IGNORECASE):
+    if _MAX_WEIGHT_RE.search(line) or _TOTAL_REPS_RE.search(line):
         return False
-    if re.search(r"^Total Reps:", line, flags=re.IGNORECASE):
-        return False
-    if re.fullmatch(r"[\d.\s]+", line):
-        return False
-    if re.search(r"\b\d+\s*[xX]\b", line):
-        return False
-    if any(re.search(p, line, flags=re.IGNORECASE) for p in SUMMARY_LABEL_PATTERNS):
-        return False
-    if re.search(r"^\d{4}[.\-/]\d{2}[.\-/]\d{2}$", line):
-        return False
-    return bool(re.search(r"[A-Za-z가-힣]", line))
+    return _is_header_candidate(line)
 
 
 def _extract_numbers(line: str) -> List[float]:
-    return [float(x) for x in re.findall(r"\d+(?:\.\d+)?", line)]
+    return [float(x) for x in _NUMBER_RE.findall(line)]
 
 
 def _extract_reps(line: str) -> List[int]:
-    return [int(x) for x in re.findall(r"(\d+)\s*[xX]", line)]
+    return [int(x) for x in _REPS_RE.findall(line)]
 
 
-def _parse_exercise_sets(block_lines: List[str], warnings: List[str], name: str) -> List[Dict]:
-    reps_only_mode = any(re.search(r"^Total Reps:", line, flags=re.IGNORECASE) for line in block_lines)
+def _classify_line(line: str) -> _Line:
+    if _MAX_WEIGHT_RE.search(line):
+        return _Line(LINE_MAX_WEIGHT, line, [], [])
+    if _TOTAL_REPS_RE.search(line):
+        return _Line(LINE_TOTAL_REPS, line, [], [])
+    if _is_header_candidate(line):
+        return _Line(LINE_HEADER, line, [], [])
+
+    numbers = _extract_numbers(line)
+    reps = _extract_reps(line)
+    if reps:
+        return _Line(LINE_REPS, line, numbers, reps)
+    if len(numbers) >= 2:
+        return _Line(LINE_WEIGHTS, line, numbers, [])
+    return _Line(LINE_NOISE, line, numbers, [])
+
+
+def _parse_exercise_sets(block: List[_Line], warnings: List[str], name: str) -> Optional[ParsedExercise]:
+    reps_only_mode = any(token.kind == LINE_TOTAL_REPS for token in block)
     if reps_only_mode:
-        reps_values: List[int] = []
-        for line in block_lines:
-            if re.search(r"^Total Reps:", line, flags=re.IGNORECASE):
-                continue
-            if re.search(r"^MAX Weight:", line, flags=re.IGNORECASE):
-                continue
-            if _looks_like_exercise_header(line):
+        reps_values = array("i")
+        out_of_range = False
+        for token in block:
+            if token.kind in (LINE_TOTAL_REPS, LINE_MAX_WEIGHT):
                 continue
-            numbers = _extract_numbers(line)
-            if len(numbers) >= 2:
-                reps_values.extend(int(v) for v in numbers)
+            if len(token.numbers) >= 2:
+                out_of_range = out_of_range or any(v > MAX_REPS for v in token.numbers)
+                reps_values.extend(int(v) for v in token.numbers if v <= MAX_REPS)
+        if out_of_range:
+            warnings.append(f"reps_out_of_range:{name}")
         if len(reps_values) >= 2:
-            return [{"weight_kg": None, "reps": r} for r in reps_values]
+            return ParsedExercise(name, array("d", [math.nan]) * len(reps_values), reps_values)
         warnings.append(f"reps_only_sets_too_short:{name}")
-        return []
+        return None
 
     weight_candidates: List[float] = []
     reps_candidates: List[int] = []
-    for line in block_lines:
-        if re.search(r"^MAX Weight:", line, flags=re.IGNORECASE):
-            continue
-        reps = _extract_reps(line)
-        if reps:
-            reps_candidates = reps
-            continue
-        if _looks_like_exercise_header(line):
-            continue
-        nums = _extract_numbers(line)
-        if len(nums) >= 2:
-            weight_candidates = nums
+    for token in block:
+        if token.kind == LINE_REPS:
+            reps_candidates = token.reps
+        elif token.kind == LINE_WEIGHTS:
+            weight_candidates = token.numbers
 
     if not weight_candidates and not reps_candidates:
-        return []
+        return None
 
     if len(weight_candidates) != len(reps_candidates):
         warnings.append(f"sets_count_mismatch:{name}")
 
     size = min(len(weight_candidates), len(reps_candidates))
-    sets = []
-    for idx in range(size):
-        sets.append({"weight_kg": float(weight_candidates[idx]), "reps": int(reps_candidates[idx])})
-    return sets
+    kept = [index for index in range(size) if reps_candidates[index] <= MAX_REPS]
+    if len(kept) < size:
+        warnings.append(f"reps_out_of_range:{name}")
+    if not kept:
+        return None
+    return ParsedExercise(
+        name,
+        array("d", [weight_candidates[index] for index in kept]),
+        array("i", [reps_candidates[index] for index in kept]),
+    )
 
 
-def parse_fleek_ocr_v1(raw_text: str) -> dict:
+def parse_fleek_ocr_v1_session(raw_text: str) -> ParsedSession:
     lines = _clean_lines(raw_text)
     joined = "\n".join(lines)
 
@@ -126,15 +241,16 @@ def parse_fleek_ocr_v1(raw_text: str) -> dict:
         "intensity_kg_per_min": _parse_int_with_keyword(joined, "kg/min"),
     }
 
-    header_indexes = [i for i, line in enumerate(lines) if _looks_like_exercise_header(line)]
-    exercises: List[dict] = []
+    tokens = [_classify_line(line) for line in lines]
+    header_indexes = [i for i, token in enumerate(tokens) if token.kind == LINE_HEADER]
+    exercises: List[ParsedExercise] = []
     for idx, header_idx in enumerate(header_indexes):
-        name = lines[header_idx]
-        next_idx = header_indexes[idx + 1] if idx + 1 < len(header_indexes) else len(lines)
-        block = lines[header_idx + 1 : next_idx]
-        sets = _parse_exercise_sets(block, warnings, name)
-        if sets:
-            exercises.append({"raw_name": name, "sets": sets})
+        name = tokens[header_idx].text
+        next_idx = header_indexes[idx + 1] if idx + 1 < len(header_indexes) else len(tokens)
+        block = tokens[header_idx + 1 : next_idx]
+        exercise = _parse_exercise_sets(block, warnings, name)
+        if exercise is not None:
+            exercises.append(exercise)
 
     missing_summary = [k for k, v in summary.items() if v is None]
     if missing_summary:
@@ -144,13 +260,15 @@ def parse_fleek_ocr_v1(raw_text: str) -> dict:
     confidence = max(0.05, min(1.0, confidence))
     needs_review = bool(warnings) or len(missing_summary) >= 2
 
-    return {
-        "summary": summary,
-        "exercises": exercises,
-        "meta": {
-            "confidence": round(confidence, 2),
-            "needs_review": needs_review,
-            "warnings": warnings,
-        },
-    }
+    return ParsedSession(
+        summary,
+        exercises,
+        confidence=round(confidence, 2),
+        line_count=len(lines),
+        needs_review=needs_review,
+        warnings=warnings,
+    )
 
+
+def parse_fleek_ocr_v1(raw_text: str) -> dict:
+    return parse_fleek_ocr_v1_session(raw_text).to_dict()
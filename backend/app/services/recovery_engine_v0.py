@@ -1,12 +1,24 @@
 import math
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from datetime import date, datetime, time, timedelta, timezone
 from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.models import Exercise, ExerciseMuscle, ExerciseSet, MuscleGroup, WorkoutSession
+from app.models import (
+    DailyMuscleVolume,
+    DailyUnmappedExercise,
+    Exercise,
+    ExerciseMuscle,
+    ExerciseSet,
+    MuscleGroup,
+    WorkoutSession,
+)
+from app.metrics import StageTimings, count_rows, timed_stage
+from app.services.data_version import MAPPINGS_DATA_VERSION, read_data_version
+from app.services.fatigue_kernel import FatigueColumns, accumulate_decayed_fatigue
 
 # TC-08-B-1 MVP constants
 DEFAULT_WINDOW_DAYS = 7
@@ -14,13 +26,26 @@ SEED_SESSION_DATE = date(1970, 1, 1)
 DEFAULT_HALF_LIFE_HOURS = 48.0
 LEGS_HALF_LIFE_HOURS = 72.0
 
+# Upper bound on sample points per /recovery/series request.
+MAX_SERIES_POINTS = 400
+
 # Fatigue score normalization:
 # fatigue_score = min(100, fatigue_raw / FATIGUE_SCALE)
 # The scale is tuned for common set volumes to avoid all-zero/all-100 outputs.
 FATIGUE_SCALE = 100.0
 
+# Name-keyed fallback mappings are global (seed rows included) and rarely change, so they
+# are cached per process per database and reloaded when the mappings data version moves.
+# Writers that touch exercise_muscles bump that version in the same transaction; parsed
+# uploads only bump the sessions version, so they do not force a reload.
+FALLBACK_MAPPINGS_MAX_DATABASES = 8
+_fallback_mappings_lock = threading.Lock()
+# database url -> (mappings version, raw_name -> muscle_id -> weight), least recently used first
+_fallback_mappings_by_database: "OrderedDict[str, Tuple[int, Dict[str, Dict[str, float]]]]" = OrderedDict()
+
 
-def _coerce_datetime(value: Optional[datetime], *, end_of_day: bool) -> Optional[datetime]:
+def coerce_datetime(value: Optional[datetime], *, end_of_day: bool) -> Optional[datetime]:
+    """Aware UTC datetime for a date/datetime; a bare date maps to its first or last instant."""
     if value is None:
         return None
     if isinstance(value, datetime):
@@ -39,24 +64,267 @@ def _resolve_window(
     to_dt: Optional[datetime] = None,
     days: int = DEFAULT_WINDOW_DAYS,
 ) -> Tuple[datetime, datetime]:
-    resolved_to = _coerce_datetime(to_dt, end_of_day=True) or datetime.now(timezone.utc)
-    resolved_from = _coerce_datetime(from_dt, end_of_day=False) or (resolved_to - timedelta(days=days))
+    resolved_to = coerce_datetime(to_dt, end_of_day=True) or datetime.now(timezone.utc)
+    resolved_from = coerce_datetime(from_dt, end_of_day=False) or (resolved_to - timedelta(days=days))
     if resolved_from > resolved_to:
         raise ValueError("invalid_time_window")
     return resolved_from, resolved_to
 
 
-def _session_reference_dt(session_date: date) -> datetime:
+def _window_session_filters(from_date: date, to_date: date) -> list:
+    return [
+        WorkoutSession.date >= from_date,
+        WorkoutSession.date <= to_date,
+        WorkoutSession.date != SEED_SESSION_DATE,
+    ]
+
+
+def session_reference_dt(session_date: date) -> datetime:
     # session only stores date, so use noon UTC as a stable reference point.
     return datetime.combine(session_date, time(hour=12)).replace(tzinfo=timezone.utc)
 
 
-def _half_life_hours_for(code: str) -> float:
+def half_life_hours_for(code: str) -> float:
+    """Fatigue half-life of a muscle group, in hours."""
     if code == "legs":
         return LEGS_HALF_LIFE_HOURS
     return DEFAULT_HALF_LIFE_HOURS
 
 
+def _database_key(db_session: Session) -> str:
+    return str(db_session.get_bind().url)
+
+
+def invalidate_fallback_mappings(database_url: Optional[str] = None) -> None:
+    """Drop cached name-keyed mappings; writers that do not bump the data version must call this."""
+    with _fallback_mappings_lock:
+        if database_url is None:
+            _fallback_mappings_by_database.clear()
+        else:
+            _fallback_mappings_by_database.pop(database_url, None)
+
+
+def _load_fallback_mappings_by_name(db_session: Session) -> Dict[str, Dict[str, float]]:
+    database_key = _database_key(db_session)
+    data_version = read_data_version(db_session, MAPPINGS_DATA_VERSION)
+    with _fallback_mappings_lock:
+        cached = _fallback_mappings_by_database.get(database_key)
+        if cached is not None and cached[0] == data_version:
+            _fallback_mappings_by_database.move_to_end(database_key)
+            return cached[1]
+
+    rows = db_session.execute(
+        select(Exercise.raw_name, ExerciseMuscle.muscle_id, ExerciseMuscle.weight).join(
+            Exercise, Exercise.id == ExerciseMuscle.exercise_id
+        )
+    ).all()
+    fallback_mappings_by_name: Dict[str, Dict[str, float]] = defaultdict(dict)
+    for raw_name, muscle_id, mapping_weight in rows:
+        m_id = str(muscle_id)
+        prev = fallback_mappings_by_name[str(raw_name)].get(m_id, 0.0)
+        fallback_mappings_by_name[str(raw_name)][m_id] = max(prev, float(mapping_weight))
+
+    loaded = dict(fallback_mappings_by_name)
+    with _fallback_mappings_lock:
+        _fallback_mappings_by_database[database_key] = (data_version, loaded)
+        _fallback_mappings_by_database.move_to_end(database_key)
+        while len(_fallback_mappings_by_database) > FALLBACK_MAPPINGS_MAX_DATABASES:
+            _fallback_mappings_by_database.popitem(last=False)
+    return loaded
+
+
+# (exercise_id, raw_name, session_date, exercise_volume), ordered by session date then exercise id.
+ExerciseVolumeRow = Tuple[str, str, date, float]
+
+
+def _load_exercise_volumes(
+    db_session: Session, window_filters: list, timings: Optional[StageTimings] = None
+) -> List[ExerciseVolumeRow]:
+    # Each exercise row carries its session date through the join, so no per-exercise session lookup is needed.
+    with timed_stage(timings, "exercises_query"):
+        exercise_rows = (
+            db_session.execute(
+                select(Exercise.id, Exercise.raw_name, WorkoutSession.date, Exercise.session_id)
+                .join(WorkoutSession, WorkoutSession.id == Exercise.session_id)
+                .where(*window_filters)
+                .order_by(WorkoutSession.date, Exercise.id)
+            )
+            .all()
+        )
+    if timings is not None:
+        timings.count("sessions", len({row[3] for row in exercise_rows}))
+        timings.count("exercises", len(exercise_rows))
+    if not exercise_rows:
+        return []
+
+    with timed_stage(timings, "sets_query"):
+        set_rows = (
+            db_session.execute(
+                select(ExerciseSet.exercise_id, ExerciseSet.weight_kg, ExerciseSet.reps)
+                .join(Exercise, Exercise.id == ExerciseSet.exercise_id)
+                .join(WorkoutSession, WorkoutSession.id == Exercise.session_id)
+                .where(*window_filters)
+            )
+            .all()
+        )
+    count_rows(timings, "sets", len(set_rows))
+    with timed_stage(timings, "set_aggregation"):
+        exercise_volume_by_id: Dict[str, float] = defaultdict(float)
+        for exercise_id, weight_kg, reps in set_rows:
+            weight = float(weight_kg or 0.0)
+            exercise_volume_by_id[str(exercise_id)] += int(reps or 0) * weight
+
+        return [
+            (str(exercise_id), raw_name, session_date, exercise_volume_by_id.get(str(exercise_id), 0.0))
+            for exercise_id, raw_name, session_date, _ in exercise_rows
+        ]
+
+
+def _load_exercise_volumes_sql(
+    db_session: Session, window_filters: list, timings: Optional[StageTimings] = None
+) -> List[ExerciseVolumeRow]:
+    # Outer join keeps exercises without sets so they still count towards unmapped_exercises.
+    volume = func.coalesce(func.sum(ExerciseSet.reps * func.coalesce(ExerciseSet.weight_kg, 0.0)), 0.0)
+    with timed_stage(timings, "volumes_query"):
+        rows = db_session.execute(
+            select(Exercise.id, Exercise.raw_name, WorkoutSession.date, volume, Exercise.session_id, func.count(ExerciseSet.id))
+            .select_from(Exercise)
+            .join(WorkoutSession, WorkoutSession.id == Exercise.session_id)
+            .outerjoin(ExerciseSet, ExerciseSet.exercise_id == Exercise.id)
+            .where(*window_filters)
+            .group_by(Exercise.id, Exercise.raw_name, WorkoutSession.date, Exercise.session_id)
+            .order_by(WorkoutSession.date, Exercise.id)
+        ).all()
+    if timings is not None:
+        timings.count("sessions", len({row[4] for row in rows}))
+        timings.count("exercises", len(rows))
+        timings.count("sets", sum(row[5] for row in rows))
+    return [(str(exercise_id), raw_name, session_date, float(total or 0.0)) for exercise_id, raw_name, session_date, total, _, _ in rows]
+
+
+# (raw_name, session_date, exercise_volume, [(muscle_id, mapping_weight), ...]) for exercises with volume.
+MappedExerciseRow = Tuple[str, date, float, List[Tuple[str, float]]]
+
+
+def load_mapped_exercise_volumes(
+    db_session: Session,
+    session_filters: list,
+    *,
+    aggregate_in_sql: bool = False,
+    timings: Optional[StageTimings] = None,
+) -> Tuple[List[MappedExerciseRow], Dict[Tuple[date, str], int]]:
+    """
+    Resolve muscle mappings (direct first, then by raw_name) for exercises in sessions matching session_filters.
+
+    Exercises without any mapping are returned as counts keyed by (session_date, raw_name).
+    """
+    if aggregate_in_sql:
+        exercise_rows = _load_exercise_volumes_sql(db_session, session_filters, timings)
+    else:
+        exercise_rows = _load_exercise_volumes(db_session, session_filters, timings)
+    if not exercise_rows:
+        return [], {}
+
+    with timed_stage(timings, "mappings_query"):
+        mapping_rows = (
+            db_session.execute(
+                select(ExerciseMuscle.exercise_id, ExerciseMuscle.muscle_id, ExerciseMuscle.weight)
+                .join(Exercise, Exercise.id == ExerciseMuscle.exercise_id)
+                .join(WorkoutSession, WorkoutSession.id == Exercise.session_id)
+                .where(*session_filters)
+            )
+            .all()
+        )
+        fallback_mappings_by_name = _load_fallback_mappings_by_name(db_session)
+    count_rows(timings, "mappings", len(mapping_rows))
+
+    with timed_stage(timings, "mapping_resolution"):
+        direct_mappings_by_exercise_id: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+        for exercise_id, muscle_id, mapping_weight in mapping_rows:
+            direct_mappings_by_exercise_id[str(exercise_id)].append((str(muscle_id), float(mapping_weight)))
+
+        mapped_rows: List[MappedExerciseRow] = []
+        unmapped_counts: Dict[Tuple[date, str], int] = defaultdict(int)
+        for exercise_id, raw_name, session_date, exercise_volume in exercise_rows:
+            mappings = direct_mappings_by_exercise_id.get(exercise_id)
+            if not mappings:
+                fallback_map = fallback_mappings_by_name.get(raw_name, {})
+                mappings = [(muscle_id, weight) for muscle_id, weight in fallback_map.items()]
+
+            if not mappings:
+                unmapped_counts[(session_date, raw_name)] += 1
+                continue
+
+            if exercise_volume <= 0:
+                continue
+            mapped_rows.append((raw_name, session_date, exercise_volume, mappings))
+    return mapped_rows, unmapped_counts
+
+
+# (raw_name, session_date, volume, mapping_weight, muscle_index)
+MuscleVolumeRow = Tuple[str, date, float, float, int]
+
+
+def _load_muscle_volumes(
+    db_session: Session,
+    muscle_rows: List[MuscleGroup],
+    from_date: date,
+    to_date: date,
+    *,
+    use_rollup: bool = False,
+    aggregate_in_sql: bool = False,
+    timings: Optional[StageTimings] = None,
+) -> Tuple[List[MuscleVolumeRow], Dict[str, int]]:
+    """Per-muscle volumes for sessions dated from_date..to_date plus unmapped exercise counts by name."""
+    unmapped_counts: Dict[str, int] = defaultdict(int)
+    if use_rollup:
+        muscle_index_by_code = {row.code: index for index, row in enumerate(muscle_rows)}
+        day_filters = [
+            DailyMuscleVolume.date >= from_date,
+            DailyMuscleVolume.date <= to_date,
+            DailyMuscleVolume.date != SEED_SESSION_DATE,
+        ]
+        with timed_stage(timings, "rollup_query"):
+            rollup_rows = db_session.execute(
+                select(DailyMuscleVolume.raw_name, DailyMuscleVolume.date, DailyMuscleVolume.volume, DailyMuscleVolume.muscle_code)
+                .where(*day_filters)
+                .order_by(DailyMuscleVolume.date, DailyMuscleVolume.raw_name, DailyMuscleVolume.muscle_code)
+            ).all()
+        count_rows(timings, "rollup_rows", len(rollup_rows))
+        muscle_volumes = [
+            (raw_name, session_date, float(volume), 1.0, muscle_index_by_code[muscle_code])
+            for raw_name, session_date, volume, muscle_code in rollup_rows
+            if muscle_code in muscle_index_by_code
+        ]
+        with timed_stage(timings, "unmapped_query"):
+            unmapped_rows = db_session.execute(
+                select(DailyUnmappedExercise.raw_name, func.sum(DailyUnmappedExercise.exercise_count))
+                .where(
+                    DailyUnmappedExercise.date >= from_date,
+                    DailyUnmappedExercise.date <= to_date,
+                    DailyUnmappedExercise.date != SEED_SESSION_DATE,
+                )
+                .group_by(DailyUnmappedExercise.raw_name)
+            ).all()
+        for raw_name, count in unmapped_rows:
+            unmapped_counts[raw_name] += int(count or 0)
+        return muscle_volumes, unmapped_counts
+
+    muscle_index_by_id = {str(row.id): index for index, row in enumerate(muscle_rows)}
+    mapped_rows, unmapped_by_date = load_mapped_exercise_volumes(
+        db_session, _window_session_filters(from_date, to_date), aggregate_in_sql=aggregate_in_sql, timings=timings
+    )
+    muscle_volumes = []
+    for raw_name, session_date, exercise_volume, mappings in mapped_rows:
+        for muscle_id, mapping_weight in mappings:
+            muscle_index = muscle_index_by_id.get(muscle_id)
+            if muscle_index is not None:
+                muscle_volumes.append((raw_name, session_date, exercise_volume, mapping_weight, muscle_index))
+    for (_, raw_name), count in unmapped_by_date.items():
+        unmapped_counts[raw_name] += count
+    return muscle_volumes, unmapped_counts
+
+
 def _status_color(recovery: float) -> str:
     if recovery >= 70:
         return "green"
@@ -70,12 +338,36 @@ def _top_contributors(contrib_map: Dict[str, float], limit: int = 2) -> List[Dic
     return [{"raw_name": name, "contribution": round(value, 2)} for name, value in ordered]
 
 
+def _fatigue_scores(fatigue_raw: float) -> dict:
+    fatigue_score = min(100.0, fatigue_raw / FATIGUE_SCALE)
+    recovery = max(0.0, min(100.0, 100.0 - fatigue_score))
+    return {
+        "fatigue_raw": round(fatigue_raw, 2),
+        "fatigue": round(fatigue_score, 2),
+        "recovery": round(recovery, 2),
+        "status": _status_color(recovery),
+    }
+
+
+def muscle_payload(muscle: MuscleGroup, fatigue_raw: float, contributors: Dict[str, float]) -> dict:
+    """One muscle's entry in a recovery response."""
+    return {
+        "name": muscle.name,
+        **_fatigue_scores(fatigue_raw),
+        "contributors": _top_contributors(contributors, limit=2),
+    }
+
+
 def compute_recovery_v0(
     db_session: Session,
     *,
     from_dt: Optional[datetime] = None,
     to_dt: Optional[datetime] = None,
     days: int = DEFAULT_WINDOW_DAYS,
+    aggregate_in_sql: bool = False,
+    use_numpy: bool = False,
+    use_rollup: bool = False,
+    timings: Optional[StageTimings] = None,
 ) -> dict:
     """
     Compute per-muscle fatigue/recovery using sessions->exercises->sets and exercise_muscles weights.
@@ -86,128 +378,147 @@ def compute_recovery_v0(
     - fatigue_raw = sum(muscle_volume * exp(-delta_hours / half_life_hours))
     - fatigue_score = min(100, fatigue_raw / FATIGUE_SCALE)
     - recovery = clamp(0, 100 - fatigue_score)
+
+    aggregate_in_sql=True sums set volumes with a single GROUP BY query instead of
+    loading exercise and set rows; the result is identical.
+    use_numpy=True selects the vectorized decay kernel (requires NumPy); results match the Python loop.
+    use_rollup=True reads pre-mapped per-day volumes from daily_muscle_volume and skips the
+    sessions/exercises/sets joins; the rollup must be maintained (see app.services.daily_volume).
+    timings, when given, collects per-stage durations and row counts (app.metrics).
     """
     window_from, window_to = _resolve_window(from_dt=from_dt, to_dt=to_dt, days=days)
     from_date = window_from.date()
     to_date = window_to.date()
 
-    muscle_rows = db_session.execute(select(MuscleGroup)).scalars().all()
-    muscle_by_id = {str(row.id): row for row in muscle_rows}
+    with timed_stage(timings, "muscles_query"):
+        muscle_rows = db_session.execute(select(MuscleGroup)).scalars().all()
+    columns = FatigueColumns(half_lives=[half_life_hours_for(row.code) for row in muscle_rows])
+    contributor_index_by_name: Dict[str, int] = {}
 
-    session_rows = (
-        db_session.execute(
-            select(WorkoutSession).where(
-                WorkoutSession.date >= from_date,
-                WorkoutSession.date <= to_date,
-                WorkoutSession.date != SEED_SESSION_DATE,
-            )
-        )
-        .scalars()
-        .all()
+    muscle_volumes, unmapped_counts = _load_muscle_volumes(
+        db_session, muscle_rows, from_date, to_date, use_rollup=use_rollup, aggregate_in_sql=aggregate_in_sql, timings=timings
     )
+    with timed_stage(timings, "volume_aggregation"):
+        for raw_name, session_date, volume, mapping_weight, muscle_index in muscle_volumes:
+            if raw_name not in contributor_index_by_name:
+                contributor_index_by_name[raw_name] = len(columns.contributor_names)
+                columns.contributor_names.append(raw_name)
+            columns.volumes.append(volume)
+            columns.weights.append(mapping_weight)
+            columns.delta_hours.append(max(0.0, (window_to - session_reference_dt(session_date)).total_seconds() / 3600.0))
+            columns.muscle_idx.append(muscle_index)
+            columns.contributor_idx.append(contributor_index_by_name[raw_name])
+
+    with timed_stage(timings, "decay"):
+        totals = accumulate_decayed_fatigue(columns, use_numpy=use_numpy)
+    with timed_stage(timings, "response_shaping"):
+        muscles = {
+            muscle.code: muscle_payload(muscle, totals.fatigue_raw[muscle_index], totals.contributors[muscle_index])
+            for muscle_index, muscle in enumerate(muscle_rows)
+        }
+        unmapped_exercises = [{"raw_name": name, "count": count} for name, count in sorted(unmapped_counts.items())]
 
-    fatigue_raw_by_code: Dict[str, float] = defaultdict(float)
-    contributors_by_code: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
-    unmapped_counts: Dict[str, int] = defaultdict(int)
-
-    session_ids = [row.id for row in session_rows]
-    if session_ids:
-        exercise_rows = db_session.execute(select(Exercise).where(Exercise.session_id.in_(session_ids))).scalars().all()
-    else:
-        exercise_rows = []
-    exercise_ids = [row.id for row in exercise_rows]
-
-    if exercise_ids:
-        set_rows = db_session.execute(select(ExerciseSet).where(ExerciseSet.exercise_id.in_(exercise_ids))).scalars().all()
-        mapping_rows = (
-            db_session.execute(
-                select(ExerciseMuscle.exercise_id, ExerciseMuscle.muscle_id, ExerciseMuscle.weight, Exercise.raw_name).join(
-                    Exercise, Exercise.id == ExerciseMuscle.exercise_id
-                )
-            )
-            .all()
-        )
-    else:
-        set_rows = []
-        mapping_rows = []
-
-    exercise_volume_by_id: Dict[str, float] = defaultdict(float)
-    for set_row in set_rows:
-        weight = float(set_row.weight_kg or 0.0)
-        reps = int(set_row.reps or 0)
-        exercise_volume_by_id[str(set_row.exercise_id)] += reps * weight
-
-    session_date_by_exercise_id: Dict[str, date] = {}
-    exercise_name_by_id: Dict[str, str] = {}
-    for exercise in exercise_rows:
-        exercise_id = str(exercise.id)
-        session_date = next((row.date for row in session_rows if row.id == exercise.session_id), None)
-        if session_date is None:
-            continue
-        session_date_by_exercise_id[exercise_id] = session_date
-        exercise_name_by_id[exercise_id] = exercise.raw_name
-
-    direct_mappings_by_exercise_id: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
-    fallback_mappings_by_name: Dict[str, Dict[str, float]] = defaultdict(dict)
-    for exercise_id, muscle_id, mapping_weight, raw_name in mapping_rows:
-        e_id = str(exercise_id)
-        m_id = str(muscle_id)
-        direct_mappings_by_exercise_id[e_id].append((m_id, float(mapping_weight)))
-        prev = fallback_mappings_by_name[str(raw_name)].get(m_id, 0.0)
-        fallback_mappings_by_name[str(raw_name)][m_id] = max(prev, float(mapping_weight))
-
-    for exercise in exercise_rows:
-        exercise_id = str(exercise.id)
-        raw_name = exercise.raw_name
-        session_date = session_date_by_exercise_id.get(exercise_id)
-        if session_date is None:
-            continue
-
-        mappings = direct_mappings_by_exercise_id.get(exercise_id)
-        if not mappings:
-            fallback_map = fallback_mappings_by_name.get(raw_name, {})
-            mappings = [(muscle_id, weight) for muscle_id, weight in fallback_map.items()]
-
-        if not mappings:
-            unmapped_counts[raw_name] += 1
-            continue
+    return {
+        "window": {
+            "days": days,
+            "from": from_date.isoformat(),
+            "to": to_date.isoformat(),
+        },
+        "muscles": muscles,
+        "unmapped_exercises": unmapped_exercises,
+    }
 
-        exercise_volume = exercise_volume_by_id.get(exercise_id, 0.0)
-        if exercise_volume <= 0:
-            continue
 
-        delta_hours = max(0.0, (window_to - _session_reference_dt(session_date)).total_seconds() / 3600.0)
-        for muscle_id, mapping_weight in mappings:
-            muscle = muscle_by_id.get(muscle_id)
-            if muscle is None:
-                continue
-            half_life = _half_life_hours_for(muscle.code)
-            decayed = (exercise_volume * float(mapping_weight)) * math.exp(-delta_hours / half_life)
-            fatigue_raw_by_code[muscle.code] += decayed
-            contributors_by_code[muscle.code][raw_name] += decayed
-
-    muscles = {}
-    for muscle in muscle_rows:
-        fatigue_raw = fatigue_raw_by_code.get(muscle.code, 0.0)
-        fatigue_score = min(100.0, fatigue_raw / FATIGUE_SCALE)
-        recovery = max(0.0, min(100.0, 100.0 - fatigue_score))
-        muscles[muscle.code] = {
-            "name": muscle.name,
-            "fatigue_raw": round(fatigue_raw, 2),
-            "fatigue": round(fatigue_score, 2),
-            "recovery": round(recovery, 2),
-            "status": _status_color(recovery),
-            "contributors": _top_contributors(contributors_by_code.get(muscle.code, {}), limit=2),
-        }
+def compute_recovery_series(
+    db_session: Session,
+    *,
+    from_date: date,
+    to_date: date,
+    step_days: int = 1,
+    days: int = DEFAULT_WINDOW_DAYS,
+    use_rollup: bool = False,
+    timings: Optional[StageTimings] = None,
+) -> dict:
+    """
+    Per-muscle fatigue/recovery every step_days from from_date through to_date.
 
-    unmapped_exercises = [{"raw_name": name, "count": count} for name, count in sorted(unmapped_counts.items())]
+    Each point equals compute_recovery_v0(to_dt=point, days=days) without contributors.
+    Sets are loaded once for the whole range; points are visited in order and each muscle's
+    decayed sum is rolled forward: decay by exp(-step / half_life), add sessions entering the
+    window, subtract sessions leaving it. Cost is O(sessions + points * muscles).
+    use_rollup and timings behave as in compute_recovery_v0.
+    """
+    if from_date > to_date or step_days < 1:
+        raise ValueError("invalid_time_window")
+    point_count = (to_date - from_date).days // step_days + 1
+    if point_count > MAX_SERIES_POINTS:
+        raise ValueError("too_many_series_points")
+
+    with timed_stage(timings, "muscles_query"):
+        muscle_rows = db_session.execute(select(MuscleGroup)).scalars().all()
+    half_lives = [half_life_hours_for(row.code) for row in muscle_rows]
+
+    muscle_volumes, _ = _load_muscle_volumes(
+        db_session,
+        muscle_rows,
+        from_date - timedelta(days=days),
+        to_date,
+        use_rollup=use_rollup,
+        aggregate_in_sql=True,
+        timings=timings,
+    )
+    with timed_stage(timings, "volume_aggregation"):
+        volumes_by_date: Dict[date, List[float]] = {}
+        for _, session_date, volume, mapping_weight, muscle_index in muscle_volumes:
+            volumes_by_date.setdefault(session_date, [0.0] * len(muscle_rows))[muscle_index] += volume * mapping_weight
+    session_dates = sorted(volumes_by_date)
+
+    def decayed(session_date: date, at: datetime) -> List[float]:
+        hours = (at - session_reference_dt(session_date)).total_seconds() / 3600.0
+        return [
+            volume * math.exp(-hours / half_life) if volume else 0.0
+            for volume, half_life in zip(volumes_by_date[session_date], half_lives)
+        ]
+
+    step_factors = [math.exp(-step_days * 24.0 / half_life) for half_life in half_lives]
+    point_dates = [from_date + timedelta(days=point_index * step_days) for point_index in range(point_count)]
+    fatigue_by_point: List[List[float]] = []
+    with timed_stage(timings, "decay"):
+        fatigue_raw = [0.0] * len(muscle_rows)
+        entered = left = 0
+        for point_date in point_dates:
+            at = coerce_datetime(point_date, end_of_day=True)
+            fatigue_raw = [value * factor for value, factor in zip(fatigue_raw, step_factors)]
+            while entered < len(session_dates) and session_dates[entered] <= point_date:
+                fatigue_raw = [value + added for value, added in zip(fatigue_raw, decayed(session_dates[entered], at))]
+                entered += 1
+            window_start = point_date - timedelta(days=days)
+            while left < entered and session_dates[left] < window_start:
+                fatigue_raw = [value - removed for value, removed in zip(fatigue_raw, decayed(session_dates[left], at))]
+                left += 1
+            if left == entered:
+                # Empty window: drop accumulated rounding error instead of carrying it forward.
+                fatigue_raw = [0.0] * len(muscle_rows)
+            fatigue_by_point.append(fatigue_raw)
+
+    with timed_stage(timings, "response_shaping"):
+        points = [
+            {
+                "date": point_date.isoformat(),
+                "muscles": {
+                    muscle.code: _fatigue_scores(max(0.0, point_fatigue[muscle_index]))
+                    for muscle_index, muscle in enumerate(muscle_rows)
+                },
+            }
+            for point_date, point_fatigue in zip(point_dates, fatigue_by_point)
+        ]
 
     return {
         "window": {
             "days": days,
             "from": from_date.isoformat(),
             "to": to_date.isoformat(),
+            "step_days": step_days,
         },
-        "muscles": muscles,
-        "unmapped_exercises": unmapped_exercises,
+        "points": points,
     }
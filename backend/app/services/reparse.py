@@ -0,0 +1,232 @@
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.models import Exercise, ExerciseMuscle, ExerciseSet, Upload, WorkoutSession
+from app.services.daily_volume import apply_session_to_daily_volume, retract_session_from_daily_volume
+from app.services.data_version import MAPPINGS_DATA_VERSION, bump_data_version
+from app.services.fatigue_state import apply_session_to_fatigue_state, retract_session_from_fatigue_state
+from app.services.parser import ParsedSession, parse_fleek_ocr_v1_session
+from app.workers.process_upload import _needs_review_message, _save_parsed_session
+
+# (date, calories, duration, volume, ((raw_name, ((weight_kg, reps), ...)), ...))
+SessionSnapshot = Tuple
+
+# pending/processing uploads belong to a live worker job, so they are only reparsed on request.
+DEFAULT_REPARSE_STATUSES = ("parsed", "failed")
+
+
+@dataclass
+class ReparseReport:
+    scanned: int = 0
+    unchanged: int = 0
+    changed: int = 0
+    failed: int = 0
+    elapsed_s: float = 0.0
+    parse_s: float = 0.0
+    persist_s: float = 0.0
+    last_upload_id: Optional[str] = None
+    # Dry run only: (upload_id, old snapshots, new snapshots or failure message).
+    diffs: List[Tuple[str, List[SessionSnapshot], object]] = field(default_factory=list)
+
+    @property
+    def uploads_per_sec(self) -> float:
+        return self.scanned / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+def _snapshot_from_parsed(parsed: ParsedSession) -> SessionSnapshot:
+    summary = parsed.summary
+    parsed_date = summary.get("date")
+    exercises = tuple((exercise.raw_name.strip(), tuple(exercise.iter_sets())) for exercise in parsed.exercises)
+    return (
+        date.fromisoformat(parsed_date) if parsed_date else None,
+        summary.get("calories_kcal"),
+        summary.get("duration_min"),
+        summary.get("volume_kg"),
+        exercises,
+    )
+
+
+def _load_existing_snapshots(db_session: Session, upload_ids: List[uuid.UUID]) -> Dict[uuid.UUID, List[SessionSnapshot]]:
+    """Current sessions of the given uploads in snapshot form, with three queries per chunk."""
+    sessions = db_session.execute(
+        select(WorkoutSession).where(WorkoutSession.upload_id.in_(upload_ids)).order_by(WorkoutSession.date)
+    ).scalars().all()
+    session_ids = [row.id for row in sessions]
+    exercises = []
+    sets_by_exercise: Dict[uuid.UUID, List[Tuple]] = defaultdict(list)
+    if session_ids:
+        exercises = db_session.execute(
+            select(Exercise).where(Exercise.session_id.in_(session_ids)).order_by(Exercise.order_index)
+        ).scalars().all()
+        set_rows = db_session.execute(
+            select(ExerciseSet.exercise_id, ExerciseSet.weight_kg, ExerciseSet.reps)
+            .join(Exercise, Exercise.id == ExerciseSet.exercise_id)
+            .where(Exercise.session_id.in_(session_ids))
+            .order_by(ExerciseSet.set_index)
+        ).all()
+        for exercise_id, weight_kg, reps in set_rows:
+            sets_by_exercise[exercise_id].append((None if weight_kg is None else float(weight_kg), int(reps)))
+
+    exercises_by_session: Dict[uuid.UUID, List[Tuple]] = defaultdict(list)
+    for exercise in exercises:
+        exercises_by_session[exercise.session_id].append((exercise.raw_name, tuple(sets_by_exercise[exercise.id])))
+
+    snapshots: Dict[uuid.UUID, List[SessionSnapshot]] = defaultdict(list)
+    for row in sessions:
+        snapshots[row.upload_id].append(
+            (row.date, row.calories_kcal, row.duration_min, row.volume_kg, tuple(exercises_by_session[row.id]))
+        )
+    return snapshots
+
+
+def _delete_upload_sessions(db_session: Session, upload_id: uuid.UUID) -> None:
+    session_ids = select(WorkoutSession.id).where(WorkoutSession.upload_id == upload_id)
+    exercise_ids = select(Exercise.id).where(Exercise.session_id.in_(session_ids))
+    db_session.execute(delete(ExerciseSet).where(ExerciseSet.exercise_id.in_(exercise_ids)))
+    db_session.execute(delete(ExerciseMuscle).where(ExerciseMuscle.exercise_id.in_(exercise_ids)))
+    db_session.execute(delete(Exercise).where(Exercise.session_id.in_(session_ids)))
+    db_session.execute(delete(WorkoutSession).where(WorkoutSession.upload_id == upload_id))
+
+
+def _replace_upload_sessions(db_session: Session, upload: Upload, parsed: Optional[ParsedSession]) -> None:
+    # Fatigue state and the rollup move with the sessions in the same transaction, so readers
+    # and resumed runs never see them count a deleted session.
+    old_session_ids = db_session.execute(select(WorkoutSession.id).where(WorkoutSession.upload_id == upload.id)).scalars().all()
+    for session_id in old_session_ids:
+        retract_session_from_fatigue_state(db_session, session_id)
+        retract_session_from_daily_volume(db_session, session_id)
+    _delete_upload_sessions(db_session, upload.id)
+    if parsed is not None:
+        workout_session = _save_parsed_session(db_session, upload, parsed)
+        apply_session_to_fatigue_state(db_session, workout_session.id)
+        apply_session_to_daily_volume(db_session, workout_session.id)
+
+
+def _parse_or_failure(text: str) -> Union[ParsedSession, str]:
+    # Module-level so process pools can pickle it; a parser crash becomes that upload's failure.
+    try:
+        return parse_fleek_ocr_v1_session(text)
+    except Exception as exc:
+        return str(exc)[:500] or type(exc).__name__
+
+
+def _parse_texts(texts: List[str], executor: Optional[Executor]) -> List[Union[ParsedSession, str]]:
+    if executor is None:
+        return [_parse_or_failure(text) for text in texts]
+    return list(executor.map(_parse_or_failure, texts, chunksize=max(1, len(texts) // 32)))
+
+
+def _iter_upload_chunks(
+    db_session: Session,
+    chunk_size: int,
+    start_after: Optional[uuid.UUID],
+    statuses: Sequence[str],
+):
+    # Keyset chunks on the primary key; each chunk query finishes before the chunk's writes commit.
+    last_id = start_after
+    while True:
+        stmt = select(Upload).where(Upload.ocr_text_raw.is_not(None))
+        stmt = stmt.where(Upload.status.in_(list(statuses)))
+        if last_id is not None:
+            stmt = stmt.where(Upload.id > last_id)
+        chunk = db_session.execute(stmt.order_by(Upload.id).limit(chunk_size)).scalars().all()
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1].id
+
+
+def reparse_uploads(
+    db_session: Session,
+    *,
+    parser_version: str,
+    chunk_size: int = 200,
+    executor: Optional[Executor] = None,
+    start_after: Optional[uuid.UUID] = None,
+    statuses: Optional[Sequence[str]] = None,
+    dry_run: bool = False,
+    on_chunk_committed: Optional[Callable[[ReparseReport], None]] = None,
+) -> ReparseReport:
+    """
+    Re-run the parser over stored OCR text and replace each upload's sessions.
+
+    Every chunk commits once, with one savepoint per upload, and on_chunk_committed runs after
+    each commit (checkpointing). Each replaced session is folded out of fatigue state and the daily
+    volume rollup, and its replacement folded in, inside the same savepoint. With dry_run nothing
+    is written; changed uploads are collected in report.diffs. statuses defaults to DEFAULT_REPARSE_STATUSES;
+    pending/processing uploads are only touched when passed explicitly.
+    """
+    report = ReparseReport()
+    started = time.perf_counter()
+    statuses = DEFAULT_REPARSE_STATUSES if statuses is None else statuses
+    for chunk in _iter_upload_chunks(db_session, chunk_size, start_after, statuses):
+        parse_started = time.perf_counter()
+        parsed_rows = _parse_texts([upload.ocr_text_raw for upload in chunk], executor)
+        report.parse_s += time.perf_counter() - parse_started
+
+        persist_started = time.perf_counter()
+        existing = _load_existing_snapshots(db_session, [upload.id for upload in chunk])
+        pending: List[Tuple[Upload, Union[ParsedSession, str], Optional[str]]] = []
+        for upload, parsed in zip(chunk, parsed_rows):
+            report.scanned += 1
+            failure = parsed if isinstance(parsed, str) else _needs_review_message(parsed)
+            new_state = failure
+            if failure is None:
+                try:
+                    new_state = [_snapshot_from_parsed(parsed)]
+                except ValueError as exc:
+                    failure = new_state = str(exc)[:500]
+            old_state = existing.get(upload.id, [])
+            if failure is None and new_state == old_state and upload.status == "parsed":
+                report.unchanged += 1
+                if not dry_run:
+                    upload.parser_version = parser_version
+            elif dry_run:
+                report.diffs.append((str(upload.id), old_state, new_state))
+                report.changed += 1
+            else:
+                pending.append((upload, parsed, failure))
+
+        if pending:
+            # Bump first: readers see the new version as soon as this chunk commits, and as the
+            # first DML it makes pysqlite open the transaction before any SAVEPOINT. Replaced
+            # sessions take their exercise_muscles rows with them, so mappings move too.
+            bump_data_version(db_session)
+            bump_data_version(db_session, MAPPINGS_DATA_VERSION)
+        for upload, parsed, failure in pending:
+            upload.parser_version = parser_version
+            if failure is None:
+                try:
+                    with db_session.begin_nested():
+                        _replace_upload_sessions(db_session, upload, parsed)
+                except Exception as exc:
+                    failure = str(exc)[:500] or "unknown_error"
+            else:
+                _replace_upload_sessions(db_session, upload, None)
+
+            if failure is None:
+                upload.status = "parsed"
+                upload.error_message = None
+                report.changed += 1
+            else:
+                upload.status = "failed"
+                upload.error_message = failure
+                report.failed += 1
+
+        report.last_upload_id = str(chunk[-1].id)
+        if not dry_run:
+            db_session.commit()
+        report.persist_s += time.perf_counter() - persist_started
+        if on_chunk_committed is not None:
+            on_chunk_committed(report)
+
+    report.elapsed_s = time.perf_counter() - started
+    return report
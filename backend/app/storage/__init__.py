@@ -1,5 +1,4 @@
-from app.storage.base import StorageBackend
+from app.storage.base import StagedFile, StorageBackend, StoredFile, UploadTooLargeError
 from app.storage.local import LocalStorageBackend
 
-__all__ = ["StorageBackend", "LocalStorageBackend"]
-
+__all__ = ["StorageBackend", "StagedFile", "StoredFile", "UploadTooLargeError", "LocalStorageBackend"]
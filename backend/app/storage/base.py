@@ -1,8 +1,95 @@
+import hashlib
+import os
+import tempfile
 from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Optional
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    pass
+
+
+class StoredFile(NamedTuple):
+    path: str
+    size_bytes: int
+    sha256: str
+
+
+class StagedFile(NamedTuple):
+    temp_path: str
+    size_bytes: int
+    sha256: str
 
 
 class StorageBackend(ABC):
+    # Directory for staged temp files; None means the system temp dir.
+    staging_dir: Optional[Path] = None
+
     @abstractmethod
     def save(self, upload_id: str, original_filename: str, file_bytes: bytes) -> str:
         raise NotImplementedError
 
+    def stage_stream(
+        self,
+        upload_id: str,
+        stream: BinaryIO,
+        *,
+        max_bytes: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> StagedFile:
+        """
+        Copy a file-like body to a temp file in chunks, hashing as it goes.
+
+        The content hash is known before anything is committed, so callers can
+        deduplicate and discard() instead of promote().
+        """
+        hasher = hashlib.sha256()
+        size_bytes = 0
+        fd, temp_name = tempfile.mkstemp(prefix=f".{upload_id}.", suffix=".part", dir=self.staging_dir)
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                while True:
+                    chunk = stream.read(chunk_size)
+                    if not chunk:
+                        break
+                    size_bytes += len(chunk)
+                    if max_bytes is not None and size_bytes > max_bytes:
+                        raise UploadTooLargeError("upload_too_large")
+                    hasher.update(chunk)
+                    temp_file.write(chunk)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        return StagedFile(temp_path=temp_name, size_bytes=size_bytes, sha256=hasher.hexdigest())
+
+    def promote(self, staged: StagedFile, upload_id: str, original_filename: str) -> str:
+        """Move a staged file to its permanent location and return the storage path."""
+        # Backends without a native move fall back to buffering the staged file into save().
+        try:
+            return self.save(upload_id, original_filename, Path(staged.temp_path).read_bytes())
+        finally:
+            self.discard(staged)
+
+    def discard(self, staged: StagedFile) -> None:
+        Path(staged.temp_path).unlink(missing_ok=True)
+
+    def save_stream(
+        self,
+        upload_id: str,
+        original_filename: str,
+        stream: BinaryIO,
+        *,
+        max_bytes: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> StoredFile:
+        """Store a file-like body without reading it into memory all at once."""
+        staged = self.stage_stream(upload_id, stream, max_bytes=max_bytes, chunk_size=chunk_size)
+        try:
+            path = self.promote(staged, upload_id, original_filename)
+        except BaseException:
+            self.discard(staged)
+            raise
+        return StoredFile(path=path, size_bytes=staged.size_bytes, sha256=staged.sha256)
@@ -1,17 +1,28 @@
+import os
 from pathlib import Path
 
-from app.storage.base import StorageBackend
+from app.storage.base import StagedFile, StorageBackend
 
 
 class LocalStorageBackend(StorageBackend):
     def __init__(self, base_dir: str) -> None:
         self.base_dir = Path(base_dir).resolve()
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # Stage next to the final files so promote() is a same-filesystem atomic rename.
+        self.staging_dir = self.base_dir
 
-    def save(self, upload_id: str, original_filename: str, file_bytes: bytes) -> str:
+    def _target_path(self, upload_id: str, original_filename: str) -> Path:
         ext = Path(original_filename or "").suffix
         safe_ext = "".join(ch for ch in ext if ch.isalnum() or ch == ".")
-        file_path = self.base_dir / f"{upload_id}{safe_ext}"
+        return self.base_dir / f"{upload_id}{safe_ext}"
+
+    def save(self, upload_id: str, original_filename: str, file_bytes: bytes) -> str:
+        file_path = self._target_path(upload_id, original_filename)
         file_path.write_bytes(file_bytes)
         return str(file_path)
 
+    def promote(self, staged: StagedFile, upload_id: str, original_filename: str) -> str:
+        # Readers never observe a partially written upload.
+        file_path = self._target_path(upload_id, original_filename)
+        os.replace(staged.temp_path, file_path)
+        return str(file_path)
@@ -1,17 +1,230 @@
+import argparse
+import logging
 import os
+import signal
+import socket
+import sys
+import threading
+import traceback
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Tuple
 
 from redis import Redis
-from rq import Queue, SimpleWorker
+from rq import Queue, SimpleWorker, Worker
+from rq.defaults import DEFAULT_RESULT_TTL
+from rq.exceptions import DequeueTimeout
+from rq.executions import Execution
+from rq.job import Job, JobStatus
+from rq.results import Result
+from rq.worker_pool import WorkerPool
+
+from app.database import dispose_engines, get_engine, resolve_database_url
+from app.queue_client import UPLOAD_JOB_FUNC
+from app.workers.process_upload import process_upload_batch
+
+logger = logging.getLogger(__name__)
+
+# Started-registry entries outlive the job timeout by this much before RQ treats the job as abandoned.
+STARTED_TTL_GRACE_S = 60
+
+
+def _drain_jobs(queue: Queue, batch_size: int, poll_timeout: int) -> List[Job]:
+    """Block for the first job, then take whatever else is already queued, up to batch_size."""
+    try:
+        first = Queue.dequeue_any([queue], poll_timeout, connection=queue.connection)
+    except DequeueTimeout:
+        return []
+    jobs = [first[0]] if first else []
+    while jobs and len(jobs) < batch_size:
+        dequeued = Queue.dequeue_any([queue], None, connection=queue.connection)
+        if dequeued is None:
+            break
+        jobs.append(dequeued[0])
+    return jobs
+
+
+def _start_jobs(queue: Queue, jobs: List[Job], worker_name: str) -> List[Execution]:
+    # Same bookkeeping as an RQ worker: STARTED status plus a StartedJobRegistry entry, so jobs
+    # lost with a dead process expire into the FailedJobRegistry instead of vanishing.
+    executions = []
+    with queue.connection.pipeline() as pipe:
+        for job in jobs:
+            job.prepare_for_execution(worker_name, pipeline=pipe)
+            ttl = (job.timeout or Queue.DEFAULT_TIMEOUT) + STARTED_TTL_GRACE_S
+            executions.append(Execution.create(job, ttl=ttl, pipeline=pipe, worker_name=worker_name))
+        pipe.execute()
+    return executions
+
+
+def _finish_jobs(
+    queue: Queue,
+    jobs: List[Job],
+    executions: List[Execution],
+    outcomes: List[Tuple[Any, Optional[str]]],
+    started_at: datetime,
+    worker_name: str,
+) -> None:
+    ended_at = datetime.now(timezone.utc)
+    with queue.connection.pipeline() as pipe:
+        for job, execution, (return_value, error) in zip(jobs, executions, outcomes):
+            execution.delete(job, pipe)
+            if error is not None:
+                job.set_status(JobStatus.FAILED, pipeline=pipe)
+                job.failed_job_registry.add(job, ttl=job.failure_ttl, exc_string=error, pipeline=pipe)
+                Result.create_failure(
+                    job,
+                    job.failure_ttl,
+                    exc_string=error,
+                    worker_name=worker_name,
+                    pipeline=pipe,
+                    execution_id=execution.id,
+                    execution_started_at=started_at,
+                    execution_ended_at=ended_at,
+                )
+            else:
+                result_ttl = job.get_result_ttl(DEFAULT_RESULT_TTL)
+                job.set_status(JobStatus.FINISHED, pipeline=pipe)
+                if result_ttl != 0:
+                    job.finished_job_registry.add(job, ttl=result_ttl, pipeline=pipe)
+                Result.create(
+                    job,
+                    Result.Type.SUCCESSFUL,
+                    result_ttl,
+                    return_value=return_value,
+                    worker_name=worker_name,
+                    pipeline=pipe,
+                    execution_id=execution.id,
+                    execution_started_at=started_at,
+                    execution_ended_at=ended_at,
+                )
+        pipe.execute()
+
+
+def _perform_job(job: Job) -> Tuple[Any, Optional[str]]:
+    try:
+        return job.perform(), None
+    except Exception:
+        logger.exception("job_failed job_id=%s func=%s", job.id, job.func_name)
+        return None, traceback.format_exc()
+
+
+def _process_uploads(jobs: List[Job]) -> List[Tuple[Any, Optional[str]]]:
+    payloads = [job.args[0] if job.args else {} for job in jobs]
+    try:
+        results = process_upload_batch(payloads)
+    except Exception as exc:
+        logger.exception("upload_batch_failed jobs=%d", len(jobs))
+        results = [
+            {"upload_id": str(payload.get("upload_id", "")), "status": "failed", "error": str(exc)[:500]}
+            for payload in payloads
+        ]
+    return [(result, result.get("error")) for result in results]
+
+
+def run_batch_once(queue: Queue, batch_size: int, poll_timeout: int, worker_name: str) -> int:
+    """Dequeue and run one batch; returns the number of jobs handled (0 when the poll timed out)."""
+    jobs = _drain_jobs(queue, batch_size, poll_timeout)
+    if not jobs:
+        return 0
+    started_at = datetime.now(timezone.utc)
+    executions = _start_jobs(queue, jobs, worker_name)
+
+    # Only upload jobs share a batch; anything else on the queue runs one by one as RQ would.
+    upload_indexes = [index for index, job in enumerate(jobs) if job.func_name == UPLOAD_JOB_FUNC]
+    outcomes: List[Tuple[Any, Optional[str]]] = [(None, None)] * len(jobs)
+    if upload_indexes:
+        for index, outcome in zip(upload_indexes, _process_uploads([jobs[index] for index in upload_indexes])):
+            outcomes[index] = outcome
+    for index, job in enumerate(jobs):
+        if job.func_name != UPLOAD_JOB_FUNC:
+            outcomes[index] = _perform_job(job)
+
+    _finish_jobs(queue, jobs, executions, outcomes, started_at, worker_name)
+    logger.info(
+        "upload_batch_done jobs=%d uploads=%d parsed=%d elapsed_ms=%.2f",
+        len(jobs),
+        len(upload_indexes),
+        sum(1 for return_value, _ in outcomes if isinstance(return_value, dict) and return_value.get("status") == "parsed"),
+        (datetime.now(timezone.utc) - started_at).total_seconds() * 1000,
+    )
+    return len(jobs)
+
+
+def run_batch_worker(queue: Queue, batch_size: int, poll_timeout: int = 5, stop: Optional[threading.Event] = None) -> None:
+    """
+    Consume upload jobs in batches of up to batch_size with process_upload_batch.
+
+    SIGTERM/SIGINT stop the loop after the current batch (within poll_timeout when idle).
+    Jobs sit in the StartedJobRegistry while their batch runs; if the process dies mid-batch
+    they are failed once their timeout expires, and their uploads need to be re-enqueued.
+    """
+    if stop is None:
+        stop = threading.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: stop.set())
+    worker_name = f"batch-{socket.gethostname()}-{os.getpid()}"
+    while not stop.is_set():
+        run_batch_once(queue, batch_size, poll_timeout, worker_name)
+    logger.info("batch_worker_stopped name=%s", worker_name)
+
+
+def run_worker_pool(queue: Queue, processes: int) -> None:
+    """
+    Run `processes` forked SimpleWorkers on the queue (Linux).
+
+    SIGTERM/SIGINT make the pool send each worker a warm shutdown, so in-flight jobs finish
+    before exit. Each child drops its inherited DB pool right after fork (app.database).
+    """
+    pool = WorkerPool([queue], connection=queue.connection, num_workers=processes, worker_class=SimpleWorker)
+    pool.start(logging_level=os.getenv("LOG_LEVEL", "INFO"))
+
+
+def print_worker_stats(queue: Queue) -> None:
+    """Per-process job counters that RQ keeps for every live worker on the queue."""
+    workers = sorted(Worker.all(queue=queue), key=lambda worker: worker.name)
+    for worker in workers:
+        print(
+            f"worker name={worker.name} pid={worker.pid} state={worker.get_state()} "
+            f"successful={worker.successful_job_count} failed={worker.failed_job_count} "
+            f"working_s={worker.total_working_time:.2f}"
+        )
+    print(f"workers={len(workers)} queued={queue.count}")
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Upload queue worker")
+    parser.add_argument("command", nargs="?", choices=("run", "stats"), default="run")
+    parser.add_argument("--processes", type=int, default=int(os.getenv("WORKER_PROCESSES", "1")))
+    parser.add_argument("--batch-size", type=int, default=int(os.getenv("WORKER_BATCH_SIZE", "1")))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(asctime)s %(name)s %(levelname)s %(message)s")
     redis_url = os.getenv("REDIS_URL", "redis://127.0.0.1:6379/0")
     queue_name = os.getenv("RQ_QUEUE_NAME", "uploads")
     redis_conn = Redis.from_url(redis_url)
     queue = Queue(queue_name, connection=redis_conn)
-    # macOS 로컬 개발에서 fork work-horse 이슈를 피하기 위해 SimpleWorker를 기본 사용한다.
-    worker = SimpleWorker([queue], connection=redis_conn)
-    worker.work()
+    if args.command == "stats":
+        print_worker_stats(queue)
+        return
+    if args.processes > 1:
+        if not sys.platform.startswith("linux"):
+            raise SystemExit("worker_pool_linux_only")
+        if args.batch_size > 1:
+            raise SystemExit("worker_pool_and_batch_mode_are_exclusive")
+
+    # Build the worker-lifetime engine up front; process_upload_job reuses it from the registry.
+    get_engine(resolve_database_url())
+    try:
+        if args.processes > 1:
+            run_worker_pool(queue, args.processes)
+        elif args.batch_size > 1:
+            run_batch_worker(queue, args.batch_size)
+        else:
+            # macOS 로컬 개발에서 fork work-horse 이슈를 피하기 위해 SimpleWorker를 기본 사용한다.
+            worker = SimpleWorker([queue], connection=redis_conn)
+            worker.work()
+    finally:
+        dispose_engines()
 
 
 if __name__ == "__main__":
@@ -1,14 +1,24 @@
+import logging
 import os
+import time
 import uuid
 from datetime import date
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
-from app.database import build_engine, build_session_factory, resolve_database_url
-from app.models import Exercise, ExerciseSet, Upload, WorkoutSession
-from app.services.parser import parse_fleek_ocr_v1
+from app.database import get_session_factory, resolve_database_url
+from app.metrics import StageTimings, timed_stage
+from app.models import Exercise, ExerciseSet, Upload, UploadJobStat, WorkoutSession
+from app.services.daily_volume import apply_session_to_daily_volume
+from app.services.data_version import bump_data_version
+from app.services.fatigue_state import apply_session_to_fatigue_state
+from app.services.job_stats import UploadJobTimings, describe_upload_job_stat, record_upload_job_stats
+from app.services.parser import ParsedSession, parse_fleek_ocr_v1_session
+
+logger = logging.getLogger(__name__)
 
 
 def _update_to_failed(session: Session, upload: Upload, message: str) -> None:
@@ -18,14 +28,15 @@ def _update_to_failed(session: Session, upload: Upload, message: str) -> None:
     session.refresh(upload)
 
 
-def _save_parsed_session(session: Session, upload: Upload, parsed: Dict) -> None:
-    summary = parsed.get("summary", {}) or {}
+def _save_parsed_session(session: Session, upload: Upload, parsed: ParsedSession) -> WorkoutSession:
+    summary = parsed.summary
     parsed_date = summary.get("date")
     if not parsed_date:
         raise ValueError("summary_date_missing")
 
     session_date = date.fromisoformat(parsed_date)
     workout_session = WorkoutSession(
+        id=uuid.uuid4(),
         upload_id=upload.id,
         date=session_date,
         calories_kcal=summary.get("calories_kcal"),
@@ -35,33 +46,80 @@ def _save_parsed_session(session: Session, upload: Upload, parsed: Dict) -> None
     session.add(workout_session)
     session.flush()
 
-    exercises = parsed.get("exercises", []) or []
-    for exercise_index, exercise_data in enumerate(exercises, start=1):
-        exercise = Exercise(
-            session_id=workout_session.id,
-            raw_name=str(exercise_data.get("raw_name", "")).strip() or f"exercise_{exercise_index}",
-            order_index=exercise_index,
+    # IDs are generated client-side so exercises and sets go out as two executemany batches.
+    exercise_rows: List[Dict] = []
+    set_rows: List[Dict] = []
+    for exercise_index, exercise in enumerate(parsed.exercises, start=1):
+        exercise_id = uuid.uuid4()
+        exercise_rows.append(
+            {
+                "id": exercise_id,
+                "session_id": workout_session.id,
+                "raw_name": exercise.raw_name.strip() or f"exercise_{exercise_index}",
+                "order_index": exercise_index,
+            }
         )
-        session.add(exercise)
-        session.flush()
-
-        set_rows = exercise_data.get("sets", []) or []
-        for set_index, set_data in enumerate(set_rows, start=1):
-            set_row = ExerciseSet(
-                exercise_id=exercise.id,
-                set_index=set_index,
-                weight_kg=set_data.get("weight_kg"),
-                reps=int(set_data.get("reps", 0)),
+        for set_index, (weight_kg, reps) in enumerate(exercise.iter_sets(), start=1):
+            set_rows.append(
+                {"id": uuid.uuid4(), "exercise_id": exercise_id, "set_index": set_index, "weight_kg": weight_kg, "reps": reps}
             )
-            session.add(set_row)
+
+    if exercise_rows:
+        session.execute(insert(Exercise), exercise_rows)
+    if set_rows:
+        session.execute(insert(ExerciseSet), set_rows)
+    return workout_session
+
+
+def _needs_review_message(parsed: ParsedSession) -> Optional[str]:
+    if not parsed.needs_review:
+        return None
+    warning_text = ", ".join(parsed.warnings)
+    message = f"needs review: {warning_text}" if warning_text else "needs review"
+    return message[:500]
+
+
+def _parse_upload(
+    upload: Upload, storage_path: str, payload: Dict, timings: Optional[UploadJobTimings] = None
+) -> Tuple[Optional[ParsedSession], Optional[str]]:
+    """Run the checks and the parser for one upload; returns (parsed, None) or (None, failure message)."""
+    with timed_stage(timings, "file_check"):
+        if not Path(storage_path).exists():
+            return None, "file not found"
+
+        raw_text = str(getattr(upload, "ocr_text_raw", "") or payload.get("ocr_text_raw", "")).strip()
+        if not raw_text:
+            return None, "no ocr text"
+
+    with timed_stage(timings, "parse"):
+        parsed = parse_fleek_ocr_v1_session(raw_text)
+    if timings is not None:
+        timings.observe_parsed(parsed)
+    failure = _needs_review_message(parsed)
+    if failure is not None:
+        return None, failure
+    return parsed, None
+
+
+def _persist_parsed_upload(session: Session, upload: Upload, parsed: ParsedSession) -> None:
+    workout_session = _save_parsed_session(session, upload, parsed)
+    apply_session_to_fatigue_state(session, workout_session.id)
+    apply_session_to_daily_volume(session, workout_session.id)
+    upload.status = "parsed"
+    upload.error_message = None
 
 
 def process_upload_job(payload: Dict, database_url: str = "") -> Dict[str, str]:
-    resolved_database_url = resolve_database_url(database_url)
-    engine = build_engine(resolved_database_url)
-    session_factory = build_session_factory(engine)
+    setup_started = time.perf_counter()
+    session_factory = get_session_factory(resolve_database_url(database_url))
     session = session_factory()
+    setup_ms = (time.perf_counter() - setup_started) * 1000
+    logger.info("upload_job_setup upload_id=%s setup_ms=%.2f", payload.get("upload_id", ""), setup_ms)
     upload = None
+    timings = UploadJobTimings()
+    # (upload id, parser_version) captured while loaded, so recording stats never reloads the row.
+    job_key = None
+    job_status = "failed"
     try:
         upload_id = str(payload.get("upload_id", "")).strip()
         storage_path = str(payload.get("storage_path", "")).strip()
@@ -69,55 +127,166 @@ def process_upload_job(payload: Dict, database_url: str = "") -> Dict[str, str]:
             raise ValueError("upload_id_missing")
 
         parsed_upload_id = uuid.UUID(upload_id)
-        upload = session.get(Upload, parsed_upload_id)
-        if upload is None:
-            raise ValueError("upload_not_found")
+        with timings.stage("load_upload"):
+            upload = session.get(Upload, parsed_upload_id)
+            if upload is None:
+                raise ValueError("upload_not_found")
+            if upload.status == "parsed":
+                # A duplicate job for an upload that already has its session: re-running it would
+                # save a second session for the same bytes.
+                logger.info("upload_job_skipped upload_id=%s reason=already_parsed", upload.id)
+                return {"upload_id": str(upload.id), "status": upload.status}
+            job_key = (upload.id, upload.parser_version or str(payload.get("parser_version", "")))
 
-        upload.status = "processing"
-        upload.error_message = None
-        session.commit()
-        session.refresh(upload)
+            upload.status = "processing"
+            upload.error_message = None
+            session.commit()
+            session.refresh(upload)
 
-        if not Path(storage_path).exists():
-            _update_to_failed(session, upload, "file not found")
-            return {"upload_id": str(upload.id), "status": upload.status}
-
-        raw_text = str(getattr(upload, "ocr_text_raw", "") or payload.get("ocr_text_raw", "")).strip()
-        if not raw_text:
-            _update_to_failed(session, upload, "no ocr text")
+        parsed, failure = _parse_upload(upload, storage_path, payload, timings)
+        if failure is not None:
+            with timings.stage("commit"):
+                _update_to_failed(session, upload, failure)
+            job_status = upload.status
             return {"upload_id": str(upload.id), "status": upload.status}
 
-        parsed = parse_fleek_ocr_v1(raw_text)
-        meta = parsed.get("meta", {}) or {}
-        if bool(meta.get("needs_review")):
-            warning_text = ", ".join(meta.get("warnings", []) or [])
-            message = f"needs review: {warning_text}" if warning_text else "needs review"
-            _update_to_failed(session, upload, message[:500])
-            return {"upload_id": str(upload.id), "status": upload.status}
-
-        _save_parsed_session(session, upload, parsed)
-        upload.status = "parsed"
-        upload.error_message = None
-        session.commit()
+        with timings.stage("persist"):
+            _persist_parsed_upload(session, upload, parsed)
+            bump_data_version(session)
+        with timings.stage("commit"):
+            session.commit()
         session.refresh(upload)
+        job_status = upload.status
         return {"upload_id": str(upload.id), "status": upload.status}
     except Exception as exc:
         if upload is not None:
             session.rollback()
             _update_to_failed(session, upload, str(exc)[:500] or "unknown_error")
         raise
+    finally:
+        if job_key is not None:
+            record_upload_job_stats(session, [timings.to_row(*job_key, job_status)])
+        session.close()
+
+
+def process_upload_batch(payloads: List[Dict], database_url: str = "") -> List[Dict[str, str]]:
+    """
+    Process many upload jobs with one load, one parse pass and one persist transaction.
+
+    Each upload is saved inside its own savepoint, so a failing upload is marked failed
+    without rolling back the others. Uploads that are already parsed, and repeats of an upload
+    within the batch, are left alone. Returns one result per payload, in order; results
+    carry an "error" key when the upload could not be processed at all.
+    """
+    session = get_session_factory(resolve_database_url(database_url))()
+    results: List[Dict[str, str]] = []
+    # Load and commit cover the whole batch; their time is split evenly across the uploads' stats.
+    shared = StageTimings()
+    processing_ids: List[uuid.UUID] = []
+    try:
+        upload_ids: List[Optional[uuid.UUID]] = []
+        for payload in payloads:
+            try:
+                upload_ids.append(uuid.UUID(str(payload.get("upload_id", "")).strip()))
+            except ValueError:
+                upload_ids.append(None)
+        with shared.stage("load_upload"):
+            uploads_by_id = {
+                upload.id: upload
+                for upload in session.execute(
+                    select(Upload).where(Upload.id.in_([upload_id for upload_id in upload_ids if upload_id is not None]))
+                ).scalars()
+            }
+
+            work: List[Tuple[int, Upload]] = []
+            for index, (payload, upload_id) in enumerate(zip(payloads, upload_ids)):
+                upload = uploads_by_id.get(upload_id)
+                if upload_id is None:
+                    results.append({"upload_id": str(payload.get("upload_id", "")), "status": "failed", "error": "upload_id_missing"})
+                elif upload is None:
+                    results.append({"upload_id": str(upload_id), "status": "failed", "error": "upload_not_found"})
+                elif upload.status == "parsed" or upload_id in processing_ids:
+                    # Already parsed, or a second job for the same upload in this batch: no second session.
+                    results.append({"upload_id": str(upload.id), "status": "parsed" if upload.status == "parsed" else "skipped"})
+                else:
+                    upload.status = "processing"
+                    upload.error_message = None
+                    results.append({"upload_id": str(upload.id), "status": "processing"})
+                    work.append((index, upload))
+                    processing_ids.append(upload.id)
+            session.commit()
+
+        # Parsing is CPU-only, so it happens before the write transaction opens.
+        prepared = []
+        for index, upload in work:
+            storage_path = str(payloads[index].get("storage_path", "")).strip()
+            timings = UploadJobTimings()
+            prepared.append((index, upload, timings, *_parse_upload(upload, storage_path, payloads[index], timings)))
+
+        if any(parsed is not None for _, _, _, parsed, _ in prepared):
+            # Bump first: as the transaction's first DML it also makes pysqlite open the
+            # transaction before any SAVEPOINT is issued.
+            bump_data_version(session)
+        for index, upload, timings, parsed, failure in prepared:
+            if failure is None:
+                try:
+                    with timings.stage("persist"), session.begin_nested():
+                        _persist_parsed_upload(session, upload, parsed)
+                except Exception as exc:
+                    failure = str(exc)[:500] or "unknown_error"
+                    results[index]["error"] = failure
+            if failure is not None:
+                upload.status = "failed"
+                upload.error_message = failure
+            results[index]["status"] = upload.status
+        job_keys = [
+            (upload.id, upload.parser_version or str(payloads[index].get("parser_version", "")), upload.status)
+            for index, upload, _, _, _ in prepared
+        ]
+        with shared.stage("commit"):
+            session.commit()
+        record_upload_job_stats(
+            session,
+            [
+                timings.to_row(*job_key, batch_size=len(prepared), shared=shared)
+                for job_key, (_, _, timings, _, _) in zip(job_keys, prepared)
+            ],
+        )
+        return results
+    except Exception as exc:
+        # Errors outside the per-upload savepoints would otherwise leave the whole batch in "processing".
+        session.rollback()
+        if processing_ids:
+            session.execute(
+                update(Upload)
+                .where(Upload.id.in_(processing_ids), Upload.status == "processing")
+                .values(status="failed", error_message=str(exc)[:500] or "unknown_error")
+            )
+            session.commit()
+        raise
     finally:
         session.close()
 
 
 def main() -> None:
-    # TODO: TC-06 이후에는 파서 실행 통계를 함께 출력한다.
     sample_payload = {
         "upload_id": os.getenv("UPLOAD_ID", ""),
         "storage_path": os.getenv("UPLOAD_STORAGE_PATH", ""),
         "parser_version": os.getenv("PARSER_VERSION", "tc04-parser-v1"),
     }
-    process_upload_job(sample_payload)
+    result = process_upload_job(sample_payload)
+    # 파서 실행 통계: 이 작업이 upload_job_stats에 남긴 행을 출력한다.
+    session = get_session_factory(resolve_database_url())()
+    try:
+        stat = session.execute(
+            select(UploadJobStat)
+            .where(UploadJobStat.upload_id == uuid.UUID(result["upload_id"]))
+            .order_by(UploadJobStat.started_at.desc())
+            .limit(1)
+        ).scalar()
+        print(describe_upload_job_stat(stat) if stat is not None else result)
+    finally:
+        session.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+"""Standalone benchmarks for backend hot paths (not collected by pytest)."""
@@ -0,0 +1,65 @@
+"""
+Compare two benchmarks.suite JSON files and fail on regressions.
+
+A case regresses when its median is more than --threshold (a fraction) slower than the
+baseline and the absolute difference is above --min-delta-ms, which keeps
+sub-millisecond noise from failing the step. Exits 1 when any case regresses.
+
+    python -m benchmarks.compare bench-main.json bench-branch.json --threshold 0.2
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+def _medians(report: Dict) -> Dict[Tuple[int, str], float]:
+    return {
+        (result["scale"], name): case["median_ms"]
+        for result in report["results"]
+        for name, case in result["cases"].items()
+    }
+
+
+def compare_reports(baseline: Dict, candidate: Dict, *, threshold: float, min_delta_ms: float) -> Tuple[List[str], bool]:
+    """One line per case present in both reports, and whether any case regressed."""
+    base, current = _medians(baseline), _medians(candidate)
+    lines: List[str] = []
+    regressed = False
+    for key in sorted(base.keys() & current.keys()):
+        before, after = base[key], current[key]
+        change = (after - before) / before if before > 0 else 0.0
+        status = "ok"
+        if change > threshold and after - before > min_delta_ms:
+            status = "REGRESSION"
+            regressed = True
+        elif change < -threshold:
+            status = "faster"
+        scale, name = key
+        lines.append(f"scale={scale} {name}: {before:.2f}ms -> {after:.2f}ms ({change:+.1%}) {status}")
+    for scale, name in sorted(base.keys() - current.keys()):
+        lines.append(f"scale={scale} {name}: missing from candidate")
+    return lines, regressed
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--min-delta-ms", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    candidate = json.loads(Path(args.candidate).read_text(encoding="utf-8"))
+    if baseline["meta"].get("dialect") != candidate["meta"].get("dialect"):
+        print(f"warning: comparing {baseline['meta'].get('dialect')} against {candidate['meta'].get('dialect')}")
+    lines, regressed = compare_reports(baseline, candidate, threshold=args.threshold, min_delta_ms=args.min_delta_ms)
+    print("\n".join(lines))
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Memory and parse+persist time for the parser's dict output versus the ParsedSession IR.
+
+Parses N synthetic documents and holds every result, measuring the retained
+allocation per parsed session with tracemalloc, then parses and persists the same
+documents through the previous dict-based save and through _save_parsed_session.
+
+    python -m benchmarks.parser_ir --documents 500 --exercises 8 --sets 5
+"""
+
+import argparse
+import gc
+import statistics
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from sqlalchemy import insert
+
+from app.database import build_engine, build_session_factory
+from app.migrate import run_migrations
+from app.models import Exercise, ExerciseSet, Upload, WorkoutSession
+from app.services.parser import parse_fleek_ocr_v1, parse_fleek_ocr_v1_session
+from app.workers.process_upload import _save_parsed_session
+from benchmarks.synthetic import SyntheticScale, generate_workouts, render_ocr
+
+
+def _save_parsed_dict(session, upload: Upload, parsed: Dict) -> WorkoutSession:
+    # Dict-based batched save that preceded the IR, kept here as the benchmark baseline.
+    summary = parsed.get("summary", {}) or {}
+    workout_session = WorkoutSession(
+        id=uuid.uuid4(),
+        upload_id=upload.id,
+        date=date.fromisoformat(summary["date"]),
+        calories_kcal=summary.get("calories_kcal"),
+        duration_min=summary.get("duration_min"),
+        volume_kg=summary.get("volume_kg"),
+    )
+    session.add(workout_session)
+    session.flush()
+    exercise_rows: List[Dict] = []
+    set_rows: List[Dict] = []
+    for exercise_index, exercise_data in enumerate(parsed.get("exercises", []) or [], start=1):
+        exercise_id = uuid.uuid4()
+        exercise_rows.append(
+            {
+                "id": exercise_id,
+                "session_id": workout_session.id,
+                "raw_name": str(exercise_data.get("raw_name", "")).strip() or f"exercise_{exercise_index}",
+                "order_index": exercise_index,
+            }
+        )
+        for set_index, set_data in enumerate(exercise_data.get("sets", []) or [], start=1):
+            set_rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "exercise_id": exercise_id,
+                    "set_index": set_index,
+                    "weight_kg": set_data.get("weight_kg"),
+                    "reps": int(set_data.get("reps", 0)),
+                }
+            )
+    if exercise_rows:
+        session.execute(insert(Exercise), exercise_rows)
+    if set_rows:
+        session.execute(insert(ExerciseSet), set_rows)
+    return workout_session
+
+
+def _retained_bytes(parse: Callable, documents: List[str]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    parsed = [parse(text) for text in documents]
+    retained = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+    tracemalloc.stop()
+    del parsed
+    return retained
+
+
+def _parse_and_persist_ms(session_factory, parse: Callable, save: Callable, documents: List[str], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        db = session_factory()
+        try:
+            started = time.perf_counter()
+            for text in documents:
+                upload = Upload(id=uuid.uuid4(), filename="bench.png", parser_version="bench")
+                db.add(upload)
+                save(db, upload, parse(text))
+            db.flush()
+            samples.append((time.perf_counter() - started) * 1000.0)
+            db.rollback()
+        finally:
+            db.close()
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--exercises", type=int, default=8)
+    parser.add_argument("--sets", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    scale = SyntheticScale(sessions=args.documents, exercises_per_session=args.exercises, sets_per_exercise=args.sets)
+    documents = [render_ocr(workout) for workout in generate_workouts(scale, seed=7)]
+    cases = (("dict", parse_fleek_ocr_v1, _save_parsed_dict), ("ir", parse_fleek_ocr_v1_session, _save_parsed_session))
+
+    for label, parse, _ in cases:
+        retained = _retained_bytes(parse, documents)
+        print(f"{label:>4} bytes_per_session={retained / args.documents:,.0f}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = build_engine(f"sqlite:///{Path(tmp_dir) / 'parser_ir.db'}")
+        run_migrations(engine)
+        session_factory = build_session_factory(engine)
+        for label, parse, save in cases:
+            samples = _parse_and_persist_ms(session_factory, parse, save, documents, args.repeat)
+            print(
+                f"{label:>4} parse_persist_median_ms={statistics.median(samples):.2f} "
+                f"min_ms={min(samples):.2f} documents={args.documents}"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Micro-benchmark for parse_fleek_ocr_v1 reporting cleaned lines per second.
+
+    python -m benchmarks.parser_throughput --exercises 40 --iterations 500
+"""
+
+import argparse
+import time
+
+from app.services.parser import _clean_lines, parse_fleek_ocr_v1
+from benchmarks.upload_persist import build_synthetic_ocr
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--exercises", type=int, default=40)
+    parser.add_argument("--sets", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    raw_text = build_synthetic_ocr(args.exercises, args.sets)
+    line_count = len(_clean_lines(raw_text))
+    parse_fleek_ocr_v1(raw_text)
+
+    started = time.perf_counter()
+    for _ in range(args.iterations):
+        parse_fleek_ocr_v1(raw_text)
+    elapsed = time.perf_counter() - started
+
+    print(f"lines_per_doc={line_count} iterations={args.iterations} elapsed_s={elapsed:.3f}")
+    print(f"lines_per_sec={line_count * args.iterations / elapsed:,.0f} docs_per_sec={args.iterations / elapsed:,.1f}")
+
+
+if __name__ == "__main__":
+    main()
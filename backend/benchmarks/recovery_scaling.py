@@ -0,0 +1,118 @@
+"""
+Regression benchmark for compute_recovery_v0 scaling.
+
+Seeds one SQLite database per size with N sessions inside a 30-day window and
+times the engine. Exits non-zero when the growth exponent between the two
+largest sizes exceeds --max-exponent (1.0 == perfectly linear).
+
+    python -m benchmarks.recovery_scaling --sizes 10,100,1000,10000
+"""
+
+import argparse
+import math
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+
+from sqlalchemy import insert
+
+from app.database import build_engine, build_session_factory
+from app.migrate import run_migrations
+from app.models import Exercise, ExerciseSet, WorkoutSession
+from app.services.recovery_engine_v0 import compute_recovery_v0
+
+WINDOW_DAYS = 30
+EXERCISE_NAMES = ("바벨 플랫 벤치 프레스", "풀 업", "스쿼트", "숄더 프레스")
+END_DATE = date(2026, 2, 28)
+
+
+def _seed(session_factory, session_count: int, span_days: int = WINDOW_DAYS) -> None:
+    sessions, exercises, sets = [], [], []
+    for session_index in range(session_count):
+        session_id = uuid.uuid4()
+        sessions.append(
+            {
+                "id": session_id,
+                "date": END_DATE - timedelta(days=session_index % span_days),
+                "calories_kcal": 200,
+                "duration_min": 45,
+                "volume_kg": 5000,
+            }
+        )
+        for order_index, raw_name in enumerate(EXERCISE_NAMES[: 2 + session_index % 3], start=1):
+            exercise_id = uuid.uuid4()
+            exercises.append({"id": exercise_id, "session_id": session_id, "raw_name": raw_name, "order_index": order_index})
+            for set_index in range(1, 4):
+                sets.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "exercise_id": exercise_id,
+                        "set_index": set_index,
+                        "weight_kg": 20.0 * set_index,
+                        "reps": 12 - set_index,
+                    }
+                )
+
+    db = session_factory()
+    try:
+        db.execute(insert(WorkoutSession), sessions)
+        db.execute(insert(Exercise), exercises)
+        db.execute(insert(ExerciseSet), sets)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _time_recovery(session_factory, repeat: int) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        db = session_factory()
+        try:
+            started = time.perf_counter()
+            compute_recovery_v0(db, to_dt=END_DATE, days=WINDOW_DAYS)
+            best = min(best, time.perf_counter() - started)
+        finally:
+            db.close()
+    return best
+
+
+def run(sizes: List[int], repeat: int) -> List[float]:
+    timings = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            engine = build_engine(f"sqlite:///{Path(tmp_dir) / f'recovery_{size}.db'}")
+            run_migrations(engine)
+            session_factory = build_session_factory(engine)
+            _seed(session_factory, size)
+            elapsed = _time_recovery(session_factory, repeat)
+            timings.append(elapsed)
+            print(f"sessions={size:>6} elapsed_ms={elapsed * 1000:9.2f} us_per_session={elapsed * 1e6 / size:8.2f}")
+            engine.dispose()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10,100,1000,10000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-exponent", type=float, default=1.25)
+    args = parser.parse_args()
+
+    sizes = sorted(int(value) for value in args.sizes.split(",") if value.strip())
+    timings = run(sizes, args.repeat)
+    if len(sizes) < 2:
+        return
+
+    exponent = math.log(timings[-1] / timings[-2]) / math.log(sizes[-1] / sizes[-2])
+    print(f"growth_exponent({sizes[-2]}->{sizes[-1]})={exponent:.2f}")
+    if exponent > args.max_exponent:
+        print(f"FAIL: growth exponent exceeds {args.max_exponent}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark for GET /api/recovery/series against one compute_recovery_v0 call per day.
+
+Seeds a SQLite database with N sessions spread over the range plus one window, then
+times a single recovery call, the per-day loop the frontend used to issue, and
+compute_recovery_series over the same points, each from the joined tables and
+from the daily_muscle_volume rollup.
+
+    python -m benchmarks.recovery_series --sessions 3000 --points 90
+"""
+
+import argparse
+import math
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from app.database import build_engine, build_session_factory
+from app.migrate import run_migrations
+from app.services.daily_volume import rebuild_daily_volume
+from app.services.recovery_engine_v0 import compute_recovery_series, compute_recovery_v0
+from benchmarks.recovery_scaling import END_DATE, _seed
+
+
+def _best_of(session_factory, repeat: int, func) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        db = session_factory()
+        try:
+            started = time.perf_counter()
+            func(db)
+            best = min(best, time.perf_counter() - started)
+        finally:
+            db.close()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=3000)
+    parser.add_argument("--points", type=int, default=90)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from_date = END_DATE - timedelta(days=args.points - 1)
+    point_dates = [from_date + timedelta(days=offset) for offset in range(args.points)]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = build_engine(f"sqlite:///{Path(tmp_dir) / 'recovery_series.db'}")
+        run_migrations(engine)
+        session_factory = build_session_factory(engine)
+        _seed(session_factory, args.sessions, span_days=args.points + args.days)
+
+        single = _best_of(session_factory, args.repeat, lambda db: compute_recovery_v0(db, to_dt=END_DATE, days=args.days))
+        per_day = _best_of(
+            session_factory,
+            args.repeat,
+            lambda db: [compute_recovery_v0(db, to_dt=point_date, days=args.days) for point_date in point_dates],
+        )
+        series = _best_of(
+            session_factory,
+            args.repeat,
+            lambda db: compute_recovery_series(db, from_date=from_date, to_date=END_DATE, days=args.days),
+        )
+
+        db = session_factory()
+        rebuild_daily_volume(db)
+        db.commit()
+        db.close()
+        single_rollup = _best_of(
+            session_factory,
+            args.repeat,
+            lambda db: compute_recovery_v0(db, to_dt=END_DATE, days=args.days, use_rollup=True),
+        )
+        series_rollup = _best_of(
+            session_factory,
+            args.repeat,
+            lambda db: compute_recovery_series(db, from_date=from_date, to_date=END_DATE, days=args.days, use_rollup=True),
+        )
+        engine.dispose()
+
+    print(f"single_call_ms={single * 1000:.2f}")
+    print(f"per_day_calls_ms={per_day * 1000:.2f} points={args.points}")
+    print(f"series_ms={series * 1000:.2f} speedup={per_day / series:.1f}x vs_single={series / single:.2f}x")
+    print(f"rollup_single_call_ms={single_rollup * 1000:.2f} rollup_series_ms={series_rollup * 1000:.2f}")
+
+
+if __name__ == "__main__":
+    main()
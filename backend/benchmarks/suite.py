@@ -0,0 +1,226 @@
+"""
+Benchmark suite: seed deterministic synthetic data at each scale and time the hot paths.
+
+Runs against a fresh temporary SQLite database per scale, or against a dedicated Postgres
+database when BENCH_DATABASE_URL points at one. Each scale deletes the previous scale's
+generated rows, so the database name must contain "bench" or "test"; --reset also clears
+rows left by an earlier run.
+Results are written as JSON so two commits can be compared with benchmarks.compare.
+
+    python -m benchmarks.suite --scales 1,10 --output bench-main.json
+    python -m benchmarks.compare bench-main.json bench-branch.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.engine import make_url
+
+from app.api.sessions import list_sessions
+from app.database import build_engine, build_session_factory
+from app.migrate import run_migrations
+from app.models import (
+    DailyMuscleVolume,
+    DailyUnmappedExercise,
+    Exercise,
+    ExerciseMuscle,
+    ExerciseSet,
+    MuscleFatigueState,
+    Upload,
+    UploadJobStat,
+    WorkoutSession,
+)
+from app.services.daily_volume import rebuild_daily_volume
+from app.services.data_version import MAPPINGS_DATA_VERSION, bump_data_version
+from app.services.parser import ParsedSession, parse_fleek_ocr_v1_session
+from app.services.recovery_engine_v0 import SEED_SESSION_DATE, compute_recovery_series, compute_recovery_v0
+from app.workers.process_upload import _save_parsed_session
+from benchmarks.synthetic import END_DATE, SyntheticScale, generate_workouts, render_ocr, seed_database
+
+RESULT_FORMAT = 1
+PARSE_DOCUMENTS = 200
+PERSIST_DOCUMENTS = 20
+
+
+def _time_case(session_factory, repeat: int, case: Callable, *, rollback: bool = False) -> Dict[str, float]:
+    samples: List[float] = []
+    for _ in range(repeat):
+        db = session_factory()
+        try:
+            started = time.perf_counter()
+            case(db)
+            samples.append((time.perf_counter() - started) * 1000.0)
+            if rollback:
+                db.rollback()
+        finally:
+            db.close()
+    return {"best_ms": min(samples), "median_ms": statistics.median(samples), "repeat": repeat}
+
+
+def _persist_documents(db, parsed_documents: List[ParsedSession]) -> None:
+    for parsed in parsed_documents:
+        upload = Upload(id=uuid.uuid4(), filename="bench.png", original_filename="bench.png", parser_version="bench")
+        db.add(upload)
+        _save_parsed_session(db, upload, parsed)
+    db.flush()
+
+
+def _generated_session_count(session_factory) -> int:
+    db = session_factory()
+    try:
+        return db.execute(select(func.count()).select_from(WorkoutSession).where(WorkoutSession.date != SEED_SESSION_DATE)).scalar_one()
+    finally:
+        db.close()
+
+
+def _reset_generated_rows(session_factory) -> None:
+    """Delete everything except the seed session, its exercises and the name-keyed mappings."""
+    db = session_factory()
+    try:
+        generated_sessions = select(WorkoutSession.id).where(WorkoutSession.date != SEED_SESSION_DATE)
+        generated_exercises = select(Exercise.id).where(Exercise.session_id.in_(generated_sessions))
+        db.execute(delete(ExerciseSet).where(ExerciseSet.exercise_id.in_(generated_exercises)))
+        db.execute(delete(ExerciseMuscle).where(ExerciseMuscle.exercise_id.in_(generated_exercises)))
+        db.execute(delete(Exercise).where(Exercise.session_id.in_(generated_sessions)))
+        db.execute(delete(WorkoutSession).where(WorkoutSession.date != SEED_SESSION_DATE))
+        for model in (Upload, UploadJobStat, DailyMuscleVolume, DailyUnmappedExercise, MuscleFatigueState):
+            db.execute(delete(model))
+        bump_data_version(db)
+        bump_data_version(db, MAPPINGS_DATA_VERSION)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _require_benchmark_database(database_url: str) -> None:
+    # The suite deletes uploads, rollups and fatigue state wholesale; never point it at real data.
+    database_name = (make_url(database_url).database or "").lower()
+    if "bench" not in database_name and "test" not in database_name:
+        raise SystemExit(f"refusing to benchmark against {database_name!r}: use a database whose name contains 'bench' or 'test'")
+
+
+def run_scale(database_url: str, factor: int, seed: int, repeat: int) -> Dict:
+    engine = build_engine(database_url)
+    try:
+        run_migrations(engine)
+        session_factory = build_session_factory(engine)
+        scale = SyntheticScale().times(factor)
+        rows = seed_database(session_factory, scale, seed)
+
+        cases: Dict[str, Dict[str, float]] = {}
+        for days in (7, 30):
+            cases[f"recovery_{days}d"] = _time_case(
+                session_factory, repeat, lambda db, days=days: compute_recovery_v0(db, to_dt=END_DATE, days=days)
+            )
+        series_from = END_DATE - timedelta(days=89)
+        cases["recovery_series_90"] = _time_case(
+            session_factory, repeat, lambda db: compute_recovery_series(db, from_date=series_from, to_date=END_DATE)
+        )
+        cases["list_sessions"] = _time_case(
+            session_factory, repeat, lambda db: list_sessions(from_date=None, to_date=None, limit=50, db=db)
+        )
+
+        db = session_factory()
+        try:
+            rollup_started = time.perf_counter()
+            rebuild_daily_volume(db)
+            db.commit()
+            rebuild_ms = (time.perf_counter() - rollup_started) * 1000.0
+            cases["rollup_rebuild"] = {"best_ms": rebuild_ms, "median_ms": rebuild_ms, "repeat": 1}
+        finally:
+            db.close()
+        cases["recovery_rollup_30d"] = _time_case(
+            session_factory, repeat, lambda db: compute_recovery_v0(db, to_dt=END_DATE, days=30, use_rollup=True)
+        )
+
+        # Parse and persist fresh documents from a different seed so they never collide with seeded rows.
+        documents = [render_ocr(workout) for workout in generate_workouts(SyntheticScale(sessions=PARSE_DOCUMENTS), seed + 1)]
+        cases["parse"] = _time_case(session_factory, repeat, lambda db: [parse_fleek_ocr_v1_session(text) for text in documents])
+        cases["parse"]["docs_per_sec"] = PARSE_DOCUMENTS / (cases["parse"]["median_ms"] / 1000.0)
+        parsed_documents = [parse_fleek_ocr_v1_session(text) for text in documents[:PERSIST_DOCUMENTS]]
+        cases["persist"] = _time_case(
+            session_factory, repeat, lambda db: _persist_documents(db, parsed_documents), rollback=True
+        )
+        return {"scale": factor, "rows": rows, "cases": cases}
+    finally:
+        engine.dispose()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="1,10", help="comma-separated scale factors (1 = 200 sessions)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="", help="JSON results path (stdout when empty)")
+    parser.add_argument("--reset", action="store_true", help="delete rows left in BENCH_DATABASE_URL by an earlier run first")
+    args = parser.parse_args(argv)
+
+    factors = [int(value) for value in args.scales.split(",") if value.strip()]
+    # Deliberately not DATABASE_URL: the app's own database must never be picked up by accident.
+    server_url = os.getenv("BENCH_DATABASE_URL", "")
+    if server_url and not server_url.startswith("postgresql"):
+        raise SystemExit("BENCH_DATABASE_URL must be a postgresql URL (SQLite runs use a temporary file)")
+
+    if server_url:
+        _require_benchmark_database(server_url)
+        engine = build_engine(server_url)
+        run_migrations(engine)
+        session_factory = build_session_factory(engine)
+        if _generated_session_count(session_factory) and not args.reset:
+            engine.dispose()
+            raise SystemExit("BENCH_DATABASE_URL already has sessions; rerun with --reset to delete them")
+
+    results = []
+    for factor in factors:
+        if server_url:
+            _reset_generated_rows(session_factory)
+            results.append(run_scale(server_url, factor, args.seed, args.repeat))
+        else:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                results.append(run_scale(f"sqlite:///{Path(tmp_dir) / 'suite.db'}", factor, args.seed, args.repeat))
+        print(f"scale={factor} " + " ".join(f"{name}={case['median_ms']:.2f}ms" for name, case in results[-1]["cases"].items()), file=sys.stderr)
+    if server_url:
+        engine.dispose()
+
+    report = {
+        "format": RESULT_FORMAT,
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "dialect": "postgresql" if server_url else "sqlite",
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Deterministic synthetic data for benchmarks.
+
+Everything derives from one random.Random(seed), so the same seed and scale always
+produce the same uploads, sessions, exercises, sets and exercise_muscles rows, and
+the same Fleek OCR documents for the parser.
+
+    python -m benchmarks.synthetic --scale 10 --seed 7 --database-url sqlite:///bench.db
+"""
+
+import argparse
+import hashlib
+import random
+import uuid
+from dataclasses import dataclass, replace
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import insert, select
+
+from app.database import build_engine, build_session_factory
+from app.migrate import run_migrations
+from app.models import Exercise, ExerciseMuscle, ExerciseSet, MuscleGroup, Upload, WorkoutSession
+from app.services.data_version import MAPPINGS_DATA_VERSION, bump_data_version
+
+# Names with seed (name-keyed) mappings, plus names that are only mapped when a direct
+# exercise_muscles row is generated for them.
+MAPPED_EXERCISE_NAMES = (
+    "바벨 플랫 벤치 프레스",
+    "덤벨 인클라인 벤치 프레스",
+    "풀 업",
+    "덤벨 바이셉 컬",
+    "스쿼트",
+    "데드리프트",
+    "숄더 프레스",
+)
+UNSEEDED_EXERCISE_NAMES = ("케이블 크로스오버", "레그 프레스", "랫 풀 다운", "케이블 푸시 다운")
+END_DATE = date(2026, 2, 28)
+
+
+@dataclass(frozen=True)
+class SyntheticScale:
+    """Scale factor 1 is roughly one heavy user's year; factor N multiplies the session count."""
+
+    sessions: int = 200
+    exercises_per_session: int = 5
+    sets_per_exercise: int = 4
+    span_days: int = 365
+    direct_mapping_ratio: float = 0.3
+
+    def times(self, factor: int) -> "SyntheticScale":
+        return replace(self, sessions=self.sessions * factor)
+
+
+# (raw_name, [(weight_kg, reps), ...])
+SyntheticExercise = Tuple[str, List[Tuple[float, int]]]
+
+
+@dataclass
+class SyntheticWorkout:
+    session_date: date
+    exercises: List[SyntheticExercise]
+
+    @property
+    def set_count(self) -> int:
+        return sum(len(sets) for _, sets in self.exercises)
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def generate_workout(rng: random.Random, session_date: date, scale: SyntheticScale) -> SyntheticWorkout:
+    names = rng.sample(MAPPED_EXERCISE_NAMES + UNSEEDED_EXERCISE_NAMES, k=min(scale.exercises_per_session, 11))
+    while len(names) < scale.exercises_per_session:
+        names.append(f"머신 운동 {len(names) + 1:02d}")
+    exercises = []
+    for raw_name in names:
+        base = rng.randrange(10, 120, 5)
+        sets = [(float(base + 5 * set_index), rng.randint(5, 15)) for set_index in range(scale.sets_per_exercise)]
+        exercises.append((raw_name, sets))
+    return SyntheticWorkout(session_date=session_date, exercises=exercises)
+
+
+def generate_workouts(scale: SyntheticScale, seed: int, end_date: date = END_DATE) -> List[SyntheticWorkout]:
+    rng = random.Random(seed)
+    return [
+        generate_workout(rng, end_date - timedelta(days=rng.randrange(scale.span_days)), scale)
+        for _ in range(scale.sessions)
+    ]
+
+
+def render_ocr(workout: SyntheticWorkout) -> str:
+    """Fleek OCR text that parse_fleek_ocr_v1 reads back into the same exercises and sets."""
+    reps_total = sum(reps for _, sets in workout.exercises for _, reps in sets)
+    volume = sum(weight * reps for _, sets in workout.exercises for weight, reps in sets)
+    lines = [
+        workout.session_date.strftime("%Y.%m.%d"),
+        f"{len(workout.exercises) * 60} KCAL {len(workout.exercises) * 12} min {int(volume)} kg",
+        f"{len(workout.exercises)} EXERCISES {workout.set_count} sets {reps_total} reps {int(volume) // 60} kg/min",
+    ]
+    for raw_name, sets in workout.exercises:
+        lines.append(raw_name)
+        lines.append(" ".join(str(int(weight)) for weight, _ in sets))
+        lines.append(" ".join(f"{reps}X" for _, reps in sets))
+    return "\n".join(lines)
+
+
+def seed_database(session_factory, scale: SyntheticScale, seed: int, *, chunk_size: int = 5000) -> Dict[str, int]:
+    """Insert one parsed upload per workout with its session, exercises, sets and direct mappings."""
+    rng = random.Random(seed)
+    workouts = generate_workouts(scale, seed)
+    db = session_factory()
+    try:
+        muscle_ids = {code: muscle_id for muscle_id, code in db.execute(select(MuscleGroup.id, MuscleGroup.code))}
+        muscle_codes = sorted(muscle_ids)
+        rows: Dict[str, List[Dict]] = {"uploads": [], "sessions": [], "exercises": [], "sets": [], "exercise_muscles": []}
+        for index, workout in enumerate(workouts):
+            upload_id = _uuid(rng)
+            ocr_text = render_ocr(workout)
+            created_at = datetime.combine(workout.session_date, time(hour=20), tzinfo=timezone.utc) + timedelta(
+                microseconds=index
+            )
+            rows["uploads"].append(
+                {
+                    "id": upload_id,
+                    "filename": f"{upload_id}.png",
+                    "original_filename": f"workout_{index:06d}.png",
+                    "content_type": "image/png",
+                    "size_bytes": len(ocr_text.encode("utf-8")),
+                    "storage_path": f"/synthetic/{upload_id}.png",
+                    "status": "parsed",
+                    "parser_version": "synthetic",
+                    "ocr_text_raw": ocr_text,
+                    "content_sha256": hashlib.sha256(f"{seed}:{index}".encode("utf-8")).hexdigest(),
+                    "created_at": created_at,
+                }
+            )
+            session_id = _uuid(rng)
+            rows["sessions"].append(
+                {"id": session_id, "upload_id": upload_id, "date": workout.session_date, "calories_kcal": 300, "duration_min": 60}
+            )
+            for order_index, (raw_name, sets) in enumerate(workout.exercises, start=1):
+                exercise_id = _uuid(rng)
+                rows["exercises"].append({"id": exercise_id, "session_id": session_id, "raw_name": raw_name, "order_index": order_index})
+                for set_index, (weight, reps) in enumerate(sets, start=1):
+                    rows["sets"].append(
+                        {"id": _uuid(rng), "exercise_id": exercise_id, "set_index": set_index, "weight_kg": weight, "reps": reps}
+                    )
+                if muscle_codes and rng.random() < scale.direct_mapping_ratio:
+                    for code in rng.sample(muscle_codes, k=2):
+                        rows["exercise_muscles"].append(
+                            {"exercise_id": exercise_id, "muscle_id": muscle_ids[code], "weight": round(rng.uniform(0.2, 0.8), 2)}
+                        )
+
+        for model, key in (
+            (Upload, "uploads"),
+            (WorkoutSession, "sessions"),
+            (Exercise, "exercises"),
+            (ExerciseSet, "sets"),
+            (ExerciseMuscle, "exercise_muscles"),
+        ):
+            for start in range(0, len(rows[key]), chunk_size):
+                db.execute(insert(model), rows[key][start : start + chunk_size])
+        bump_data_version(db)
+        bump_data_version(db, MAPPINGS_DATA_VERSION)
+        db.commit()
+        return {key: len(value) for key, value in rows.items()}
+    finally:
+        db.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--database-url", required=True)
+    args = parser.parse_args(argv)
+
+    engine = build_engine(args.database_url)
+    run_migrations(engine)
+    counts = seed_database(build_session_factory(engine), SyntheticScale().times(args.scale), args.seed)
+    print(" ".join(f"{key}={value}" for key, value in counts.items()))
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
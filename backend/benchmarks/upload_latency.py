@@ -0,0 +1,97 @@
+"""
+/api/health latency while large uploads are in flight.
+
+Polls /api/health on an idle server, then again while N concurrent uploads of
+SIZE MiB run, and prints p50/p99 for both phases. A non-blocking upload handler
+keeps the loaded p99 close to the idle one.
+
+    python -m benchmarks.upload_latency --concurrency 50 --size-mb 10
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import httpx
+
+from benchmarks.upload_memory import require_all_created, start_bench_server, upload_all, write_body
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+async def _poll_health(client: httpx.AsyncClient, stop: asyncio.Event, interval_s: float) -> List[float]:
+    samples = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/api/health")
+        samples.append((time.perf_counter() - started) * 1000.0)
+        await asyncio.sleep(interval_s)
+    return samples
+
+
+def _send_uploads(base_url: str, body_path: Path, concurrency: int, results) -> None:
+    results.extend(asyncio.run(upload_all(base_url, body_path, concurrency)))
+
+
+async def _run(base_url: str, body_path: Path, concurrency: int, idle_s: float, interval_s: float) -> dict:
+    async with httpx.AsyncClient(base_url=base_url, timeout=300) as client:
+        stop = asyncio.Event()
+        idle_task = asyncio.create_task(_poll_health(client, stop, interval_s))
+        await asyncio.sleep(idle_s)
+        stop.set()
+        idle = await idle_task
+
+        # Uploads come from a separate process so client-side work does not skew the health timings.
+        with multiprocessing.Manager() as manager:
+            statuses = manager.list()
+            uploader = multiprocessing.Process(target=_send_uploads, args=(base_url, body_path, concurrency, statuses))
+            stop = asyncio.Event()
+            loaded_task = asyncio.create_task(_poll_health(client, stop, interval_s))
+            uploader.start()
+            await asyncio.to_thread(uploader.join)
+            stop.set()
+            loaded = await loaded_task
+            statuses = list(statuses)
+    return {"idle": idle, "loaded": loaded, "statuses": statuses}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--size-mb", type=int, default=10)
+    parser.add_argument("--idle-seconds", type=float, default=2.0)
+    parser.add_argument("--interval-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        body_path = tmp_path / "body.bin"
+        write_body(body_path, args.size_mb)
+
+        server, base_url = start_bench_server(tmp_path)
+        try:
+            result = asyncio.run(_run(base_url, body_path, args.concurrency, args.idle_seconds, args.interval_ms / 1000.0))
+        finally:
+            server.terminate()
+            server.wait()
+    require_all_created(result["statuses"], args.concurrency)
+
+    print(f"uploads={args.concurrency} size_mb={args.size_mb} ok={result['statuses'].count(201)}")
+    for phase in ("idle", "loaded"):
+        samples = result[phase]
+        print(
+            f"health_{phase} n={len(samples)} p50_ms={statistics.median(samples):.2f} "
+            f"p99_ms={_percentile(samples, 99):.2f} max_ms={max(samples):.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Peak server RSS under concurrent large uploads (Linux: reads /proc/<pid>/status).
+
+Starts uvicorn in a subprocess with a queue-less app, fires N concurrent uploads
+of SIZE MiB each, and reports the server's VmHWM (peak RSS) before and after.
+
+    python -m benchmarks.upload_memory --concurrency 50 --size-mb 10
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Tuple
+
+import httpx
+
+
+def create_bench_app():
+    from app.main import create_app
+
+    return create_app(
+        database_url=os.environ["BENCH_DATABASE_URL"],
+        upload_dir=os.environ["BENCH_UPLOAD_DIR"],
+        enqueue_func=lambda _: "bench-job",
+    )
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _peak_rss_kb(pid: int) -> int:
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1])
+    raise RuntimeError("VmHWM not available")
+
+
+def wait_for_server(base_url: str, timeout_s: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/api/health").status_code == 200:
+                return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    raise RuntimeError("server_did_not_start")
+
+
+def start_bench_server(tmp_path: Path) -> Tuple[subprocess.Popen, str]:
+    """Run create_bench_app under uvicorn on a free port; the caller terminates the process."""
+    port = free_port()
+    env = dict(
+        os.environ,
+        BENCH_DATABASE_URL=f"sqlite:///{tmp_path / 'bench.db'}",
+        BENCH_UPLOAD_DIR=str(tmp_path / "uploads"),
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "--factory", "benchmarks.upload_memory:create_bench_app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    wait_for_server(base_url)
+    return server, base_url
+
+
+def write_body(path: Path, size_mb: int) -> None:
+    with path.open("wb") as handle:
+        for _ in range(size_mb):
+            handle.write(os.urandom(1024 * 1024))
+
+
+class UniqueBody:
+    """The shared body file followed by a per-request suffix, so content-hash dedup never matches."""
+
+    def __init__(self, body_path: Path, suffix: bytes) -> None:
+        self._handle = body_path.open("rb")
+        self._body_size = body_path.stat().st_size
+        self._suffix = suffix
+        self._position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        total = self._body_size + len(self._suffix)
+        end = total if size < 0 else min(total, self._position + size)
+        chunk = b""
+        if self._position < self._body_size:
+            self._handle.seek(self._position)
+            chunk = self._handle.read(min(end, self._body_size) - self._position)
+        if end > self._body_size:
+            chunk += self._suffix[max(0, self._position - self._body_size) : end - self._body_size]
+        self._position = end
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._position, os.SEEK_END: self._body_size + len(self._suffix)}[whence]
+        self._position = base + offset
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+async def upload_all(base_url: str, body_path: Path, concurrency: int) -> list:
+    async with httpx.AsyncClient(base_url=base_url, timeout=300) as client:
+
+        async def _one(index: int) -> int:
+            body = UniqueBody(body_path, f"upload-{index}-{os.getpid()}".encode("ascii"))
+            try:
+                response = await client.post("/api/uploads", files={"file": (f"shot-{index}.png", body, "image/png")})
+            finally:
+                body.close()
+            return response.status_code
+
+        return await asyncio.gather(*(_one(index) for index in range(concurrency)))
+
+
+def require_all_created(statuses: list, expected: int) -> None:
+    """Every request must store a new row; duplicates or errors would skew the measurement."""
+    created = list(statuses).count(201)
+    if created != expected:
+        raise SystemExit(f"expected {expected} created uploads (201), got {created}: {sorted(set(statuses))}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--size-mb", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        body_path = tmp_path / "body.bin"
+        write_body(body_path, args.size_mb)
+
+        server, base_url = start_bench_server(tmp_path)
+        try:
+            baseline_kb = _peak_rss_kb(server.pid)
+            started = time.perf_counter()
+            statuses = asyncio.run(upload_all(base_url, body_path, args.concurrency))
+            elapsed = time.perf_counter() - started
+            peak_kb = _peak_rss_kb(server.pid)
+        finally:
+            server.terminate()
+            server.wait()
+    require_all_created(statuses, args.concurrency)
+
+    print(f"uploads={args.concurrency} size_mb={args.size_mb} ok={statuses.count(201)} elapsed_s={elapsed:.2f}")
+    print(f"server_peak_rss_mb baseline={baseline_kb / 1024:.1f} after={peak_kb / 1024:.1f} delta={(peak_kb - baseline_kb) / 1024:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Before/after benchmark for _save_parsed_session.
+
+Parses a synthetic 40-exercise / 200-set Fleek OCR payload and persists it with
+the legacy row-by-row path (add + flush per exercise) and with the current
+batched path, reporting wall time and SQL statement count for each.
+
+    python -m benchmarks.upload_persist --repeat 20
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import event
+
+from app.database import build_engine, build_session_factory
+from app.migrate import run_migrations
+from app.models import Exercise, ExerciseSet, Upload, WorkoutSession
+from app.services.parser import parse_fleek_ocr_v1_session
+from app.workers.process_upload import _save_parsed_session
+
+EXERCISE_COUNT = 40
+SETS_PER_EXERCISE = 5
+
+
+def build_synthetic_ocr(exercise_count: int = EXERCISE_COUNT, sets_per_exercise: int = SETS_PER_EXERCISE) -> str:
+    lines = [
+        "2026.02.07",
+        "612 KCAL 138 min 48000 kg",
+        f"{exercise_count} EXERCISES {exercise_count * sets_per_exercise} sets 2000 reps 348 kg/min",
+    ]
+    for index in range(exercise_count):
+        lines.append(f"머신 운동 {index + 1:02d}")
+        lines.append(f"MAX Weight: {20 + index}kg | 1RM: {30 + index}kg")
+        lines.append(" ".join(str(10 + 5 * set_index + index) for set_index in range(sets_per_exercise)))
+        lines.append(" ".join(f"{12 - set_index}X" for set_index in range(sets_per_exercise)))
+    return "\n".join(lines)
+
+
+def _save_parsed_session_row_by_row(session, upload: Upload, parsed: Dict) -> WorkoutSession:
+    # Pre-batching implementation, kept here as the benchmark baseline.
+    summary = parsed.get("summary", {}) or {}
+    workout_session = WorkoutSession(
+        upload_id=upload.id,
+        date=date.fromisoformat(summary["date"]),
+        calories_kcal=summary.get("calories_kcal"),
+        duration_min=summary.get("duration_min"),
+        volume_kg=summary.get("volume_kg"),
+    )
+    session.add(workout_session)
+    session.flush()
+    for exercise_index, exercise_data in enumerate(parsed.get("exercises", []) or [], start=1):
+        exercise = Exercise(
+            session_id=workout_session.id,
+            raw_name=str(exercise_data.get("raw_name", "")).strip() or f"exercise_{exercise_index}",
+            order_index=exercise_index,
+        )
+        session.add(exercise)
+        session.flush()
+        for set_index, set_data in enumerate(exercise_data.get("sets", []) or [], start=1):
+            session.add(
+                ExerciseSet(
+                    exercise_id=exercise.id,
+                    set_index=set_index,
+                    weight_kg=set_data.get("weight_kg"),
+                    reps=int(set_data.get("reps", 0)),
+                )
+            )
+    return workout_session
+
+
+def _measure(session_factory, engine, save: Callable, parsed, repeat: int) -> Tuple[List[float], int]:
+    statements: List[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    timings = []
+    for _ in range(repeat):
+        db = session_factory()
+        try:
+            upload = Upload(id=uuid.uuid4(), filename="bench.png", status="processing", parser_version="bench")
+            db.add(upload)
+            db.commit()
+            statements.clear()
+            event.listen(engine, "before_cursor_execute", _count)
+            started = time.perf_counter()
+            save(db, upload, parsed)
+            db.commit()
+            timings.append(time.perf_counter() - started)
+            event.remove(engine, "before_cursor_execute", _count)
+        finally:
+            db.close()
+    return timings, len(statements)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    parsed = parse_fleek_ocr_v1_session(build_synthetic_ocr())
+    print(f"payload exercises={len(parsed.exercises)} sets={parsed.set_count}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label, save, payload in (
+            ("row_by_row", _save_parsed_session_row_by_row, parsed.to_dict()),
+            ("batched", _save_parsed_session, parsed),
+        ):
+            engine = build_engine(f"sqlite:///{Path(tmp_dir) / f'{label}.db'}")
+            run_migrations(engine)
+            timings, statement_count = _measure(build_session_factory(engine), engine, save, payload, args.repeat)
+            print(
+                f"{label:>10} median_ms={statistics.median(timings) * 1000:8.2f} "
+                f"min_ms={min(timings) * 1000:8.2f} statements={statement_count}"
+            )
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
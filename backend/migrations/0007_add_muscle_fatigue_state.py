@@ -0,0 +1,37 @@
+REVISION = "0007_add_muscle_fatigue_state"
+
+# Creates the table empty: the decay math lives in Python, so existing sessions are folded in by
+# `python -m app.fatigue_state_cli rebuild`, which must run once before serving source=state.
+
+
+def _sqlite_upgrade(conn) -> None:
+    conn.exec_driver_sql(
+        """
+        CREATE TABLE IF NOT EXISTS muscle_fatigue_state (
+            muscle_code TEXT PRIMARY KEY,
+            fatigue_raw REAL NOT NULL DEFAULT 0,
+            anchor_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+
+def _postgres_upgrade(conn) -> None:
+    conn.exec_driver_sql(
+        """
+        CREATE TABLE IF NOT EXISTS muscle_fatigue_state (
+            muscle_code VARCHAR(64) PRIMARY KEY,
+            fatigue_raw DOUBLE PRECISION NOT NULL DEFAULT 0,
+            anchor_at TIMESTAMPTZ NOT NULL,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+        """
+    )
+
+
+def upgrade(conn, dialect_name: str) -> None:
+    if dialect_name == "sqlite":
+        _sqlite_upgrade(conn)
+        return
+    _postgres_upgrade(conn)
@@ -0,0 +1,40 @@
+REVISION = "0008_add_data_versions"
+
+
+def _sqlite_upgrade(conn) -> None:
+    conn.exec_driver_sql(
+        """
+        CREATE TABLE IF NOT EXISTS data_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+
+def _postgres_upgrade(conn) -> None:
+    conn.exec_driver_sql(
+        """
+        CREATE TABLE IF NOT EXISTS data_versions (
+            name VARCHAR(64) PRIMARY KEY,
+            version BIGINT NOT NULL DEFAULT 0,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+        """
+    )
+
+
+def upgrade(conn, dialect_name: str) -> None:
+    if dialect_name == "sqlite":
+        _sqlite_upgrade(conn)
+    else:
+        _postgres_upgrade(conn)
+
+    conn.exec_driver_sql(
+        """
+        INSERT INTO data_versions (name, version)
+        SELECT 'sessions', 0
+        WHERE NOT EXISTS (SELECT 1 FROM data_versions WHERE name = 'sessions')
+        """
+    )
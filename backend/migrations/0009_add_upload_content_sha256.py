@@ -0,0 +1,27 @@
+REVISION = "0009_add_upload_content_sha256"
+
+
+def _sqlite_has_column(conn, table_name: str, column_name: str) -> bool:
+    rows = conn.exec_driver_sql(f"PRAGMA table_info({table_name})").fetchall()
+    return any(r[1] == column_name for r in rows)
+
+
+def _sqlite_upgrade(conn) -> None:
+    if not _sqlite_has_column(conn, "uploads", "content_sha256"):
+        conn.exec_driver_sql("ALTER TABLE uploads ADD COLUMN content_sha256 TEXT")
+
+
+def _postgres_upgrade(conn) -> None:
+    conn.exec_driver_sql("ALTER TABLE uploads ADD COLUMN IF NOT EXISTS content_sha256 VARCHAR(64)")
+
+
+def upgrade(conn, dialect_name: str) -> None:
+    if dialect_name == "sqlite":
+        _sqlite_upgrade(conn)
+    else:
+        _postgres_upgrade(conn)
+
+    # Legacy rows keep NULL, which both dialects allow to repeat under a unique index.
+    conn.exec_driver_sql(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_uploads_content_sha256 ON uploads (content_sha256)"
+    )
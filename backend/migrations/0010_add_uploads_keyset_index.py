@@ -0,0 +1,12 @@
+REVISION = "0010_add_uploads_keyset_index"
+
+
+def upgrade(conn, dialect_name: str) -> None:
+    if dialect_name == "sqlite":
+        # CURRENT_TIMESTAMP rows lack the fractional part the ORM writes; align them so
+        # text comparison of (created_at, id) cursors matches the stored ordering.
+        conn.exec_driver_sql(
+            "UPDATE uploads SET created_at = created_at || '.000000' WHERE length(created_at) = 19"
+        )
+
+    conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS idx_uploads_created_at_id ON uploads(created_at, id)")
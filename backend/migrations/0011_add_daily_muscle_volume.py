@@ -0,0 +1,57 @@
+REVISION = "0011_add_daily_muscle_volume"
+
+
+def _sqlite_upgrade(conn) -> None:
+    conn.exec_driver_sql(
+        """
+        CREATE TABLE IF NOT EXISTS daily_muscle_volume (
+            date DATE NOT NULL,
+            muscle_code TEXT NOT NULL,
+            raw_name TEXT NOT NULL,
+            volume REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (date, muscle_code, raw_name)
+        )
+        """
+    )
+    conn.exec_driver_sql(
+        """
+        CREATE TABLE IF NOT EXISTS daily_unmapped_exercises (
+            date DATE NOT NULL,
+            raw_name TEXT NOT NULL,
+            exercise_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (date, raw_name)
+        )
+        """
+    )
+
+
+def _postgres_upgrade(conn) -> None:
+    conn.exec_driver_sql(
+        """
+        CREATE TABLE IF NOT EXISTS daily_muscle_volume (
+            date DATE NOT NULL,
+            muscle_code VARCHAR(64) NOT NULL,
+            raw_name VARCHAR(255) NOT NULL,
+            volume DOUBLE PRECISION NOT NULL DEFAULT 0,
+            PRIMARY KEY (date, muscle_code, raw_name)
+        )
+        """
+    )
+    conn.exec_driver_sql(
+        """
+        CREATE TABLE IF NOT EXISTS daily_unmapped_exercises (
+            date DATE NOT NULL,
+            raw_name VARCHAR(255) NOT NULL,
+            exercise_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (date, raw_name)
+        )
+        """
+    )
+
+
+def upgrade(conn, dialect_name: str) -> None:
+    # Existing sessions are not backfilled here; run `python -m app.daily_volume_cli rebuild`.
+    if dialect_name == "sqlite":
+        _sqlite_upgrade(conn)
+        return
+    _postgres_upgrade(conn)
@@ -0,0 +1,62 @@
+REVISION = "0012_add_upload_job_stats"
+
+
+def _sqlite_upgrade(conn) -> None:
+    conn.exec_driver_sql(
+        """
+        CREATE TABLE IF NOT EXISTS upload_job_stats (
+            id TEXT PRIMARY KEY,
+            upload_id TEXT NOT NULL,
+            parser_version TEXT NOT NULL,
+            status TEXT NOT NULL,
+            batch_size INTEGER NOT NULL DEFAULT 1,
+            started_at TEXT NOT NULL,
+            total_ms REAL NOT NULL,
+            load_upload_ms REAL,
+            file_check_ms REAL,
+            parse_ms REAL,
+            persist_ms REAL,
+            commit_ms REAL,
+            line_count INTEGER,
+            exercise_count INTEGER,
+            set_count INTEGER,
+            confidence REAL
+        )
+        """
+    )
+
+
+def _postgres_upgrade(conn) -> None:
+    conn.exec_driver_sql(
+        """
+        CREATE TABLE IF NOT EXISTS upload_job_stats (
+            id UUID PRIMARY KEY,
+            upload_id UUID NOT NULL,
+            parser_version VARCHAR(64) NOT NULL,
+            status VARCHAR(32) NOT NULL,
+            batch_size INTEGER NOT NULL DEFAULT 1,
+            started_at TIMESTAMPTZ NOT NULL,
+            total_ms DOUBLE PRECISION NOT NULL,
+            load_upload_ms DOUBLE PRECISION,
+            file_check_ms DOUBLE PRECISION,
+            parse_ms DOUBLE PRECISION,
+            persist_ms DOUBLE PRECISION,
+            commit_ms DOUBLE PRECISION,
+            line_count INTEGER,
+            exercise_count INTEGER,
+            set_count INTEGER,
+            confidence DOUBLE PRECISION
+        )
+        """
+    )
+
+
+def upgrade(conn, dialect_name: str) -> None:
+    if dialect_name == "sqlite":
+        _sqlite_upgrade(conn)
+    else:
+        _postgres_upgrade(conn)
+
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS idx_upload_job_stats_version_started ON upload_job_stats (parser_version, started_at)"
+    )
@@ -0,0 +1,43 @@
+from app.cache import TTLLRUCache
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_evicts_least_recently_used_entry() -> None:
+    cache = TTLLRUCache(max_entries=2, max_bytes=1000, ttl_seconds=60)
+    cache.put("a", 1, 10)
+    cache.put("b", 2, 10)
+    assert cache.get("a") == 1
+    cache.put("c", 3, 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+
+def test_cache_enforces_byte_cap_and_ttl() -> None:
+    clock = _FakeClock()
+    cache = TTLLRUCache(max_entries=10, max_bytes=100, ttl_seconds=5, clock=clock)
+    cache.put("big", "x", 101)
+    cache.put("a", "a", 60)
+    cache.put("b", "b", 60)
+    assert cache.get("big") is None
+    assert cache.get("a") is None
+    assert cache.get("b") == "b"
+
+    clock.now = 5.0
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["entries"] == 0
+    assert stats["bytes"] == 0
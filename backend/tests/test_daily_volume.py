@@ -0,0 +1,123 @@
+import uuid
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+
+from app.database import build_engine, build_session_factory
+from app.migrate import run_migrations
+from app.models import DailyMuscleVolume, Exercise, ExerciseSet, Upload, WorkoutSession
+from app.services.daily_volume import apply_session_to_daily_volume, rebuild_daily_volume
+from app.services.recovery_engine_v0 import compute_recovery_series, compute_recovery_v0
+from app.workers.process_upload import process_upload_job
+
+
+def _make_db(tmp_path: Path):
+    database_url = f"sqlite:///{tmp_path / 'daily_volume_test.db'}"
+    engine = build_engine(database_url)
+    run_migrations(engine)
+    return database_url, build_session_factory(engine)
+
+
+def _add_session(db, session_date: date, exercises: list) -> uuid.UUID:
+    session_row = WorkoutSession(id=uuid.uuid4(), upload_id=None, date=session_date)
+    db.add(session_row)
+    db.flush()
+    for order_index, (raw_name, sets) in enumerate(exercises, start=1):
+        exercise = Exercise(id=uuid.uuid4(), session_id=session_row.id, raw_name=raw_name, order_index=order_index)
+        db.add(exercise)
+        db.flush()
+        for set_index, (weight, reps) in enumerate(sets, start=1):
+            db.add(ExerciseSet(id=uuid.uuid4(), exercise_id=exercise.id, set_index=set_index, weight_kg=weight, reps=reps))
+    db.flush()
+    return session_row.id
+
+
+def _assert_same_recovery(rollup: dict, joined: dict) -> None:
+    assert rollup["unmapped_exercises"] == joined["unmapped_exercises"]
+    for code, muscle in joined["muscles"].items():
+        assert rollup["muscles"][code]["fatigue_raw"] == pytest.approx(muscle["fatigue_raw"], abs=0.011)
+        assert [item["raw_name"] for item in rollup["muscles"][code]["contributors"]] == [
+            item["raw_name"] for item in muscle["contributors"]
+        ]
+
+
+def test_incremental_rollup_matches_joined_engine_and_rebuild(tmp_path: Path) -> None:
+    _, session_factory = _make_db(tmp_path)
+    db = session_factory()
+    try:
+        # Two sessions on the same day exercise the upsert increment.
+        for session_date, exercises in [
+            (date(2026, 2, 3), [("바벨 플랫 벤치 프레스", [(80.0, 10), (80.0, 8)]), ("없는 운동", [(10.0, 10)])]),
+            (date(2026, 2, 5), [("스쿼트", [(100.0, 10)]), ("풀 업", [(None, 12)])]),
+            (date(2026, 2, 5), [("스쿼트", [(90.0, 8)]), ("없는 운동", [(10.0, 10)])]),
+        ]:
+            apply_session_to_daily_volume(db, _add_session(db, session_date, exercises))
+        db.commit()
+
+        window = {"from_dt": date(2026, 2, 1), "to_dt": date(2026, 2, 8)}
+        incremental = compute_recovery_v0(db, use_rollup=True, **window)
+        joined = compute_recovery_v0(db, **window)
+        _assert_same_recovery(incremental, joined)
+        assert incremental["unmapped_exercises"] == [{"raw_name": "없는 운동", "count": 2}]
+        squat_rows = db.execute(
+            select(DailyMuscleVolume).where(DailyMuscleVolume.raw_name == "스쿼트", DailyMuscleVolume.muscle_code == "legs")
+        ).scalars().all()
+        assert [(row.date, row.volume) for row in squat_rows] == [(date(2026, 2, 5), pytest.approx(1720.0 * 0.8))]
+
+        incremental_rows = sorted((row.date, row.muscle_code, row.raw_name, row.volume) for row in db.execute(select(DailyMuscleVolume)).scalars())
+        assert rebuild_daily_volume(db) == len(incremental_rows)
+        db.commit()
+        rebuilt_rows = sorted((row.date, row.muscle_code, row.raw_name, row.volume) for row in db.execute(select(DailyMuscleVolume)).scalars())
+        assert rebuilt_rows == incremental_rows
+
+        series = compute_recovery_series(db, from_date=date(2026, 2, 1), to_date=date(2026, 2, 10), use_rollup=True)
+        joined_series = compute_recovery_series(db, from_date=date(2026, 2, 1), to_date=date(2026, 2, 10))
+        for point, joined_point in zip(series["points"], joined_series["points"]):
+            for code, muscle in joined_point["muscles"].items():
+                assert point["muscles"][code]["fatigue_raw"] == pytest.approx(muscle["fatigue_raw"], abs=0.011)
+    finally:
+        db.close()
+
+
+def test_worker_writes_rollup_in_parse_transaction(tmp_path: Path) -> None:
+    database_url, session_factory = _make_db(tmp_path)
+    upload_id = uuid.uuid4()
+    file_path = tmp_path / "uploads" / f"{upload_id}.png"
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(b"png-bytes")
+
+    db = session_factory()
+    db.add(
+        Upload(
+            id=upload_id,
+            filename="test.png",
+            original_filename="test.png",
+            status="pending",
+            storage_path=str(file_path),
+            parser_version="tc04-parser-v1",
+            ocr_text_raw="""
+2026.02.07
+200 KCAL 40 min 3000 kg
+1 EXERCISES 2 sets 20 reps 75 kg/min
+스쿼트
+20 40
+10X 10X
+""",
+        )
+    )
+    db.commit()
+    db.close()
+
+    result = process_upload_job({"upload_id": str(upload_id), "storage_path": str(file_path)}, database_url=database_url)
+    assert result["status"] == "parsed"
+
+    db = session_factory()
+    try:
+        window = {"from_dt": date(2026, 2, 1), "to_dt": date(2026, 2, 8)}
+        rollup = compute_recovery_v0(db, use_rollup=True, **window)
+        assert rollup["muscles"]["legs"]["fatigue_raw"] > 0
+        _assert_same_recovery(rollup, compute_recovery_v0(db, **window))
+    finally:
+        db.close()
@@ -0,0 +1,46 @@
+import os
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from app.database import dispose_engines, get_engine, get_session_factory
+
+
+def test_engine_registry_reuses_engine_per_url(tmp_path: Path) -> None:
+    first_url = f"sqlite:///{tmp_path / 'first.db'}"
+    second_url = f"sqlite:///{tmp_path / 'second.db'}"
+
+    engine = get_engine(first_url)
+    assert get_engine(first_url) is engine
+    assert get_session_factory(first_url) is get_session_factory(first_url)
+    assert get_session_factory(first_url).kw["bind"] is engine
+    assert get_engine(second_url) is not engine
+
+    dispose_engines()
+    assert get_engine(first_url) is not engine
+    dispose_engines()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is POSIX-only")
+def test_forked_child_does_not_reuse_parent_connections(tmp_path: Path) -> None:
+    database_url = f"sqlite:///{tmp_path / 'fork.db'}"
+    engine = get_engine(database_url)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert engine.pool.checkedin() == 1
+
+    pid = os.fork()
+    if pid == 0:
+        # Child: the inherited pool was replaced, and the registry still hands out a working engine.
+        ok = get_engine(database_url) is engine and engine.pool.checkedin() == 0
+        with engine.connect() as conn:
+            ok = ok and conn.execute(text("SELECT 1")).scalar() == 1
+        os._exit(0 if ok else 1)
+
+    _, wait_status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(wait_status) == 0
+    assert engine.pool.checkedin() == 1
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+    dispose_engines()
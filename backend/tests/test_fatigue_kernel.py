@@ -0,0 +1,42 @@
+import pytest
+
+from app.services.fatigue_kernel import FatigueColumns, accumulate_decayed_fatigue
+
+
+def _columns() -> FatigueColumns:
+    return FatigueColumns(
+        half_lives=[48.0, 72.0, 48.0],
+        contributor_names=["스쿼트", "바벨 플랫 벤치 프레스", "데드리프트"],
+        volumes=[2000.0, 2000.0, 1440.0, 1440.0, 900.0, 900.0],
+        weights=[0.8, 0.2, 0.6, 0.2, 0.5, 0.3],
+        delta_hours=[12.0, 12.0, 36.0, 36.0, 84.0, 84.0],
+        muscle_idx=[1, 2, 0, 2, 1, 2],
+        contributor_idx=[0, 0, 1, 1, 2, 2],
+    )
+
+
+def test_python_kernel_accumulates_per_muscle_and_contributor() -> None:
+    totals = accumulate_decayed_fatigue(_columns(), use_numpy=False)
+
+    assert totals.fatigue_raw[0] > 0
+    assert list(totals.contributors[0]) == ["바벨 플랫 벤치 프레스"]
+    assert list(totals.contributors[2]) == ["스쿼트", "바벨 플랫 벤치 프레스", "데드리프트"]
+    assert totals.fatigue_raw[2] == pytest.approx(sum(totals.contributors[2].values()))
+
+
+def test_numpy_kernel_matches_python_kernel() -> None:
+    pytest.importorskip("numpy")
+    python_totals = accumulate_decayed_fatigue(_columns(), use_numpy=False)
+    numpy_totals = accumulate_decayed_fatigue(_columns(), use_numpy=True)
+
+    assert numpy_totals.fatigue_raw == pytest.approx(python_totals.fatigue_raw, rel=1e-12)
+    for numpy_contrib, python_contrib in zip(numpy_totals.contributors, python_totals.contributors):
+        assert list(numpy_contrib) == list(python_contrib)
+        assert list(numpy_contrib.values()) == pytest.approx(list(python_contrib.values()), rel=1e-12)
+
+
+def test_empty_columns_return_zero_fatigue() -> None:
+    totals = accumulate_decayed_fatigue(FatigueColumns(half_lives=[48.0, 72.0]))
+
+    assert totals.fatigue_raw == [0.0, 0.0]
+    assert totals.contributors == [{}, {}]
@@ -0,0 +1,110 @@
+import uuid
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import select
+
+from app.database import build_engine, build_session_factory
+from app.migrate import run_migrations
+from app.models import Exercise, ExerciseSet, MuscleFatigueState, Upload, WorkoutSession
+from app.services.fatigue_state import (
+    apply_session_to_fatigue_state,
+    check_fatigue_state,
+    compute_recovery_from_state,
+    rebuild_fatigue_state,
+)
+from app.services.recovery_engine_v0 import compute_recovery_v0
+from app.workers.process_upload import process_upload_job
+
+
+def _make_db(tmp_path: Path):
+    database_url = f"sqlite:///{tmp_path / 'fatigue_state_test.db'}"
+    engine = build_engine(database_url)
+    run_migrations(engine)
+    return database_url, build_session_factory(engine)
+
+
+def _add_session(db, session_date: date, raw_name: str, sets: list) -> uuid.UUID:
+    session_row = WorkoutSession(id=uuid.uuid4(), upload_id=None, date=session_date)
+    db.add(session_row)
+    db.flush()
+    exercise = Exercise(id=uuid.uuid4(), session_id=session_row.id, raw_name=raw_name, order_index=1)
+    db.add(exercise)
+    db.flush()
+    for set_index, (weight, reps) in enumerate(sets, start=1):
+        db.add(ExerciseSet(id=uuid.uuid4(), exercise_id=exercise.id, set_index=set_index, weight_kg=weight, reps=reps))
+    db.flush()
+    return session_row.id
+
+
+def test_incremental_state_matches_full_recompute(tmp_path: Path) -> None:
+    _, session_factory = _make_db(tmp_path)
+    db = session_factory()
+    try:
+        # Applied out of date order to exercise the backdated branch.
+        for session_date, raw_name, sets in [
+            (date(2026, 2, 5), "바벨 플랫 벤치 프레스", [(80.0, 10), (80.0, 8)]),
+            (date(2026, 2, 7), "스쿼트", [(100.0, 10)]),
+            (date(2026, 2, 3), "데드리프트", [(120.0, 5)]),
+        ]:
+            session_id = _add_session(db, session_date, raw_name, sets)
+            apply_session_to_fatigue_state(db, session_id)
+        db.commit()
+
+        assert check_fatigue_state(db, at=date(2026, 2, 8)) == []
+
+        from_state = compute_recovery_from_state(db, to_dt=date(2026, 2, 8))
+        full = compute_recovery_v0(db, from_dt=date(2026, 1, 1), to_dt=date(2026, 2, 8))
+        for code, muscle in full["muscles"].items():
+            assert from_state["muscles"][code]["fatigue_raw"] == muscle["fatigue_raw"]
+
+        db.execute(MuscleFatigueState.__table__.update().values(fatigue_raw=0.0))
+        db.commit()
+        assert check_fatigue_state(db, at=date(2026, 2, 8)) != []
+
+        assert rebuild_fatigue_state(db) > 0
+        db.commit()
+        assert check_fatigue_state(db, at=date(2026, 2, 8)) == []
+    finally:
+        db.close()
+
+
+def test_worker_updates_fatigue_state_on_parse(tmp_path: Path) -> None:
+    database_url, session_factory = _make_db(tmp_path)
+    upload_id = uuid.uuid4()
+    file_path = tmp_path / "uploads" / f"{upload_id}.png"
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(b"png-bytes")
+
+    db = session_factory()
+    db.add(
+        Upload(
+            id=upload_id,
+            filename="test.png",
+            original_filename="test.png",
+            status="pending",
+            storage_path=str(file_path),
+            parser_version="tc04-parser-v1",
+            ocr_text_raw="""
+2026.02.07
+200 KCAL 40 min 3000 kg
+1 EXERCISES 2 sets 20 reps 75 kg/min
+스쿼트
+20 40
+10X 10X
+""",
+        )
+    )
+    db.commit()
+    db.close()
+
+    result = process_upload_job({"upload_id": str(upload_id), "storage_path": str(file_path)}, database_url=database_url)
+    assert result["status"] == "parsed"
+
+    db = session_factory()
+    try:
+        legs = db.execute(select(MuscleFatigueState).where(MuscleFatigueState.muscle_code == "legs")).scalar_one()
+        assert legs.fatigue_raw == 480.0
+        assert check_fatigue_state(db) == []
+    finally:
+        db.close()
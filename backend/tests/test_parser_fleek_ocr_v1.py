@@ -1,4 +1,17 @@
-from app.services.parser import parse_fleek_ocr_v1
+import math
+import pickle
+
+from app.services.parser import (
+    LINE_HEADER,
+    LINE_MAX_WEIGHT,
+    LINE_REPS,
+    LINE_TOTAL_REPS,
+    LINE_WEIGHTS,
+    _classify_line,
+    _clean_lines,
+    parse_fleek_ocr_v1,
+    parse_fleek_ocr_v1_session,
+)
 
 
 FIXTURE_TEXT = """
@@ -73,3 +86,48 @@ Total Reps: 30
     assert parsed["meta"]["confidence"] <= 0.45
     assert any("summary" in warning for warning in parsed["meta"]["warnings"])
 
+def test_session_ir_uses_parallel_arrays_and_matches_dict_output() -> None:
+    parsed = parse_fleek_ocr_v1_session(FIXTURE_TEXT)
+    assert parsed.to_dict() == parse_fleek_ocr_v1(FIXTURE_TEXT)
+    assert parsed.set_count == 10
+
+    bench, pull_up, _ = parsed.exercises
+    assert (bench.weights.typecode, bench.reps.typecode) == ("d", "i")
+    assert list(bench.reps) == [12, 10, 5, 5]
+    assert all(math.isnan(weight) for weight in pull_up.weights)
+    assert list(pull_up.iter_sets()) == [(None, 15)] * 3
+    # The re-parse command ships results back from worker processes.
+    assert pickle.loads(pickle.dumps(parsed)).to_dict() == parsed.to_dict()
+
+
+def test_lines_are_classified_once_by_kind() -> None:
+    kinds = [_classify_line(line).kind for line in _clean_lines(FIXTURE_TEXT)[4:11]]
+    assert kinds == [
+        LINE_HEADER,
+        LINE_MAX_WEIGHT,
+        LINE_WEIGHTS,
+        LINE_REPS,
+        LINE_HEADER,
+        LINE_TOTAL_REPS,
+        LINE_WEIGHTS,
+    ]
+
+
+def test_reps_beyond_int_array_range_are_dropped_with_warning() -> None:
+    text = """
+2026.02.07
+200 KCAL 40 min 3000 kg
+2 EXERCISES 5 sets 30 reps 75 kg/min
+스쿼트
+20 40
+10X 99999999999X
+풀 업
+Total Reps: 20
+10 10 99999999999
+"""
+    parsed = parse_fleek_ocr_v1_session(text)
+    squat, pull_up = parsed.exercises
+    assert list(squat.iter_sets()) == [(20.0, 10)]
+    assert list(pull_up.reps) == [10, 10]
+    assert parsed.warnings == ["reps_out_of_range:스쿼트", "reps_out_of_range:풀 업"]
+    assert parsed.needs_review is True
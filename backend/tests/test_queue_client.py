@@ -0,0 +1,53 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError
+
+from app.main import create_app
+from app.queue_client import UploadQueueClient
+
+
+def test_queue_client_counts_failed_enqueues_without_leaking_connections() -> None:
+    client = UploadQueueClient("redis://127.0.0.1:1/0", max_connections=4, retries=0)
+    try:
+        with pytest.raises(ConnectionError):
+            client.enqueue({"upload_id": "u-1"})
+        with pytest.raises(ConnectionError):
+            client.enqueue_many([{"upload_id": "u-2"}, {"upload_id": "u-3"}])
+
+        stats = client.stats()
+        assert stats["enqueue_calls"] == 2
+        assert stats["enqueue_errors"] == 2
+        assert stats["enqueued_jobs"] == 0
+        assert stats["connections_in_use"] == 0
+        assert stats["max_connections"] == 4
+    finally:
+        client.close()
+
+
+def test_queue_client_stats_survive_missing_private_pool_attributes() -> None:
+    client = UploadQueueClient("redis://127.0.0.1:1/0", max_connections=4, retries=0)
+    pool = client._pool
+    try:
+        # Stand-in for a redis-py release without the private counters.
+        client._pool = SimpleNamespace(max_connections=4)
+        stats = client.stats()
+        assert stats["max_connections"] == 4
+        assert "connections_in_use" not in stats
+    finally:
+        client._pool = pool
+        client.close()
+
+
+def test_queue_stats_endpoint_reports_disabled_for_custom_enqueue(tmp_path: Path) -> None:
+    app = create_app(
+        database_url=f"sqlite:///{tmp_path / 'queue_stats.db'}",
+        enqueue_func=lambda _: "job-test",
+        upload_dir=str(tmp_path / "uploads"),
+        auto_migrate=True,
+    )
+    with TestClient(app) as client:
+        assert client.get("/api/queue/stats").json() == {"enabled": False}
+    assert app.state.queue_client is None
@@ -2,10 +2,13 @@ import uuid
 from datetime import date
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 
 from app.main import create_app
 from app.models import Exercise, ExerciseSet, WorkoutSession
+from app.services.data_version import bump_data_version
+from app.services.fatigue_state import rebuild_fatigue_state
 
 
 def _build_test_app(tmp_path: Path):
@@ -82,3 +85,149 @@ def test_recovery_api_supports_from_to_params(tmp_path: Path) -> None:
     payload = response.json()
     assert payload["window"]["from"] == "2026-02-01"
     assert payload["window"]["to"] == "2026-02-10"
+
+
+def test_recovery_api_reads_materialized_state(tmp_path: Path) -> None:
+    app = _build_test_app(tmp_path)
+    _seed_mapped_session(app, date(2026, 2, 7))
+    db = app.state.session_factory()
+    try:
+        rebuild_fatigue_state(db)
+        db.commit()
+    finally:
+        db.close()
+    client = TestClient(app)
+
+    from_state = client.get("/api/recovery", params={"source": "state", "to": "2026-02-08"}).json()
+    from_window = client.get("/api/recovery", params={"from": "2026-02-01", "to": "2026-02-08"}).json()
+
+    assert from_state["window"]["to"] == "2026-02-08"
+    assert from_state["muscles"]["chest"]["fatigue_raw"] == from_window["muscles"]["chest"]["fatigue_raw"]
+    assert from_state["muscles"]["chest"]["contributors"] == []
+    assert client.get("/api/recovery", params={"source": "bogus"}).status_code == 422
+
+
+def test_recovery_api_state_source_rejects_windows_and_past_dates(tmp_path: Path) -> None:
+    app = _build_test_app(tmp_path)
+    _seed_mapped_session(app, date(2026, 2, 7))
+    db = app.state.session_factory()
+    try:
+        rebuild_fatigue_state(db)
+        db.commit()
+    finally:
+        db.close()
+    client = TestClient(app)
+
+    for params in ({"days": 3}, {"from": "2026-02-01", "to": "2026-02-08"}):
+        response = client.get("/api/recovery", params={"source": "state", **params})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "state_source_has_no_window"
+    # The state already folds in the 2026-02-07 session; it cannot be rewound to an earlier day.
+    past = client.get("/api/recovery", params={"source": "state", "to": "2026-02-06"})
+    assert past.status_code == 400
+    assert past.json()["detail"] == "state_anchor_after_requested_time"
+
+
+def test_recovery_api_numpy_kernel_matches_default(tmp_path: Path, monkeypatch) -> None:
+    pytest.importorskip("numpy")
+    responses = []
+    for enabled in ("", "1"):
+        monkeypatch.setenv("RECOVERY_USE_NUMPY", enabled)
+        app_dir = tmp_path / f"numpy{enabled or '0'}"
+        app_dir.mkdir()
+        app = _build_test_app(app_dir)
+        assert app.state.recovery_use_numpy is bool(enabled)
+        _seed_mapped_session(app, date(2026, 2, 5))
+        _seed_mapped_session(app, date(2026, 2, 7))
+        responses.append(TestClient(app).get("/api/recovery", params={"from": "2026-02-01", "to": "2026-02-08"}).json())
+
+    python_payload, numpy_payload = responses
+    assert numpy_payload["unmapped_exercises"] == python_payload["unmapped_exercises"]
+    for code, muscle in python_payload["muscles"].items():
+        assert numpy_payload["muscles"][code]["fatigue_raw"] == pytest.approx(muscle["fatigue_raw"], rel=1e-9)
+        assert numpy_payload["muscles"][code]["status"] == muscle["status"]
+        assert numpy_payload["muscles"][code]["contributors"] == muscle["contributors"]
+
+
+def test_recovery_api_caches_until_data_version_changes(tmp_path: Path) -> None:
+    app = _build_test_app(tmp_path)
+    _seed_mapped_session(app, date(2026, 2, 7))
+    client = TestClient(app)
+    params = {"from": "2026-02-01", "to": "2026-02-08"}
+
+    first = client.get("/api/recovery", params=params).json()
+    _seed_mapped_session(app, date(2026, 2, 7))
+    assert client.get("/api/recovery", params=params).json() == first
+
+    db = app.state.session_factory()
+    try:
+        bump_data_version(db)
+        db.commit()
+    finally:
+        db.close()
+    refreshed = client.get("/api/recovery", params=params).json()
+    assert refreshed["muscles"]["chest"]["fatigue_raw"] > first["muscles"]["chest"]["fatigue_raw"]
+
+    stats = client.get("/api/recovery/cache/stats").json()
+    assert stats["enabled"] is True
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_recovery_series_matches_single_point_calls(tmp_path: Path) -> None:
+    app = _build_test_app(tmp_path)
+    for session_date in (date(2026, 1, 28), date(2026, 2, 3), date(2026, 2, 7), date(2026, 2, 7), date(2026, 2, 20)):
+        _seed_mapped_session(app, session_date)
+    client = TestClient(app)
+
+    response = client.get("/api/recovery/series", params={"from": "2026-02-01", "to": "2026-02-28", "days": 5})
+    assert response.status_code == 200
+    series = response.json()
+    assert series["window"] == {"days": 5, "from": "2026-02-01", "to": "2026-02-28", "step_days": 1}
+    assert len(series["points"]) == 28
+
+    for point in series["points"]:
+        single = client.get("/api/recovery", params={"to": point["date"], "days": 5}).json()
+        for code, muscle in single["muscles"].items():
+            assert point["muscles"][code]["fatigue_raw"] == pytest.approx(muscle["fatigue_raw"], abs=0.011)
+            assert point["muscles"][code]["status"] == muscle["status"]
+
+    stepped = client.get("/api/recovery/series", params={"from": "2026-02-01", "to": "2026-02-28", "step_days": 7}).json()
+    assert [point["date"] for point in stepped["points"]] == ["2026-02-01", "2026-02-08", "2026-02-15", "2026-02-22"]
+    assert client.get("/api/recovery/series", params={"from": "2026-02-10", "to": "2026-02-01"}).status_code == 400
+    assert client.get("/api/recovery/series", params={"from": "2024-01-01", "to": "2026-02-01"}).status_code == 400
+
+
+def test_recovery_stage_timings_and_metrics(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("METRICS_ENABLED", "1")
+    app = _build_test_app(tmp_path)
+    _seed_mapped_session(app, date(2026, 2, 7))
+    client = TestClient(app)
+    params = {"from": "2026-02-01", "to": "2026-02-08"}
+
+    response = client.get("/api/recovery", params=params)
+    server_timing = response.headers["Server-Timing"]
+    for stage in ("exercises_query", "sets_query", "set_aggregation", "mappings_query", "volume_aggregation", "decay", "response_shaping"):
+        assert f"{stage};dur=" in server_timing
+    assert 'sessions;desc="1"' in server_timing
+    assert 'sets;desc="1"' in server_timing
+    assert "cache_lookup;dur=" in client.get("/api/recovery", params=params).headers["Server-Timing"]
+
+    metrics = client.get("/api/metrics")
+    assert metrics.headers["content-type"].startswith("text/plain")
+    body = metrics.text
+    assert "# TYPE recovery_stage_seconds histogram" in body
+    assert 'recovery_stage_seconds_count{endpoint="recovery",stage="decay"} 1' in body
+    assert 'recovery_stage_seconds_count{endpoint="recovery",stage="cache_lookup"} 2' in body
+    assert 'recovery_rows_bucket{endpoint="recovery",kind="sets",le="10"} 1' in body
+    assert "# TYPE recovery_cache_hits_total counter" in body
+    assert "recovery_cache_hits_total 1" in body
+    assert "# TYPE recovery_cache_entries gauge" in body
+
+
+def test_recovery_skips_timing_when_metrics_disabled(tmp_path: Path) -> None:
+    app = _build_test_app(tmp_path)
+    client = TestClient(app)
+
+    assert "Server-Timing" not in client.get("/api/recovery").headers
+    assert "recovery_stage_seconds" not in client.get("/api/metrics").text
@@ -1,10 +1,14 @@
+import json
 import uuid
 from datetime import date
 from pathlib import Path
 
+from sqlalchemy import text
+
 from app.database import build_engine, build_session_factory
 from app.migrate import run_migrations
 from app.models import Exercise, ExerciseSet, WorkoutSession
+from app.services.data_version import MAPPINGS_DATA_VERSION, bump_data_version
 from app.services.recovery_engine_v0 import compute_recovery_v0
 
 
@@ -75,3 +79,84 @@ def test_recovery_uses_raw_name_fallback_mapping(tmp_path: Path) -> None:
     assert legs["fatigue"] > 0
     assert any(item["raw_name"] == "스쿼트" for item in legs["contributors"])
     assert not any(item["raw_name"] == "스쿼트" for item in result["unmapped_exercises"])
+
+
+def test_fallback_mappings_are_cached_until_mappings_version_changes(tmp_path: Path) -> None:
+    session_factory = _prepare_db(tmp_path)
+    db = session_factory()
+    try:
+        session_row = WorkoutSession(id=uuid.uuid4(), upload_id=None, date=date.today())
+        db.add(session_row)
+        db.flush()
+        exercise_row = Exercise(id=uuid.uuid4(), session_id=session_row.id, raw_name="케이블 플라이", order_index=1)
+        db.add(exercise_row)
+        db.flush()
+        db.add(ExerciseSet(id=uuid.uuid4(), exercise_id=exercise_row.id, set_index=1, weight_kg=15.0, reps=12))
+        db.commit()
+
+        first = compute_recovery_v0(db, days=7)
+        assert any(item["raw_name"] == "케이블 플라이" for item in first["unmapped_exercises"])
+
+        # Map the name through a seed-session exercise, as migration 0006 does.
+        seed_session_id = db.execute(text("SELECT id FROM sessions WHERE date = '1970-01-01' LIMIT 1")).scalar_one()
+        chest_id = db.execute(text("SELECT id FROM muscle_groups WHERE code = 'chest'")).scalar_one()
+        seed_exercise_id = str(uuid.uuid4())
+        db.execute(
+            text("INSERT INTO exercises (id, session_id, raw_name, order_index) VALUES (:id, :session_id, :name, 99)"),
+            {"id": seed_exercise_id, "session_id": seed_session_id, "name": "케이블 플라이"},
+        )
+        db.execute(
+            text("INSERT INTO exercise_muscles (exercise_id, muscle_id, weight) VALUES (:exercise_id, :muscle_id, 1.0)"),
+            {"exercise_id": seed_exercise_id, "muscle_id": chest_id},
+        )
+        db.commit()
+
+        cached = compute_recovery_v0(db, days=7)
+        assert cached["unmapped_exercises"] == first["unmapped_exercises"]
+
+        # New sessions (every parsed upload) do not reload the mappings.
+        bump_data_version(db)
+        db.commit()
+        assert compute_recovery_v0(db, days=7)["unmapped_exercises"] == first["unmapped_exercises"]
+
+        # Mapping writers bump the mappings version in the same transaction.
+        bump_data_version(db, MAPPINGS_DATA_VERSION)
+        db.commit()
+        refreshed = compute_recovery_v0(db, days=7)
+    finally:
+        db.close()
+
+    assert not any(item["raw_name"] == "케이블 플라이" for item in refreshed["unmapped_exercises"])
+    assert refreshed["muscles"]["chest"]["fatigue"] > 0
+
+
+def test_sql_aggregation_matches_python_aggregation(tmp_path: Path) -> None:
+    session_factory = _prepare_db(tmp_path)
+    db = session_factory()
+    try:
+        fixtures = [
+            (date(2026, 2, 7), "바벨 플랫 벤치 프레스", [(80.0, 10), (80.0, 8)]),
+            (date(2026, 2, 7), "스쿼트", [(100.0, 10), (None, 12)]),
+            (date(2026, 2, 5), "풀 업", [(None, 15), (None, 15)]),
+            (date(2026, 2, 3), "UNKNOWN_EXERCISE_XYZ", [(50.0, 10)]),
+            (date(2026, 2, 2), "데드리프트", []),
+            (date(1970, 1, 1), "덤벨 인클라인 벤치 프레스", [(200.0, 50)]),
+        ]
+        for session_date, raw_name, sets in fixtures:
+            session_row = WorkoutSession(id=uuid.uuid4(), upload_id=None, date=session_date)
+            db.add(session_row)
+            db.flush()
+            exercise_row = Exercise(id=uuid.uuid4(), session_id=session_row.id, raw_name=raw_name, order_index=1)
+            db.add(exercise_row)
+            db.flush()
+            for set_index, (weight, reps) in enumerate(sets, start=1):
+                db.add(ExerciseSet(id=uuid.uuid4(), exercise_id=exercise_row.id, set_index=set_index, weight_kg=weight, reps=reps))
+        db.commit()
+
+        python_result = compute_recovery_v0(db, from_dt=date(2026, 2, 1), to_dt=date(2026, 2, 8))
+        sql_result = compute_recovery_v0(db, from_dt=date(2026, 2, 1), to_dt=date(2026, 2, 8), aggregate_in_sql=True)
+    finally:
+        db.close()
+
+    assert python_result["muscles"]["chest"]["fatigue"] > 0
+    assert json.dumps(sql_result, sort_keys=True) == json.dumps(python_result, sort_keys=True)
@@ -0,0 +1,160 @@
+import uuid
+from pathlib import Path
+
+from sqlalchemy import select
+
+from app.database import build_engine, build_session_factory
+from app.migrate import run_migrations
+from app.models import DailyMuscleVolume, DailyUnmappedExercise, Exercise, ExerciseSet, MuscleFatigueState, Upload, WorkoutSession
+from app.services.daily_volume import rebuild_daily_volume
+from app.services.data_version import read_data_version
+from app.services.fatigue_state import check_fatigue_state
+from app.services.parser import parse_fleek_ocr_v1_session
+from app.services.reparse import reparse_uploads
+from app.workers.process_upload import process_upload_job
+
+OCR_TEMPLATE = """
+2026.02.{day:02d}
+238 KCAL 54 min 7402 kg
+1 EXERCISES 4 sets 32 reps 137 kg/min
+
+바벨 플랫 벤치 프레스
+20 40 60 60
+12X 10X 5X {last_reps}X
+"""
+
+
+def _make_db(tmp_path: Path):
+    engine = build_engine(f"sqlite:///{tmp_path / 'reparse.db'}")
+    run_migrations(engine)
+    return f"sqlite:///{tmp_path / 'reparse.db'}", build_session_factory(engine)
+
+
+def _seed_parsed_uploads(tmp_path: Path, database_url: str, session_factory, count: int) -> list:
+    upload_ids = sorted(uuid.uuid4() for _ in range(count))
+    session = session_factory()
+    for day, upload_id in enumerate(upload_ids, start=1):
+        file_path = tmp_path / f"{upload_id}.png"
+        file_path.write_bytes(b"png-bytes")
+        session.add(
+            Upload(
+                id=upload_id,
+                filename="shot.png",
+                original_filename="shot.png",
+                status="pending",
+                storage_path=str(file_path),
+                parser_version="tc04-parser-v1",
+                ocr_text_raw=OCR_TEMPLATE.format(day=day, last_reps=5),
+            )
+        )
+    session.commit()
+    session.close()
+    for upload_id in upload_ids:
+        process_upload_job({"upload_id": str(upload_id), "storage_path": str(tmp_path / f"{upload_id}.png")}, database_url=database_url)
+    return upload_ids
+
+
+def _assert_derived_tables_match_sessions(session_factory) -> None:
+    # Fatigue state and the rollup must equal a full recompute after every committed chunk.
+    db = session_factory()
+    try:
+        # Compare at the newest anchor: by "now" every seeded session has decayed below the tolerance.
+        assert check_fatigue_state(db, at=max(db.execute(select(MuscleFatigueState.anchor_at)).scalars())) == []
+        stored = {(row.date, row.muscle_code, row.raw_name): round(row.volume, 6) for row in db.execute(select(DailyMuscleVolume)).scalars()}
+        stored_unmapped = {(row.date, row.raw_name): row.exercise_count for row in db.execute(select(DailyUnmappedExercise)).scalars()}
+        rebuild_daily_volume(db)
+        db.flush()
+        assert stored == {(row.date, row.muscle_code, row.raw_name): round(row.volume, 6) for row in db.execute(select(DailyMuscleVolume)).scalars()}
+        assert stored_unmapped == {(row.date, row.raw_name): row.exercise_count for row in db.execute(select(DailyUnmappedExercise)).scalars()}
+        db.rollback()
+    finally:
+        db.close()
+
+
+def _session_reps(session, upload_id) -> list:
+    return session.execute(
+        select(ExerciseSet.reps)
+        .join(Exercise, Exercise.id == ExerciseSet.exercise_id)
+        .join(WorkoutSession, WorkoutSession.id == Exercise.session_id)
+        .where(WorkoutSession.upload_id == upload_id)
+        .order_by(ExerciseSet.set_index)
+    ).scalars().all()
+
+
+def test_reparse_dry_run_reports_only_changed_uploads(tmp_path: Path) -> None:
+    database_url, session_factory = _make_db(tmp_path)
+    upload_ids = _seed_parsed_uploads(tmp_path, database_url, session_factory, 3)
+    session = session_factory()
+    session.get(Upload, upload_ids[1]).ocr_text_raw = OCR_TEMPLATE.format(day=2, last_reps=8)
+    session.commit()
+    version_before = read_data_version(session)
+
+    report = reparse_uploads(session, parser_version="tc05-parser-v1", chunk_size=2, dry_run=True)
+
+    assert (report.scanned, report.changed, report.unchanged) == (3, 1, 2)
+    assert [diff[0] for diff in report.diffs] == [str(upload_ids[1])]
+    session.expire_all()
+    assert _session_reps(session, upload_ids[1]) == [12, 10, 5, 5]
+    assert read_data_version(session) == version_before
+    session.close()
+
+
+def test_reparse_replaces_sessions_and_resumes_after_checkpoint(tmp_path: Path) -> None:
+    database_url, session_factory = _make_db(tmp_path)
+    upload_ids = _seed_parsed_uploads(tmp_path, database_url, session_factory, 3)
+    session = session_factory()
+    for day, upload_id in enumerate(upload_ids, start=1):
+        session.get(Upload, upload_id).ocr_text_raw = OCR_TEMPLATE.format(day=day, last_reps=8)
+    session.get(Upload, upload_ids[2]).ocr_text_raw = "garbled"
+    session.commit()
+
+    checkpoints = []
+    report = reparse_uploads(
+        session,
+        parser_version="tc05-parser-v1",
+        chunk_size=1,
+        start_after=upload_ids[0],
+        on_chunk_committed=lambda progress: (checkpoints.append(progress.last_upload_id), _assert_derived_tables_match_sessions(session_factory)),
+    )
+
+    assert (report.scanned, report.changed, report.failed) == (2, 1, 1)
+    assert checkpoints == [str(upload_ids[1]), str(upload_ids[2])]
+    session.expire_all()
+    assert _session_reps(session, upload_ids[0]) == [12, 10, 5, 5]
+    assert _session_reps(session, upload_ids[1]) == [12, 10, 5, 8]
+    assert _session_reps(session, upload_ids[2]) == []
+    failed = session.get(Upload, upload_ids[2])
+    assert (failed.status, failed.parser_version) == ("failed", "tc05-parser-v1")
+    assert failed.error_message.startswith("needs review")
+    assert session.get(Upload, upload_ids[0]).parser_version == "tc04-parser-v1"
+    assert check_fatigue_state(session) == []
+    session.close()
+
+
+def test_reparse_skips_in_flight_uploads_and_records_parser_crashes(tmp_path: Path, monkeypatch) -> None:
+    database_url, session_factory = _make_db(tmp_path)
+    upload_ids = _seed_parsed_uploads(tmp_path, database_url, session_factory, 3)
+    session = session_factory()
+    session.get(Upload, upload_ids[1]).status = "processing"
+    session.get(Upload, upload_ids[2]).ocr_text_raw = "crash"
+    session.commit()
+    session.close()
+
+    def crashing_parser(text: str):
+        if text == "crash":
+            raise RuntimeError("parser_exploded")
+        return parse_fleek_ocr_v1_session(text)
+
+    monkeypatch.setattr("app.services.reparse.parse_fleek_ocr_v1_session", crashing_parser)
+    session = session_factory()
+    report = reparse_uploads(session, parser_version="tc05-parser-v1")
+
+    assert (report.scanned, report.unchanged, report.failed) == (2, 1, 1)
+    crashed = session.get(Upload, upload_ids[2])
+    assert (crashed.status, crashed.error_message) == ("failed", "parser_exploded")
+    in_flight = session.get(Upload, upload_ids[1])
+    assert (in_flight.status, in_flight.parser_version) == ("processing", "tc04-parser-v1")
+
+    report = reparse_uploads(session, parser_version="tc05-parser-v1", statuses=["processing"], dry_run=True)
+    assert report.scanned == 1
+    session.close()
@@ -3,6 +3,7 @@ from datetime import date
 from pathlib import Path
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
 from app.main import create_app
 from app.models import Exercise, ExerciseSet, WorkoutSession
@@ -19,7 +20,14 @@ def _build_test_app(tmp_path: Path):
     return app
 
 
-def _seed_session(app, session_date: date, calories: int, duration: int, volume: int) -> uuid.UUID:
+def _seed_session(
+    app,
+    session_date: date,
+    calories: int,
+    duration: int,
+    volume: int,
+    exercise_count: int = 1,
+) -> uuid.UUID:
     session_factory = app.state.session_factory
     db = session_factory()
     try:
@@ -34,24 +42,25 @@ def _seed_session(app, session_date: date, calories: int, duration: int, volume:
         db.add(session_row)
         db.flush()
 
-        exercise = Exercise(
-            id=uuid.uuid4(),
-            session_id=session_row.id,
-            raw_name="바벨 플랫 벤치 프레스",
-            order_index=1,
-        )
-        db.add(exercise)
-        db.flush()
-
-        db.add(
-            ExerciseSet(
+        for order_index in range(1, exercise_count + 1):
+            exercise = Exercise(
                 id=uuid.uuid4(),
-                exercise_id=exercise.id,
-                set_index=1,
-                weight_kg=20.0,
-                reps=12,
+                session_id=session_row.id,
+                raw_name="바벨 플랫 벤치 프레스",
+                order_index=order_index,
+            )
+            db.add(exercise)
+            db.flush()
+
+            db.add(
+                ExerciseSet(
+                    id=uuid.uuid4(),
+                    exercise_id=exercise.id,
+                    set_index=1,
+                    weight_kg=20.0,
+                    reps=12,
+                )
             )
-        )
         db.commit()
         return session_row.id
     finally:
@@ -91,3 +100,27 @@ def test_get_session_detail_includes_exercises_and_sets(tmp_path: Path) -> None:
     assert payload["exercises"][0]["sets"][0]["set_index"] == 1
     assert payload["exercises"][0]["sets"][0]["weight_kg"] == 20.0
     assert payload["exercises"][0]["sets"][0]["reps"] == 12
+
+
+def test_get_session_detail_query_count_is_constant(tmp_path: Path) -> None:
+    app = _build_test_app(tmp_path)
+    client = TestClient(app)
+    session_id = _seed_session(app, date(2026, 2, 7), 238, 54, 7402, exercise_count=12)
+
+    statements = []
+    engine = app.state.session_factory.kw["bind"]
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        response = client.get(f"/api/sessions/{session_id}")
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert response.status_code == 200
+    assert len(response.json()["exercises"]) == 12
+    assert all(len(exercise["sets"]) == 1 for exercise in response.json()["exercises"])
+    # session row, exercises, sets
+    assert len(statements) == 3
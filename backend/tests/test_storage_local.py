@@ -0,0 +1,43 @@
+import hashlib
+import io
+from pathlib import Path
+
+import pytest
+
+from app.storage import LocalStorageBackend, UploadTooLargeError
+
+
+def test_save_stream_writes_file_with_size_and_hash(tmp_path: Path) -> None:
+    backend = LocalStorageBackend(str(tmp_path))
+    body = b"fake-image-bytes" * 1000
+
+    stored = backend.save_stream("upload-1", "shot.PNG", io.BytesIO(body), chunk_size=1024)
+
+    assert Path(stored.path) == tmp_path.resolve() / "upload-1.PNG"
+    assert Path(stored.path).read_bytes() == body
+    assert stored.size_bytes == len(body)
+    assert stored.sha256 == hashlib.sha256(body).hexdigest()
+    assert [p.name for p in tmp_path.iterdir()] == ["upload-1.PNG"]
+
+
+def test_save_stream_rejects_oversized_body_and_cleans_up(tmp_path: Path) -> None:
+    backend = LocalStorageBackend(str(tmp_path))
+
+    with pytest.raises(UploadTooLargeError):
+        backend.save_stream("upload-2", "shot.png", io.BytesIO(b"x" * 5000), max_bytes=4096, chunk_size=1024)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_staged_file_can_be_discarded_or_promoted(tmp_path: Path) -> None:
+    backend = LocalStorageBackend(str(tmp_path))
+
+    discarded = backend.stage_stream("upload-3", io.BytesIO(b"dup"))
+    backend.discard(discarded)
+    assert list(tmp_path.iterdir()) == []
+
+    staged = backend.stage_stream("upload-4", io.BytesIO(b"new"))
+    assert staged.sha256 == hashlib.sha256(b"new").hexdigest()
+    path = backend.promote(staged, "upload-4", "shot.png")
+    assert [p.name for p in tmp_path.iterdir()] == ["upload-4.png"]
+    assert Path(path).read_bytes() == b"new"
@@ -1,9 +1,14 @@
+import asyncio
+import hashlib
 import uuid
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
 from app.main import create_app
+from app.models import Upload
 
 
 def test_upload_create_list_get_and_enqueue_payload(tmp_path: Path) -> None:
@@ -54,3 +59,258 @@ def test_upload_create_list_get_and_enqueue_payload(tmp_path: Path) -> None:
     get_response = client.get(f"/api/uploads/{upload_id}")
     assert get_response.status_code == 200
     assert get_response.json()["id"] == upload_id
+
+
+def test_upload_over_size_limit_is_rejected(tmp_path: Path) -> None:
+    upload_dir = tmp_path / "uploads"
+    app = create_app(
+        database_url=f"sqlite:///{tmp_path / 'upload_limit_test.db'}",
+        enqueue_func=lambda _: "job-test",
+        upload_dir=str(upload_dir),
+        auto_migrate=True,
+        max_upload_bytes=1024,
+    )
+    client = TestClient(app)
+
+    response = client.post("/api/uploads", files={"file": ("big.png", b"x" * 2048, "image/png")})
+    assert response.status_code == 413
+    assert response.json()["detail"] == "upload_too_large"
+    assert list(upload_dir.iterdir()) == []
+
+    declared = client.post("/api/uploads", files={"file": ("huge.png", b"x" * (128 * 1024), "image/png")})
+    assert declared.status_code == 413
+    assert client.get("/api/uploads").json() == []
+
+
+def test_upload_blocking_work_runs_off_the_event_loop(tmp_path: Path) -> None:
+    def _on_event_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    seen = {}
+
+    def fake_enqueue(payload: dict) -> str:
+        seen["enqueue_on_loop"] = _on_event_loop()
+        return "job-test-1"
+
+    app = create_app(
+        database_url=f"sqlite:///{tmp_path / 'upload_thread.db'}",
+        enqueue_func=fake_enqueue,
+        upload_dir=str(tmp_path / "uploads"),
+        auto_migrate=True,
+    )
+    client = TestClient(app)
+
+    response = client.post("/api/uploads", files={"file": ("test.png", b"fake-image-bytes", "image/png")})
+    assert response.status_code == 201
+    assert seen == {"enqueue_on_loop": False}
+
+
+def test_duplicate_upload_returns_existing_row_without_enqueue(tmp_path: Path) -> None:
+    enqueued = []
+
+    def fake_enqueue(payload: dict) -> str:
+        enqueued.append(payload)
+        return f"job-test-{len(enqueued)}"
+
+    upload_dir = tmp_path / "uploads"
+    app = create_app(
+        database_url=f"sqlite:///{tmp_path / 'upload_dedupe.db'}",
+        enqueue_func=fake_enqueue,
+        upload_dir=str(upload_dir),
+        auto_migrate=True,
+    )
+    client = TestClient(app)
+
+    first = client.post("/api/uploads", files={"file": ("first.png", b"same-bytes", "image/png")})
+    again = client.post("/api/uploads", files={"file": ("renamed.png", b"same-bytes", "image/png")})
+    other = client.post("/api/uploads", files={"file": ("other.png", b"other-bytes", "image/png")})
+
+    assert first.status_code == 201
+    assert again.status_code == 200
+    assert again.json() == first.json()
+    assert first.json()["content_sha256"] == hashlib.sha256(b"same-bytes").hexdigest()
+    assert other.status_code == 201
+    assert len(enqueued) == 2
+    assert len(client.get("/api/uploads").json()) == 2
+    assert sorted(p.name for p in upload_dir.iterdir()) == sorted(
+        Path(body["storage_path"]).name for body in (first.json(), other.json())
+    )
+
+
+def test_upload_list_pages_by_cursor_with_status_filter_and_fields(tmp_path: Path) -> None:
+    app = create_app(
+        database_url=f"sqlite:///{tmp_path / 'upload_pages.db'}",
+        enqueue_func=lambda _: "job-test",
+        upload_dir=str(tmp_path / "uploads"),
+        auto_migrate=True,
+    )
+    client = TestClient(app)
+    created_ids = [
+        client.post("/api/uploads", files={"file": (f"shot-{i}.png", f"bytes-{i}".encode(), "image/png")}).json()["id"]
+        for i in range(5)
+    ]
+    db = app.state.session_factory()
+    try:
+        db.get(Upload, uuid.UUID(created_ids[0])).status = "failed"
+        db.commit()
+    finally:
+        db.close()
+
+    statements = []
+    event.listen(
+        app.state.session_factory.kw["bind"],
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/uploads", params=params)
+        assert response.status_code == 200
+        seen.extend(row["id"] for row in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert seen == list(reversed(created_ids))
+    assert not any("ocr_text_raw" in statement for statement in statements)
+
+    failed = client.get("/api/uploads", params={"status": "failed", "fields": "id,status"})
+    assert failed.json() == [{"id": created_ids[0], "status": "failed"}]
+    assert client.get("/api/uploads", params={"status": "bogus"}).status_code == 422
+    assert client.get("/api/uploads", params={"fields": "ocr_text_raw"}).status_code == 400
+    assert client.get("/api/uploads", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_duplicate_of_unqueued_or_failed_upload_is_enqueued_again(tmp_path: Path) -> None:
+    enqueued = []
+
+    def flaky_enqueue(payload: dict) -> str:
+        if not enqueued:
+            enqueued.append(None)
+            raise ConnectionError("redis down")
+        enqueued.append(payload)
+        return f"job-{len(enqueued)}"
+
+    batches = []
+
+    def fake_enqueue_many(payloads: list) -> list:
+        batches.append(payloads)
+        return [f"batch-job-{i}" for i in range(len(payloads))]
+
+    app = create_app(
+        database_url=f"sqlite:///{tmp_path / 'upload_requeue.db'}",
+        enqueue_func=flaky_enqueue,
+        enqueue_many_func=fake_enqueue_many,
+        upload_dir=str(tmp_path / "uploads"),
+        auto_migrate=True,
+    )
+    client = TestClient(app, raise_server_exceptions=False)
+
+    assert client.post("/api/uploads", files={"file": ("a.png", b"same-bytes", "image/png")}).status_code == 500
+    stuck = client.get("/api/uploads").json()[0]
+    assert (stuck["status"], stuck["queue_job_id"]) == ("pending", None)
+
+    retried = client.post("/api/uploads", files={"file": ("a.png", b"same-bytes", "image/png")})
+    assert retried.status_code == 200
+    assert retried.json()["id"] == stuck["id"]
+    assert retried.json()["queue_job_id"] == "job-2"
+    assert enqueued[1]["upload_id"] == stuck["id"]
+
+    # Queued rows are returned as-is; failed rows go back to pending with a new job.
+    again = client.post("/api/uploads", files={"file": ("a.png", b"same-bytes", "image/png")})
+    assert again.json()["queue_job_id"] == "job-2"
+    db = app.state.session_factory()
+    try:
+        db.get(Upload, uuid.UUID(stuck["id"])).status = "failed"
+        db.commit()
+    finally:
+        db.close()
+    results = client.post("/api/uploads/batch", files=[("files", ("a.png", b"same-bytes", "image/png"))]).json()
+    assert results[0]["status"] == "duplicate"
+    assert (results[0]["upload"]["status"], results[0]["upload"]["queue_job_id"]) == ("pending", "batch-job-0")
+    assert [[p["upload_id"] for p in batch] for batch in batches] == [[stuck["id"]]]
+    assert len(enqueued) == 2
+
+
+def test_batch_upload_stores_all_files_and_enqueues_once(tmp_path: Path) -> None:
+    batches = []
+
+    def fake_enqueue_many(payloads: list) -> list:
+        batches.append(payloads)
+        return [f"job-{i}" for i in range(len(payloads))]
+
+    app = create_app(
+        database_url=f"sqlite:///{tmp_path / 'upload_batch.db'}",
+        enqueue_func=lambda _: "job-single",
+        enqueue_many_func=fake_enqueue_many,
+        upload_dir=str(tmp_path / "uploads"),
+        auto_migrate=True,
+        max_upload_bytes=1024,
+    )
+    client = TestClient(app)
+    existing = client.post("/api/uploads", files={"file": ("old.png", b"old-bytes", "image/png")}).json()
+
+    files = [
+        ("files", ("a.png", b"a-bytes", "image/png")),
+        ("files", ("old-again.png", b"old-bytes", "image/png")),
+        ("files", ("b.png", b"b-bytes", "image/png")),
+        ("files", ("a-again.png", b"a-bytes", "image/png")),
+        ("files", ("big.png", b"x" * 2048, "image/png")),
+    ]
+    response = client.post("/api/uploads/batch", files=files)
+    assert response.status_code == 200
+    results = response.json()
+
+    assert [r["status"] for r in results] == ["created", "duplicate", "created", "duplicate", "rejected"]
+    assert results[1]["upload"]["id"] == existing["id"]
+    assert results[3]["upload"]["id"] == results[0]["upload"]["id"]
+    assert results[4]["detail"] == "upload_too_large"
+    assert [r["upload"]["queue_job_id"] for r in (results[0], results[2])] == ["job-0", "job-1"]
+    assert len(batches) == 1
+    assert [p["upload_id"] for p in batches[0]] == [results[0]["upload"]["id"], results[2]["upload"]["id"]]
+    assert len(client.get("/api/uploads").json()) == 3
+
+
+def test_duplicate_during_first_enqueue_is_not_enqueued_twice(tmp_path: Path) -> None:
+    enqueued = []
+    concurrent = []
+
+    def enqueue_with_concurrent_duplicate(payload: dict) -> str:
+        # The row is committed but has no job id yet; the same bytes arrive from another client.
+        if not concurrent:
+            concurrent.append(client.post("/api/uploads", files={"file": ("b.png", b"same-bytes", "image/png")}))
+        enqueued.append(payload)
+        return f"job-{len(enqueued)}"
+
+    app = create_app(
+        database_url=f"sqlite:///{tmp_path / 'upload_claim.db'}",
+        enqueue_func=enqueue_with_concurrent_duplicate,
+        upload_dir=str(tmp_path / "uploads"),
+        auto_migrate=True,
+    )
+    client = TestClient(app)
+
+    first = client.post("/api/uploads", files={"file": ("a.png", b"same-bytes", "image/png")})
+    assert first.status_code == 201
+    assert concurrent[0].status_code == 200
+    assert concurrent[0].json()["queue_job_id"] == "requeue-claimed"
+    assert [payload["upload_id"] for payload in enqueued] == [first.json()["id"]]
+
+    # A claim whose request died before enqueueing expires and can be picked up again.
+    db = app.state.session_factory()
+    try:
+        upload = db.get(Upload, uuid.UUID(first.json()["id"]))
+        upload.queue_job_id = "requeue-claimed"
+        upload.updated_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        db.commit()
+    finally:
+        db.close()
+    retried = client.post("/api/uploads", files={"file": ("a.png", b"same-bytes", "image/png")})
+    assert retried.json()["queue_job_id"] == "job-2"
+    assert len(enqueued) == 2
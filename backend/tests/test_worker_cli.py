@@ -0,0 +1,71 @@
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+
+from app.database import build_engine, build_session_factory, dispose_engines
+from app.migrate import run_migrations
+from app.models import Upload
+from app.queue_client import UPLOAD_JOB_FUNC
+from app.worker_cli import run_batch_once
+
+
+def test_batch_worker_runs_uploads_together_and_other_jobs_alone(tmp_path: Path, monkeypatch) -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    from rq import Queue
+    from rq.job import JobStatus
+
+    database_url = f"sqlite:///{tmp_path / 'batch_worker.db'}"
+    engine = build_engine(database_url)
+    run_migrations(engine)
+    session = build_session_factory(engine)()
+    upload_id = uuid.uuid4()
+    file_path = tmp_path / f"{upload_id}.png"
+    file_path.write_bytes(b"png-bytes")
+    session.add(
+        Upload(
+            id=upload_id,
+            filename="batch.png",
+            status="pending",
+            storage_path=str(file_path),
+            parser_version="tc04-parser-v1",
+            ocr_text_raw="""
+2026.02.07
+200 KCAL 40 min 3000 kg
+1 EXERCISES 2 sets 20 reps 75 kg/min
+스쿼트
+20 40
+10X 10X
+""",
+        )
+    )
+    session.commit()
+    session.close()
+    engine.dispose()
+    monkeypatch.setenv("DATABASE_URL", database_url)
+
+    queue = Queue("uploads", connection=fakeredis.FakeStrictRedis())
+    upload_job = queue.enqueue(UPLOAD_JOB_FUNC, {"upload_id": str(upload_id), "storage_path": str(file_path)})
+    missing_job = queue.enqueue(UPLOAD_JOB_FUNC, {"upload_id": str(uuid.uuid4()), "storage_path": ""})
+    other_job = queue.enqueue("math.sqrt", 16)
+
+    try:
+        assert run_batch_once(queue, batch_size=8, poll_timeout=1, worker_name="batch-test") == 3
+    finally:
+        dispose_engines()
+
+    for job in (upload_job, missing_job, other_job):
+        job.refresh()
+    assert upload_job.get_status() == JobStatus.FINISHED
+    assert upload_job.return_value() == {"upload_id": str(upload_id), "status": "parsed"}
+    assert missing_job.get_status() == JobStatus.FAILED
+    assert "upload_not_found" in missing_job.latest_result().exc_string
+    assert other_job.get_status() == JobStatus.FINISHED
+    assert other_job.return_value() == 4.0
+    assert queue.started_job_registry.count == 0
+    assert queue.count == 0
+
+    session = build_session_factory(build_engine(database_url))()
+    assert session.execute(select(Upload.status).where(Upload.id == upload_id)).scalar_one() == "parsed"
+    session.close()
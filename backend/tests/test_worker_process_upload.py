@@ -1,12 +1,15 @@
 import uuid
 from pathlib import Path
 
+import pytest
 from sqlalchemy import select
 
 from app.database import build_engine, build_session_factory
 from app.migrate import run_migrations
-from app.models import Exercise, ExerciseSet, Upload, WorkoutSession
-from app.workers.process_upload import process_upload_job
+from app.models import Exercise, ExerciseSet, Upload, UploadJobStat, WorkoutSession
+from app.services.data_version import read_data_version
+from app.services.job_stats import summarize_upload_job_stats
+from app.workers.process_upload import process_upload_batch, process_upload_job
 
 
 def _make_db(tmp_path: Path):
@@ -157,3 +160,141 @@ MAX Weight: 60kg | 1RM: 81kg
     assert [float(row.weight_kg) for row in set_rows] == [20.0, 40.0, 60.0, 60.0]
     assert [row.reps for row in set_rows] == [12, 10, 5, 5]
     session.close()
+
+
+def test_worker_batch_isolates_failing_upload_in_savepoint(tmp_path: Path) -> None:
+    database_url, session_factory = _make_db(tmp_path)
+    upload_dir = tmp_path / "uploads"
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    ocr_template = """
+{date}
+238 KCAL 54 min 7402 kg
+1 EXERCISES 4 sets 32 reps 137 kg/min
+
+바벨 플랫 벤치 프레스
+20 40 60 60
+12X 10X 5X 5X
+"""
+
+    payloads = []
+    session = session_factory()
+    for name, session_date, write_file in (
+        ("good", "2026.02.07", True),
+        ("bad-date", "2026.02.30", True),
+        ("missing-file", "2026.02.08", False),
+    ):
+        upload_id = uuid.uuid4()
+        file_path = upload_dir / f"{upload_id}.png"
+        if write_file:
+            file_path.write_bytes(b"png-bytes")
+        session.add(
+            Upload(
+                id=upload_id,
+                filename=f"{name}.png",
+                original_filename=f"{name}.png",
+                status="pending",
+                storage_path=str(file_path),
+                parser_version="tc04-parser-v1",
+                ocr_text_raw=ocr_template.format(date=session_date),
+            )
+        )
+        payloads.append({"upload_id": str(upload_id), "storage_path": str(file_path), "parser_version": "tc04-parser-v1"})
+    session.commit()
+    session.close()
+    payloads.append({"upload_id": str(uuid.uuid4()), "storage_path": "", "parser_version": "tc04-parser-v1"})
+
+    results = process_upload_batch(payloads, database_url=database_url)
+
+    assert [result["status"] for result in results] == ["parsed", "failed", "failed", "failed"]
+    assert "error" not in results[0]
+    assert results[1]["error"].startswith("day is out of range")
+    assert results[3]["error"] == "upload_not_found"
+
+    session = session_factory()
+    statuses = {row.filename: (row.status, row.error_message) for row in session.execute(select(Upload)).scalars()}
+    assert statuses["good.png"] == ("parsed", None)
+    assert statuses["bad-date.png"][0] == "failed"
+    assert statuses["missing-file.png"] == ("failed", "file not found")
+    session_rows = session.execute(select(WorkoutSession).where(WorkoutSession.upload_id.is_not(None))).scalars().all()
+    assert [str(row.upload_id) for row in session_rows] == [payloads[0]["upload_id"]]
+    assert read_data_version(session) == 1
+
+    # Every loaded upload leaves a stats row; batch-wide load/commit time is split across the batch.
+    stats = {str(row.upload_id): row for row in session.execute(select(UploadJobStat)).scalars()}
+    assert set(stats) == {payload["upload_id"] for payload in payloads[:3]}
+    good = stats[payloads[0]["upload_id"]]
+    assert (good.status, good.batch_size, good.exercise_count, good.set_count, good.line_count) == ("parsed", 3, 1, 4, 6)
+    assert good.confidence == 1.0
+    assert all(getattr(good, f"{stage}_ms") > 0 for stage in ("load_upload", "file_check", "parse", "persist", "commit"))
+    missing = stats[payloads[2]["upload_id"]]
+    assert (missing.status, missing.parse_ms, missing.persist_ms) == ("failed", None, None)
+
+    [summary] = summarize_upload_job_stats(session)
+    assert (summary["parser_version"], summary["jobs"], summary["parsed"], summary["failed"]) == ("tc04-parser-v1", 3, 1, 2)
+    assert summary["jobs_per_sec"] == pytest.approx(3 / (sum(row.total_ms for row in stats.values()) / 1000.0))
+    assert summary["stages"]["parse"]["count"] == 2
+    assert summary["stages"]["persist"]["p50_ms"] <= summary["stages"]["persist"]["p95_ms"]
+    session.close()
+
+
+def test_worker_batch_marks_uploads_failed_when_batch_transaction_fails(tmp_path: Path, monkeypatch) -> None:
+    database_url, session_factory = _make_db(tmp_path)
+    upload_id = uuid.uuid4()
+    file_path = tmp_path / f"{upload_id}.png"
+    file_path.write_bytes(b"png-bytes")
+    session = session_factory()
+    session.add(
+        Upload(
+            id=upload_id,
+            filename="batch.png",
+            status="pending",
+            storage_path=str(file_path),
+            parser_version="tc04-parser-v1",
+            ocr_text_raw="2026.02.07\n200 KCAL 40 min 3000 kg\n1 EXERCISES 2 sets 20 reps 75 kg/min\n스쿼트\n20 40\n10X 10X\n",
+        )
+    )
+    session.commit()
+    session.close()
+
+    def broken_bump(session) -> None:
+        raise RuntimeError("data_version_unavailable")
+
+    monkeypatch.setattr("app.workers.process_upload.bump_data_version", broken_bump)
+    with pytest.raises(RuntimeError):
+        process_upload_batch([{"upload_id": str(upload_id), "storage_path": str(file_path)}], database_url=database_url)
+
+    session = session_factory()
+    row = session.execute(select(Upload).where(Upload.id == upload_id)).scalar_one()
+    assert (row.status, row.error_message) == ("failed", "data_version_unavailable")
+    session.close()
+
+
+def test_worker_skips_uploads_that_are_already_parsed(tmp_path: Path) -> None:
+    database_url, session_factory = _make_db(tmp_path)
+    upload_id = uuid.uuid4()
+    file_path = tmp_path / f"{upload_id}.png"
+    file_path.write_bytes(b"png-bytes")
+    session = session_factory()
+    session.add(
+        Upload(
+            id=upload_id,
+            filename="dup.png",
+            status="pending",
+            storage_path=str(file_path),
+            parser_version="tc04-parser-v1",
+            ocr_text_raw="2026.02.07\n200 KCAL 40 min 3000 kg\n1 EXERCISES 2 sets 20 reps 75 kg/min\n스쿼트\n20 40\n10X 10X\n",
+        )
+    )
+    session.commit()
+    session.close()
+    payload = {"upload_id": str(upload_id), "storage_path": str(file_path)}
+
+    results = process_upload_batch([payload, payload], database_url=database_url)
+    assert [result["status"] for result in results] == ["parsed", "skipped"]
+    assert process_upload_job(payload, database_url=database_url) == {"upload_id": str(upload_id), "status": "parsed"}
+    assert process_upload_batch([payload], database_url=database_url)[0]["status"] == "parsed"
+
+    session = session_factory()
+    assert len(session.execute(select(WorkoutSession).where(WorkoutSession.upload_id == upload_id)).scalars().all()) == 1
+    assert len(session.execute(select(UploadJobStat)).scalars().all()) == 1
+    session.close()